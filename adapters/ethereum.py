@@ -4,22 +4,75 @@ Implements unified interface for Ethereum smart contract analysis,
 including proxy resolution and robust verification checks.
 """
 
+import copy
+import re
 import time
+import threading
 import requests
 import logging
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
+from urllib.parse import urlencode
+
+import orjson
+from cachetools import TTLCache, cached
 
 from config import (
     get_chain_config,
     get_explorer_url,
     API_TIMEOUT,
     API_RETRIES,
+    CACHE_TTL_SECONDS,
     REQUEST_DELAY,
+    MAX_CONCURRENT_PER_HOST,
+    TECH_FACTS_CACHE_SIZE,
+    VERIFICATION_CACHE_SIZE,
+    VERIFICATION_CACHE_TTL,
     assert_read_only
 )
+from utils.cache import PersistentTTLCache
+from utils.http import backoff_delay, get_session, parse_json, host_semaphore, record_rate_limit, wait_for_rate_limit
+
+# Verification status is effectively immutable for an address, so successful
+# lookups are shared across get_tech_facts calls and restarts. Failures raise and are not cached.
+_etherscan_cache = PersistentTTLCache("etherscan_source", maxsize=VERIFICATION_CACHE_SIZE, ttl=VERIFICATION_CACHE_TTL)
+_sourcify_cache = PersistentTTLCache("sourcify", maxsize=VERIFICATION_CACHE_SIZE, ttl=VERIFICATION_CACHE_TTL)
+_cache_lock = threading.Lock()
+
+# Complete TechFacts per (address, network), so repeat lookups within a run skip
+# the Etherscan/Sourcify round-trips. In memory only; error results are not cached.
+_facts_cache = TTLCache(maxsize=TECH_FACTS_CACHE_SIZE, ttl=CACHE_TTL_SECONDS)
+
+# getsourcecode fields retained after parsing (SourceCode is reduced to a bool,
+# ABI to its governance flags)
+_ETHERSCAN_FIELDS = ("ContractName", "Proxy", "Implementation")
+
+# Addresses per Sourcify check-by-addresses request in batch scans
+_SOURCIFY_BATCH_SIZE = 50
+
+_ETH_ADDRESS_RE = re.compile(r"\A0x[0-9a-fA-F]{40}\Z")
+
+# Etherscan's message for addresses it has no record of
+_NO_DATA_MESSAGE = "no data found"
 
-# Setup logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+class ContractNotFound(Exception):
+    """Raised when Etherscan definitively reports that no contract exists at an address."""
+
+
+def _is_no_data(data: Dict[str, Any]) -> bool:
+    """Whether an error response's message or (string) result is Etherscan's no-data text."""
+    result = data.get("result")
+    return (str(data.get("message", "")).strip().lower() == _NO_DATA_MESSAGE
+            or (isinstance(result, str) and result.strip().lower() == _NO_DATA_MESSAGE))
+
+def _verification_key(address: str, network: str):
+    return (address.lower(), network)
+
+def _preview(data: Any, limit: int = 200) -> str:
+    """Truncated repr of a payload for log lines."""
+    text = repr(data)
+    return text if len(text) <= limit else f"{text[:limit]}..."
 
 def _make_request_with_retries(url: str, params: Dict = None, timeout: int = API_TIMEOUT) -> Dict[str, Any]:
     """Make HTTP request with retry logic and backoff."""
@@ -27,11 +80,15 @@ def _make_request_with_retries(url: str, params: Dict = None, timeout: int = API
     last_exception = None
     for attempt in range(API_RETRIES + 1):
         try:
-            time.sleep(REQUEST_DELAY * attempt)  # Exponential backoff
-            response = requests.get(url, params=params, timeout=timeout)
+            if attempt > 0:
+                time.sleep(backoff_delay(attempt, REQUEST_DELAY))  # Exponential backoff with jitter
+            wait_for_rate_limit(url)  # Retry-After / exhausted quota from earlier responses
+            with host_semaphore(url):
+                response = get_session().get(url, params=params, timeout=timeout)
+            record_rate_limit(url, response)
             
             if response.status_code in [403, 429]:
-                logging.warning(f"Etherscan API rate limit hit (status {response.status_code}). Retrying...")
+                logging.warning("Etherscan API rate limit hit (status %s). Retrying...", response.status_code)
                 if attempt < API_RETRIES:
                     continue
                 else:
@@ -39,13 +96,24 @@ def _make_request_with_retries(url: str, params: Dict = None, timeout: int = API
                     response.raise_for_status()
 
             response.raise_for_status()
-            return response.json()
+            return parse_json(response)
         except requests.RequestException as e:
             last_exception = e
     raise last_exception
 
-def _get_etherscan_source(address: str, network: str) -> Dict[str, Any]:
-    """Fetch source code and ABI from Etherscan, handling proxies."""
+@cached(_etherscan_cache, key=_verification_key, lock=_cache_lock)
+def _fetch_etherscan_source(address: str, network: str) -> Dict[str, Any]:
+    """Fetch the getsourcecode entry for a single address (no proxy resolution).
+
+    Returns only Proxy, Implementation and ContractName, with SourceCode
+    reduced to a bool indicating whether verified source exists and ABI
+    reduced to its governance flags (AbiFlags).
+
+    Raises:
+        ContractNotFound: If Etherscan has no record of the address.
+        requests.exceptions.RequestException: If Etherscan returns no data,
+            so that transient failures are never cached.
+    """
     config = get_chain_config("ethereum", network)
     
     # Use Etherscan API V2 format: https://api.etherscan.io/v2/api?chainid=1&module=...
@@ -60,49 +128,95 @@ def _get_etherscan_source(address: str, network: str) -> Dict[str, Any]:
         "apikey": config["etherscan_key"]
     }
     
-    # Log the request URL without the API key for security
-    params_for_logging = params.copy()
-    params_for_logging["apikey"] = "REDACTED"
-    request_url_for_logging = requests.Request('GET', config["etherscan_api"], params=params_for_logging).prepare().url
-    logging.info(f"Querying Etherscan for address: {address} | URL: {request_url_for_logging}")
+    logging.info("Querying Etherscan for address: %s", address)
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        # Log the request URL without the API key for security
+        logging.debug("Etherscan request URL: %s?%s", config["etherscan_api"],
+                      urlencode({**params, "apikey": "REDACTED"}))
 
     data = _make_request_with_retries(config["etherscan_api"], params)
-    logging.info(f"Etherscan raw response for {address}: {data}")
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug("Etherscan raw response for %s: %s", address, _preview(data))
     
+    if data.get("status") == "0" and _is_no_data(data):
+        raise ContractNotFound(f"No contract found at {address}")
     if data.get("status") == "0" or not data.get("result"):
-        logging.warning(f"Etherscan returned no data for {address}. Message: {data.get('message')}, Result: {data.get('result')}")
-        return {}
+        logging.warning("Etherscan returned no data for %s. Message: %s, Result: %s",
+                        address, data.get('message'), _preview(data.get('result')))
+        raise requests.exceptions.RequestException(f"Etherscan returned no data for {address}: {data.get('message')}")
 
+    # Keep only what the scorer uses; SourceCode and ABI can be hundreds of KB
+    # and would otherwise live on in the verification cache.
     source_info = data["result"][0]
+    slim_info = {field: source_info.get(field, "") for field in _ETHERSCAN_FIELDS}
+    slim_info["SourceCode"] = bool(source_info.get("SourceCode"))
+    slim_info["AbiFlags"] = _analyze_abi_for_flags(source_info.get("ABI"))
+    return slim_info
+
+def _get_etherscan_source(address: str, network: str) -> Dict[str, Any]:
+    """Fetch source code and ABI from Etherscan, handling proxies."""
+    source_info = _fetch_etherscan_source(address, network)
     
     # Handle proxy contracts
     if source_info.get("Proxy") == "1" and source_info.get("Implementation"):
         impl_address = source_info["Implementation"]
-        logging.info(f"Proxy contract detected. Hopping from {address} to implementation {impl_address}")
+        logging.info("Proxy contract detected. Hopping from %s to implementation %s", address, impl_address)
         return _get_etherscan_source(impl_address, network)
         
     return source_info
 
-def _check_sourcify_verification(address: str, network: str) -> bool:
-    """Check Sourcify for full or partial contract verification."""
+def _sourcify_statuses(addresses: List[str], network: str) -> Dict[str, bool]:
+    """Query Sourcify for several addresses in one call; raises on request failure."""
     # Hedera network IDs for Sourcify: testnet=296, mainnet=295. Ethereum: mainnet=1, testnet=5.
     # The original code used '1' for mainnet and '5' for testnet, which is correct for Ethereum.
     network_id = "1" if network == "mainnet" else "5"
+    config = get_chain_config("ethereum", network)
+    url = f"{config['sourcify_api']}/check-by-addresses"
+    addresses = [address.lower() for address in addresses]
+    params = {"addresses": ",".join(addresses), "chainIds": network_id}
+
+    logging.info("Querying Sourcify for %d address(es): %s", len(addresses), _preview(params["addresses"]))
+    with host_semaphore(url):
+        response = get_session().get(url, params=params, timeout=API_TIMEOUT)
+    response.raise_for_status()
+
+    statuses = {address: False for address in addresses}
+    for entry in parse_json(response) or []:
+        address = str(entry.get("address", "")).lower()
+        if address in statuses and entry.get("status") in ["perfect", "partial"]:
+            statuses[address] = True
+    return statuses
+
+@cached(_sourcify_cache, key=_verification_key, lock=_cache_lock)
+def _query_sourcify(address: str, network: str) -> bool:
+    """Query Sourcify for full or partial verification; raises on request failure."""
+    verified = _sourcify_statuses([address], network)[address.lower()]
+    if verified:
+        logging.info("Sourcify verification found for %s", address)
+    return verified
+
+def _prefetch_sourcify(addresses: List[str], network: str):
+    """Warm the Sourcify cache for many addresses using batched requests."""
+    with _cache_lock:
+        pending = [a for a in addresses if _verification_key(a, network) not in _sourcify_cache]
+    for start in range(0, len(pending), _SOURCIFY_BATCH_SIZE):
+        chunk = pending[start:start + _SOURCIFY_BATCH_SIZE]
+        try:
+            statuses = _sourcify_statuses(chunk, network)
+        except Exception as e:
+            # Leave these uncached; get_tech_facts falls back to single lookups
+            logging.warning("Sourcify batch check failed for %d addresses: %s", len(chunk), e)
+            continue
+        with _cache_lock:
+            for address, verified in statuses.items():
+                _sourcify_cache[_verification_key(address, network)] = verified
+
+def _check_sourcify_verification(address: str, network: str) -> bool:
+    """Check Sourcify for full or partial contract verification."""
     try:
-        config = get_chain_config("ethereum", network)
-        url = f"{config['sourcify_api']}/check-by-addresses"
-        params = {"addresses": address.lower(), "chainIds": network_id}
-        
-        logging.info(f"Querying Sourcify for address: {address.lower()}")
-        response = requests.get(url, params=params, timeout=API_TIMEOUT)
-        
-        if response.status_code == 200:
-            data = response.json()
-            if data and any(d.get("status") in ["perfect", "partial"] for d in data):
-                logging.info(f"Sourcify verification found for {address}")
-                return True
+        return _query_sourcify(address, network)
     except Exception as e:
-        logging.error(f"Sourcify check failed for {address}: {e}")
+        logging.error("Sourcify check failed for %s: %s", address, e)
     return False
 
 def _analyze_abi_for_flags(abi: str) -> Dict[str, bool]:
@@ -110,24 +224,66 @@ def _analyze_abi_for_flags(abi: str) -> Dict[str, bool]:
     flags = {"admin": False, "pause": False, "supply": False}
     if not isinstance(abi, str): return flags
     
-    abi_lower = abi.lower()
-    if '"name":"owner"' in abi_lower and '"name":"transferownership"' in abi_lower:
+    # Parse the ABI and look only at function names, so matches inside
+    # parameter names or other strings can't trip a flag
+    try:
+        abi_entries = orjson.loads(abi)
+    except orjson.JSONDecodeError:
+        return flags  # e.g. "Contract source code not verified"
+    if not isinstance(abi_entries, list): return flags
+    
+    names = {
+        entry.get("name", "").lower()
+        for entry in abi_entries
+        if isinstance(entry, dict) and entry.get("type") == "function"
+    }
+    if "owner" in names and "transferownership" in names:
         flags["admin"] = True
-    if '"name":"grantrole"' in abi_lower:
+    if "grantrole" in names:
         flags["admin"] = True
-    if '"name":"pause"' in abi_lower and '"name":"unpause"' in abi_lower:
+    if "pause" in names and "unpause" in names:
         flags["pause"] = True
-    if '"name":"mint"' in abi_lower or '"name":"burn"' in abi_lower:
+    if "mint" in names or "burn" in names:
         flags["supply"] = True
         
     return flags
 
+def _unavailable_facts(address: str, network: str, error: str) -> Dict[str, Any]:
+    """Default unverified TechFacts for an address we could not analyze."""
+    return {
+        "verified": False, "bytecode_only": True, "admin_keys_present": False,
+        "governance_flags": {key: False for key in ["admin", "pause", "supply", "upgradeable"]},
+        "holders_estimate": None,
+        "explorer_url": get_explorer_url("ethereum", "address", address, network),
+        "error": error
+    }
+
 def get_tech_facts(id_or_addr: str, network: str = "mainnet") -> Dict[str, Any]:
-    """Get technical facts for an Ethereum smart contract."""
-    if not id_or_addr.startswith("0x") or len(id_or_addr) != 42:
+    """Get technical facts for an Ethereum smart contract.
+
+    Results are memoized per (address, network) for CACHE_TTL_SECONDS; each
+    call returns its own copy.
+    """
+    if not validate_ethereum_address(id_or_addr):
         raise ValueError("Invalid input. Provide a 0x... address.")
-        
-    address = id_or_addr.strip().lower()
+
+    key = _verification_key(id_or_addr.strip(), network)
+    with _cache_lock:
+        facts = _facts_cache.get(key)
+    if facts is None:
+        facts = _fetch_tech_facts(key[0], network)
+        if "error" not in facts:
+            with _cache_lock:
+                _facts_cache[key] = facts
+    return copy.deepcopy(facts)
+
+def clear_tech_facts_cache():
+    """Drop memoized TechFacts so the next lookups go back to the APIs."""
+    with _cache_lock:
+        _facts_cache.clear()
+
+def _fetch_tech_facts(address: str, network: str) -> Dict[str, Any]:
+    """Build TechFacts for a validated, lowercased address (uncached)."""
     original_address = address  # Keep track of the original address
     
     etherscan_source = {}
@@ -136,68 +292,52 @@ def get_tech_facts(id_or_addr: str, network: str = "mainnet") -> Dict[str, Any]:
     is_proxy = False
     
     try:
-        # First, check the original address for proxy status
-        config = get_chain_config("ethereum", network)
-        chain_id = "1" if network == "mainnet" else "5"
-        params = {
-            "chainid": chain_id,
-            "module": "contract",
-            "action": "getsourcecode",
-            "address": original_address,
-            "apikey": config["etherscan_key"]
-        }
-        data = _make_request_with_retries(config["etherscan_api"], params)
+        # First, check the original address for proxy status. Its response already
+        # names the implementation, so a proxy costs one follow-up call, not a re-fetch.
+        original_source_info = _fetch_etherscan_source(original_address, network)
+        is_proxy = original_source_info.get("Proxy") == "1"
         
-        if data.get("status") == "1" and data.get("result"):
-            original_source_info = data["result"][0]
-            is_proxy = original_source_info.get("Proxy") == "1"
-            
-            if is_proxy and original_source_info.get("Implementation"):
-                # If it's a proxy, get the implementation contract details
-                logging.info(f"Proxy detected at {original_address}, implementation: {original_source_info.get('Implementation')}")
-                etherscan_source = _get_etherscan_source(original_address, network)
-            else:
-                etherscan_source = original_source_info
+        if is_proxy and original_source_info.get("Implementation"):
+            # If it's a proxy, get the implementation contract details
+            logging.info("Proxy detected at %s, implementation: %s", original_address, original_source_info.get('Implementation'))
+            etherscan_source = _get_etherscan_source(original_source_info["Implementation"], network)
         else:
-            etherscan_source = _get_etherscan_source(address, network)
+            etherscan_source = original_source_info
             
         etherscan_verified = bool(etherscan_source.get("SourceCode"))
         
         # Log Etherscan verification status
-        logging.info(f"Etherscan verification status for {address}: {etherscan_verified}")
+        logging.info("Etherscan verification status for %s: %s", address, etherscan_verified)
 
+    except ContractNotFound as e:
+        # Nothing to verify anywhere; skip the Sourcify round-trip
+        logging.warning("%s", e)
+        return _unavailable_facts(original_address, network, "Contract not found (Etherscan)")
     except requests.exceptions.RequestException as e:
-        logging.error(f"Etherscan API error for {address}: {e}. Attempting Sourcify fallback.")
+        logging.error("Etherscan API error for %s: %s. Attempting Sourcify fallback.", address, e)
         # If Etherscan fails (e.g., rate limit, no data), proceed to Sourcify
         etherscan_verified = False # Explicitly set to False if Etherscan failed
     except Exception as e:
-        logging.error(f"Unexpected error during Etherscan fetch for {address}: {e}")
+        logging.error("Unexpected error during Etherscan fetch for %s: %s", address, e)
         etherscan_verified = False
 
     # Always attempt Sourcify if Etherscan didn't confirm verification
     if not etherscan_verified:
         sourcify_verified = _check_sourcify_verification(address, network)
-        logging.info(f"Sourcify verification status for {address}: {sourcify_verified}")
+        logging.info("Sourcify verification status for %s: %s", address, sourcify_verified)
 
     verified = etherscan_verified or sourcify_verified
     
     # If both failed, ensure we have a default error state
     if not verified and not etherscan_source:
-        logging.error(f"Both Etherscan and Sourcify failed for {address}. Marking as unverified.")
-        return {
-            "verified": False, "bytecode_only": True, "admin_keys_present": False,
-            "governance_flags": {key: False for key in ["admin", "pause", "supply", "upgradeable"]},
-            "holders_estimate": None,
-            "explorer_url": get_explorer_url("ethereum", "address", original_address, network),
-            "error": f"Data unavailable (Etherscan/Sourcify)"
-        }
+        logging.error("Both Etherscan and Sourcify failed for %s. Marking as unverified.", address)
+        return _unavailable_facts(original_address, network, "Data unavailable (Etherscan/Sourcify)")
 
-    abi = etherscan_source.get("ABI")
-    gov_flags = _analyze_abi_for_flags(abi)
+    gov_flags = etherscan_source.get("AbiFlags") or _analyze_abi_for_flags(etherscan_source.get("ABI"))
 
     # Log final verification status and chosen address for explorer link
     final_address_for_explorer = original_address
-    logging.info(f"Final verification status for {address}: {verified}. Using {final_address_for_explorer} for explorer link.")
+    logging.info("Final verification status for %s: %s. Using %s for explorer link.", address, verified, final_address_for_explorer)
 
     return {
         "verified": verified,
@@ -220,7 +360,41 @@ def get_tech_facts(id_or_addr: str, network: str = "mainnet") -> Dict[str, Any]:
         }
     }
 
+def get_tech_facts_batch(addresses: List[str], network: str = "mainnet") -> Dict[str, Dict[str, Any]]:
+    """
+    Get technical facts for many Ethereum contracts.
+    
+    Sourcify status is fetched for all addresses in a few batched requests up
+    front. Etherscan's getsourcecode only takes one address per call, so those
+    lookups run concurrently (bounded per host) and share the verification cache.
+    
+    Args:
+        addresses: List of 0x... contract addresses
+        network: 'mainnet' or 'testnet'
+        
+    Returns:
+        Dictionary mapping each input address to its TechFacts dictionary
+        (or {"error": ...} if the address is invalid)
+    """
+    valid = [a.strip().lower() for a in addresses if validate_ethereum_address(a.strip())]
+    _prefetch_sourcify(valid, network)
+    
+    def _facts(address: str) -> Dict[str, Any]:
+        try:
+            return get_tech_facts(address, network)
+        except ValueError as e:
+            return {"error": str(e)}
+    
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_PER_HOST, thread_name_prefix="ethereum-batch") as pool:
+        return dict(zip(addresses, pool.map(_facts, addresses)))
+
+def validate_ethereum_address(address: str) -> bool:
+    """Validate if the input is a 0x-prefixed, 20-byte hex address."""
+    return _ETH_ADDRESS_RE.match(address) is not None
+
+
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     # Self-check asserts from debug.md
     print("--- Running Self-Check Asserts ---")
     
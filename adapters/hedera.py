@@ -3,20 +3,52 @@ Hedera Hashgraph adapter for Multi-Chain Technical Risk Scoring System.
 Implements unified interface for Hedera token and contract analysis.
 """
 
+import copy
 import time
+import threading
 import requests
 import logging
 import re
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
+
+from cachetools import TTLCache, cached
 from config import (
     get_mirror_endpoint,
     get_explorer_url,
     get_chain_config,
     API_TIMEOUT,
     API_RETRIES,
+    CACHE_TTL_SECONDS,
     REQUEST_DELAY,
+    MAX_CONCURRENT_PER_HOST,
+    SOURCIFY_API,
+    TECH_FACTS_CACHE_SIZE,
+    VERIFICATION_CACHE_SIZE,
+    VERIFICATION_CACHE_TTL,
     assert_read_only
 )
+from utils.cache import PersistentTTLCache
+from utils.http import backoff_delay, get_session, parse_json, host_semaphore, record_rate_limit, wait_for_rate_limit
+
+# Shared pool for the independent Mirror Node lookups (token, balances, contract)
+_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="hedera")
+
+# Token keys and contract verification rarely change; share successful lookups
+# across get_tech_facts calls and restarts. Failures raise and are not cached.
+_token_cache = PersistentTTLCache("hedera_token", maxsize=VERIFICATION_CACHE_SIZE, ttl=VERIFICATION_CACHE_TTL)
+_contract_cache = PersistentTTLCache("hedera_contract", maxsize=VERIFICATION_CACHE_SIZE, ttl=VERIFICATION_CACHE_TTL)
+_cache_lock = threading.Lock()
+
+# Complete TechFacts per (entity, network), so repeat lookups within a run skip
+# the Mirror Node fan-out. In memory only; error results are not cached.
+_facts_cache = TTLCache(maxsize=TECH_FACTS_CACHE_SIZE, ttl=CACHE_TTL_SECONDS)
+
+_HEDERA_ID_RE = re.compile(r"\A\d+\.\d+\.\d+\Z")
+
+
+def _entity_key(entity_id: str, network: str):
+    return (entity_id.lower(), network)
 
 
 def _make_request_with_retries(url: str, timeout: int = API_TIMEOUT) -> Dict[str, Any]:
@@ -28,17 +60,20 @@ def _make_request_with_retries(url: str, timeout: int = API_TIMEOUT) -> Dict[str
     for attempt in range(API_RETRIES + 1):
         try:
             if attempt > 0:
-                time.sleep(REQUEST_DELAY * attempt)
+                time.sleep(backoff_delay(attempt, REQUEST_DELAY))
                 
-            response = requests.get(url, timeout=timeout)
+            wait_for_rate_limit(url)  # Retry-After / exhausted quota from earlier responses
+            with host_semaphore(url):
+                response = get_session().get(url, timeout=timeout)
+            record_rate_limit(url, response)
             response.raise_for_status()
-            return response.json()
+            return parse_json(response)
             
         except requests.RequestException as e:
             last_exception = e
             # Handle 404 specifically to return empty data gracefully
             if e.response is not None and e.response.status_code == 404:
-                logging.warning(f"Request to {url} returned 404 Not Found.")
+                logging.warning("Request to %s returned 404 Not Found.", url)
                 return {} # Return empty dict for 404
             
             if attempt < API_RETRIES:
@@ -50,43 +85,32 @@ def _make_request_with_retries(url: str, timeout: int = API_TIMEOUT) -> Dict[str
 
 def _log_request_details(url: str, status_code: int, response_preview: str, entity_id: str, network: str):
     """Helper to log request details for debugging."""
-    logging.info(f"[{entity_id}@{network}] Request URL: {url}")
-    logging.info(f"[{entity_id}@{network}] Status Code: {status_code}")
-    logging.info(f"[{entity_id}@{network}] Response Preview: {response_preview[:200]}...") # Log first 200 chars
-
-def _check_sourcify_verification(contract_address: str, network: str = "testnet") -> Dict[str, bool]:
-    """Check if contract is verified on Sourcify."""
-    try:
-        # Hedera network IDs: testnet=296, mainnet=295
-        network_id = "296" if network == "testnet" else "295"
-        sourcify_base = "https://repo.sourcify.dev"
-        
-        # Try full match first
-        full_url = f"{sourcify_base}/contracts/full_match/{network_id}/{contract_address}/"
-        try:
-            response = requests.get(full_url, timeout=API_TIMEOUT)
-            if response.status_code == 200:
-                return {"verified": True, "full_match": True, "partial_match": False}
-        except:
-            pass
-        
-        # Try partial match
-        partial_url = f"{sourcify_base}/contracts/partial_match/{network_id}/{contract_address}/"
-        try:
-            response = requests.get(partial_url, timeout=API_TIMEOUT)
-            if response.status_code == 200:
-                return {"verified": True, "full_match": False, "partial_match": True}
-        except:
-            pass
-        
-        return {"verified": False, "full_match": False, "partial_match": False}
-        
-    except Exception:
-        return {"verified": False, "full_match": False, "partial_match": False}
+    logging.info("[%s@%s] Request URL: %s", entity_id, network, url)
+    logging.info("[%s@%s] Status Code: %s", entity_id, network, status_code)
+    logging.info("[%s@%s] Response Preview: %.200s...", entity_id, network, response_preview) # Log first 200 chars
 
+def _query_sourcify(contract_address: str, network: str) -> Dict[str, bool]:
+    """Query Sourcify for full or partial verification; raises on request failure."""
+    # Hedera network IDs: testnet=296, mainnet=295
+    network_id = "296" if network == "testnet" else "295"
+    url = f"{SOURCIFY_API}/check-by-addresses"
+    params = {"addresses": contract_address.lower(), "chainIds": network_id}
+    
+    # One call answers both full and partial match
+    with host_semaphore(url):
+        response = get_session().get(url, params=params, timeout=API_TIMEOUT)
+    response.raise_for_status()
+    
+    statuses = {entry.get("status") for entry in parse_json(response) or []}
+    return {
+        "verified": bool(statuses & {"perfect", "partial"}),
+        "full_match": "perfect" in statuses,
+        "partial_match": "partial" in statuses,
+    }
 
+@cached(_token_cache, key=_entity_key, lock=_cache_lock)
 def _get_token_info(entity_id: str, network: str) -> Dict[str, Any]:
-    """Fetch and parse token information from Mirror Node."""
+    """Fetch and parse token information from Mirror Node; raises on request failure."""
     token_url = get_mirror_endpoint(f"tokens/{entity_id}", network)
     token_data = _make_request_with_retries(token_url)
     
@@ -104,45 +128,53 @@ def _get_token_info(entity_id: str, network: str) -> Dict[str, Any]:
         "fee": bool(token_data.get("fee_schedule_key")),
     }
     
-    holders_estimate = 0
+    return {
+        "governance_flags": governance_flags,
+        "token_id": token_data.get("token_id", entity_id),
+        "name": token_data.get("name", ""),
+        "symbol": token_data.get("symbol", ""),
+        "type": token_data.get("type", "UNKNOWN"),
+    }
+
+def _get_holders_estimate(entity_id: str, network: str) -> int:
+    """Estimate holder count from the first page of token balances."""
     try:
         balances_url = get_mirror_endpoint(f"tokens/{entity_id}/balances?limit=100", network)
         balances_data = _make_request_with_retries(balances_url)
         if "balances" in balances_data:
-            holders_estimate = len(balances_data["balances"])
+            return len(balances_data["balances"])
     except Exception:
         pass  # Holder count is optional
+    return 0
 
+@cached(_contract_cache, key=_entity_key, lock=_cache_lock)
+def _fetch_contract_info(entity_id: str, network: str) -> Dict[str, Any]:
+    """Fetch contract information and Sourcify verification; raises on request failure."""
+    contract_url = get_mirror_endpoint(f"contracts/{entity_id}", network)
+    contract_data = _make_request_with_retries(contract_url)
+    
+    if not contract_data.get("bytecode"):
+        return {"bytecode_only": False, "verified": False, "has_admin": False}
+
+    evm_address = contract_data.get("evm_address")
+    verified = False
+    if evm_address:
+        # Raises on failure, so a Sourcify outage is never cached as "unverified"
+        verified = _query_sourcify(evm_address, network)["verified"]
+        
     return {
-        "governance_flags": governance_flags,
-        "holders_estimate": holders_estimate,
-        "token_id": token_data.get("token_id", entity_id),
-        "name": token_data.get("name", ""),
-        "symbol": token_data.get("symbol", ""),
-        "type": token_data.get("type", "UNKNOWN"),
+        "bytecode_only": not verified,
+        "verified": verified,
+        "has_admin": bool(contract_data.get("admin_key")),
     }
 
 def _get_contract_info(entity_id: str, network: str) -> Dict[str, Any]:
     """Fetch and parse contract information, including verification."""
     try:
-        contract_url = get_mirror_endpoint(f"contracts/{entity_id}", network)
-        contract_data = _make_request_with_retries(contract_url)
-        
-        if not contract_data.get("bytecode"):
-            return {"bytecode_only": False, "verified": False, "has_admin": False}
-
-        evm_address = contract_data.get("evm_address")
-        verified = False
-        if evm_address:
-            verification = _check_sourcify_verification(evm_address, network)
-            verified = verification.get("verified", False)
-            
-        return {
-            "bytecode_only": not verified,
-            "verified": verified,
-            "has_admin": bool(contract_data.get("admin_key")),
-        }
-    except Exception:
+        return _fetch_contract_info(entity_id, network)
+    except Exception as e:
+        # Degrade to unverified for this call only; nothing was cached
+        logging.warning("Contract lookup failed for %s: %s", entity_id, e)
         return {"bytecode_only": False, "verified": False, "has_admin": False}
 
 def get_tech_facts(id_or_addr: str, network: str = "testnet") -> Dict[str, Any]:
@@ -154,20 +186,42 @@ def get_tech_facts(id_or_addr: str, network: str = "testnet") -> Dict[str, Any]:
         network: 'testnet' or 'mainnet'
         
     Returns:
-        Unified TechFacts dictionary
+        Unified TechFacts dictionary; memoized per (entity, network) for
+        CACHE_TTL_SECONDS, with each call getting its own copy
     """
     entity_id = id_or_addr.strip()
-    
+    key = _entity_key(entity_id, network)
+    with _cache_lock:
+        facts = _facts_cache.get(key)
+    if facts is None:
+        facts = _fetch_tech_facts(entity_id, network)
+        if "error" not in facts:
+            with _cache_lock:
+                _facts_cache[key] = facts
+    return copy.deepcopy(facts)
+
+def clear_tech_facts_cache():
+    """Drop memoized TechFacts so the next lookups go back to the Mirror Node."""
+    with _cache_lock:
+        _facts_cache.clear()
+
+def _fetch_tech_facts(entity_id: str, network: str) -> Dict[str, Any]:
+    """Build TechFacts for a stripped Hedera ID (uncached)."""
     token_info = {}
     contract_info = {}
     
     try:
-        token_info = _get_token_info(entity_id, network)
-        contract_info = _get_contract_info(entity_id, network)
+        # Token, balances and contract lookups are independent; run them concurrently
+        token_future = _EXECUTOR.submit(_get_token_info, entity_id, network)
+        holders_future = _EXECUTOR.submit(_get_holders_estimate, entity_id, network)
+        contract_future = _EXECUTOR.submit(_get_contract_info, entity_id, network)
+        token_info = token_future.result()
+        contract_info = contract_future.result()
+        holders_estimate = holders_future.result()
         
         # If token_info is empty, it means the token was not found (404)
         if not token_info:
-            logging.error(f"Token/Contract info not found for {entity_id} on {network}.")
+            logging.error("Token/Contract info not found for %s on %s.", entity_id, network)
             return {
                 "verified": False,
                 "bytecode_only": True, # Mark as bytecode_only if data is unavailable
@@ -187,8 +241,8 @@ def get_tech_facts(id_or_addr: str, network: str = "testnet") -> Dict[str, Any]:
             "verified": contract_info.get("verified", False),
             "bytecode_only": contract_info.get("bytecode_only", False),
             "admin_keys_present": admin_keys_present,
-            "governance_flags": token_info["governance_flags"],
-            "holders_estimate": token_info["holders_estimate"],
+            "governance_flags": dict(token_info["governance_flags"]),  # copy; token_info is cached
+            "holders_estimate": holders_estimate,
             "explorer_url": get_explorer_url("hedera", entity_type, token_info["token_id"], network),
             "token_info": {
                 "token_id": token_info["token_id"],
@@ -199,7 +253,7 @@ def get_tech_facts(id_or_addr: str, network: str = "testnet") -> Dict[str, Any]:
         }
         
     except Exception as e:
-        logging.error(f"Unexpected error processing Hedera facts for {entity_id}: {e}")
+        logging.error("Unexpected error processing Hedera facts for %s: %s", entity_id, e)
         return {
             "verified": False,
             "bytecode_only": True, # Mark as bytecode_only if any error occurs
@@ -211,9 +265,27 @@ def get_tech_facts(id_or_addr: str, network: str = "testnet") -> Dict[str, Any]:
             "error": f"Data unavailable (Hedera Mirror Node): {e}"
         }
 
+def get_tech_facts_batch(ids: List[str], network: str = "testnet") -> Dict[str, Dict[str, Any]]:
+    """
+    Get technical facts for many Hedera tokens or contracts.
+    
+    The Mirror Node has no multi-ID token lookup, so entities are fetched
+    concurrently (bounded per host) and share the token/contract caches.
+    
+    Args:
+        ids: List of Hedera IDs (0.0.12345)
+        network: 'testnet' or 'mainnet'
+        
+    Returns:
+        Dictionary mapping each input ID to its TechFacts dictionary
+    """
+    # A separate pool: get_tech_facts itself fans out onto _EXECUTOR
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_PER_HOST, thread_name_prefix="hedera-batch") as pool:
+        return dict(zip(ids, pool.map(lambda entity_id: get_tech_facts(entity_id, network), ids)))
+
 def validate_hedera_id(entity_id: str) -> bool:
     """Validate if the input is a valid Hedera ID format (e.g., 0.0.12345)."""
-    return bool(re.match(r"^\d+\.\d+\.\d+$", entity_id))
+    return _HEDERA_ID_RE.match(entity_id) is not None
 
 
 if __name__ == "__main__":
@@ -4,19 +4,70 @@ Base API client with caching and retry logic.
 
 import time
 import logging
+import threading
+from fnmatch import fnmatch
+from functools import lru_cache
 import requests
-from typing import Dict, Any, Optional
+from typing import Dict, Any, FrozenSet, Optional, Tuple
+from cachetools import LRUCache, TLRUCache
+from config import CACHE_TTL_TIERS
+from utils.cache import get_disk_cache
+from utils.http import backoff_delay, create_session, parse_json, host_semaphore, record_rate_limit, wait_for_rate_limit
 
-# Setup logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# (base_url, endpoint, params) - hashable without sorting or string building
+CacheKey = Tuple[str, str, Optional[FrozenSet[Tuple[str, Any]]]]
+
+
+@lru_cache(maxsize=1024)
+def _tier_ttl(endpoint: str) -> Optional[int]:
+    """Cache TTL configured for an endpoint in CACHE_TTL_TIERS, if any."""
+    endpoint = endpoint.strip('/')
+    for pattern, ttl in CACHE_TTL_TIERS.items():
+        if fnmatch(endpoint, pattern):
+            return ttl
+    return None
+
+
+def _entry_expiry(key, entry: Dict[str, Any], now: float) -> float:
+    """Expiry time for a cache entry; each entry carries its client's TTL."""
+    return entry.get('expires', now)
 
 
 class BaseAPIClient:
     """
     Base class for API clients with built-in caching and retry logic.
+    
+    Responses are cached in memory and written through to the shared disk
+    cache, so a restarted process can reuse them until they expire. The
+    in-memory cache is shared by all clients (keyed by base URL), guarded by
+    a lock, and bounded: expired entries are dropped lazily and the least
+    recently used are evicted once it is full.
+    
+    Responses that carried an ETag or Last-Modified header are also kept
+    past expiry in a smaller LRU, so the next fetch can be a conditional
+    GET; a 304 Not Modified reuses the stored body without re-downloading
+    or re-parsing it.
+    
+    Endpoints listed in ``bulk_endpoints`` (multi-megabyte listings) live in
+    a separate small cache so they never evict the many small, hot entries.
+    Params listed in ``credential_params`` are excluded from cache keys.
     """
     
-    def __init__(self, base_url: str, timeout: int = 10, retries: int = 2, cache_ttl: int = 300):
+    # Endpoints whose responses go to the separate bulk cache
+    bulk_endpoints: FrozenSet[str] = frozenset()
+    
+    # Request params carrying credentials; sent with requests but left out of
+    # cache keys, so API keys never reach the on-disk cache
+    credential_params: FrozenSet[str] = frozenset()
+    
+    _cache = TLRUCache(maxsize=8192, ttu=_entry_expiry, timer=time.time)
+    _bulk_cache = TLRUCache(maxsize=16, ttu=_entry_expiry, timer=time.time)
+    _validated = LRUCache(maxsize=1024)
+    _cache_lock = threading.RLock()
+    
+    def __init__(self, base_url: str, timeout: int = 10, retries: int = 2, cache_ttl: int = 300,
+                 session: Optional[requests.Session] = None):
         """
         Initialize the base API client.
         
@@ -25,43 +76,135 @@ class BaseAPIClient:
             timeout: Request timeout in seconds (default: 10)
             retries: Number of retry attempts (default: 2)
             cache_ttl: Cache time-to-live in seconds (default: 300 = 5 minutes)
+            session: HTTP session to use (default: a new pooled session owned by this client)
         """
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
         self.retries = retries
         self.cache_ttl = cache_ttl
-        self._cache: Dict[str, Dict[str, Any]] = {}
+        self._disk_cache = get_disk_cache()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        # Keep-alive connections to the API host are reused across get() calls
+        self._owns_session = session is None
+        self._session = session if session is not None else create_session(pool_connections=4)
+    
+    def close(self):
+        """Close the HTTP session if this client created it."""
+        if self._owns_session:
+            self._session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
         
-    def _get_cache_key(self, endpoint: str, params: Optional[Dict] = None) -> str:
-        """Generate cache key from endpoint and parameters."""
+    def _get_cache_key(self, endpoint: str, params: Optional[Dict] = None) -> CacheKey:
+        """Generate a hashable cache key from base URL, endpoint and non-credential parameters."""
+        if params and self.credential_params:
+            params = {k: v for k, v in params.items() if k not in self.credential_params}
+        return (self.base_url, endpoint, frozenset(params.items()) if params else None)
+    
+    @staticmethod
+    def _disk_key(cache_key: CacheKey) -> str:
+        """Stable string form of a cache key; only built when the disk cache is touched."""
+        _, endpoint, params = cache_key
         if params:
-            param_str = "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+            param_str = "&".join(f"{k}={v}" for k, v in sorted(params))
             return f"{endpoint}?{param_str}"
         return endpoint
     
-    def _is_cache_valid(self, cache_entry: Dict[str, Any]) -> bool:
-        """Check if cache entry is still valid."""
-        if not cache_entry:
-            return False
-        age = time.time() - cache_entry.get('timestamp', 0)
-        return age < self.cache_ttl
-    
-    def _get_from_cache(self, cache_key: str) -> Optional[Dict[str, Any]]:
-        """Retrieve data from cache if valid."""
-        cache_entry = self._cache.get(cache_key)
-        if cache_entry and self._is_cache_valid(cache_entry):
-            logging.info(f"Cache hit for {cache_key}")
+    def _memory_cache(self, cache_key: CacheKey) -> TLRUCache:
+        """In-memory cache holding the given key (bulk or regular)."""
+        return self._bulk_cache if cache_key[1].strip('/') in self.bulk_endpoints else self._cache
+    
+    def _get_from_cache(self, cache_key: CacheKey) -> Optional[Dict[str, Any]]:
+        """Retrieve data from cache if valid, falling back to the disk cache."""
+        memory_cache = self._memory_cache(cache_key)
+        with self._cache_lock:
+            cache_entry = memory_cache.get(cache_key)
+        if cache_entry is None and self._disk_cache is not None:
+            cache_entry, expires = self._disk_cache.get_with_expiry(self.base_url, self._disk_key(cache_key))
+            if cache_entry is not None:
+                # The row's expiry is authoritative; 304 refreshes only bump that column
+                cache_entry['expires'] = expires
+                with self._cache_lock:
+                    memory_cache[cache_key] = cache_entry
+        with self._cache_lock:
+            if cache_entry:
+                self._cache_hits += 1
+            else:
+                self._cache_misses += 1
+        if cache_entry:
+            logging.info("Cache hit for %s", cache_key[1])
             return cache_entry.get('data')
         return None
     
-    def _save_to_cache(self, cache_key: str, data: Dict[str, Any]):
-        """Save data to cache with timestamp."""
-        self._cache[cache_key] = {
+    def get_cached(self, endpoint: str, params: Optional[Dict] = None) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached response for an endpoint without making a request.
+        
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+            
+        Returns:
+            Cached response data (memory or disk), or None if not cached
+        """
+        return self._get_from_cache(self._get_cache_key(endpoint, params))
+    
+    def _save_to_cache(self, cache_key: CacheKey, data: Dict[str, Any], ttl: Optional[int] = None,
+                       etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """Save data to cache with timestamp and expiry (ttl defaults to cache_ttl)."""
+        ttl = self.cache_ttl if ttl is None else ttl
+        now = time.time()
+        cache_entry = {
             'data': data,
-            'timestamp': time.time()
+            'timestamp': now,
+            'expires': now + ttl,
+            'etag': etag,
+            'last_modified': last_modified
         }
+        with self._cache_lock:
+            self._memory_cache(cache_key)[cache_key] = cache_entry
+            if etag or last_modified:
+                self._validated[cache_key] = cache_entry
+        if self._disk_cache is not None:
+            self._disk_cache.set(self.base_url, self._disk_key(cache_key), cache_entry, ttl)
     
-    def get(self, endpoint: str, params: Optional[Dict] = None, use_cache: bool = True) -> Dict[str, Any]:
+    def _refresh_cache(self, cache_key: CacheKey, cache_entry: Dict[str, Any], ttl: Optional[int] = None):
+        """
+        Extend a revalidated (304) entry without re-serializing its data.
+        
+        The disk row only has its expiry bumped; it is rewritten in full only if
+        it has gone missing.
+        """
+        ttl = self.cache_ttl if ttl is None else ttl
+        now = time.time()
+        cache_entry = {**cache_entry, 'timestamp': now, 'expires': now + ttl}
+        with self._cache_lock:
+            self._memory_cache(cache_key)[cache_key] = cache_entry
+            self._validated[cache_key] = cache_entry
+        if self._disk_cache is not None:
+            disk_key = self._disk_key(cache_key)
+            if not self._disk_cache.touch(self.base_url, disk_key, ttl):
+                self._disk_cache.set(self.base_url, disk_key, cache_entry, ttl)
+    
+    def _conditional_headers(self, cache_key: CacheKey) -> Dict[str, str]:
+        """Validator headers for a previously fetched response, if it had any."""
+        with self._cache_lock:
+            cache_entry = self._validated.get(cache_key)
+        headers = {}
+        if cache_entry:
+            if cache_entry.get('etag'):
+                headers['If-None-Match'] = cache_entry['etag']
+            if cache_entry.get('last_modified'):
+                headers['If-Modified-Since'] = cache_entry['last_modified']
+        return headers
+    
+    def get(self, endpoint: str, params: Optional[Dict] = None, use_cache: bool = True,
+            ttl: Optional[int] = None) -> Dict[str, Any]:
         """
         Make GET request with caching and retry logic.
         
@@ -69,6 +212,8 @@ class BaseAPIClient:
             endpoint: API endpoint path
             params: Query parameters
             use_cache: Whether to use cached data (default: True)
+            ttl: Cache TTL for this response in seconds (default: the endpoint's
+                tier in CACHE_TTL_TIERS, else the client's cache_ttl)
             
         Returns:
             Response data as dictionary
@@ -86,22 +231,37 @@ class BaseAPIClient:
         
         # Build full URL
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        ttl = ttl if ttl is not None else _tier_ttl(endpoint)
+        headers = self._conditional_headers(cache_key)
         
         # Retry logic with exponential backoff
         last_exception = None
         for attempt in range(self.retries + 1):
             try:
                 if attempt > 0:
-                    backoff_time = 0.5 * (2 ** (attempt - 1))  # 0.5s, 1s, 2s...
-                    logging.info(f"Retry attempt {attempt} after {backoff_time}s backoff")
+                    backoff_time = backoff_delay(attempt, 0.5)  # jittered, up to 1s, 2s, 4s...
+                    logging.info("Retry attempt %d after %.2fs backoff", attempt, backoff_time)
                     time.sleep(backoff_time)
                 
-                logging.info(f"GET {url} (params: {params})")
-                response = requests.get(url, params=params, timeout=self.timeout)
+                logging.info("GET %s (params: %s)", url, params)
+                wait_for_rate_limit(url)  # Retry-After / exhausted quota from earlier responses
+                with host_semaphore(url):
+                    response = self._session.get(url, params=params, headers=headers, timeout=self.timeout)
+                record_rate_limit(url, response)
+                
+                # Unchanged since the last fetch: reuse the stored body
+                if response.status_code == 304 and headers:
+                    with self._cache_lock:
+                        cache_entry = self._validated.get(cache_key)
+                    if cache_entry is not None:
+                        logging.info("Not modified: %s", url)
+                        self._refresh_cache(cache_key, cache_entry, ttl)
+                        return cache_entry['data']
+                    headers = {}  # Validators were evicted; the retry fetches a full body
                 
                 # Handle rate limiting
                 if response.status_code in [429, 403]:
-                    logging.warning(f"Rate limit hit (status {response.status_code})")
+                    logging.warning("Rate limit hit (status %s)", response.status_code)
                     if attempt < self.retries:
                         continue
                     else:
@@ -109,43 +269,58 @@ class BaseAPIClient:
                         response.raise_for_status()
                 
                 response.raise_for_status()
-                data = response.json()
+                data = parse_json(response)
                 
                 # Save to cache
-                self._save_to_cache(cache_key, data)
+                self._save_to_cache(cache_key, data, ttl,
+                                    response.headers.get('ETag'), response.headers.get('Last-Modified'))
                 
                 return data
                 
             except requests.Timeout as e:
                 last_exception = e
-                logging.error(f"Request timeout on attempt {attempt + 1}: {e}")
+                logging.error("Request timeout on attempt %d: %s", attempt + 1, e)
             except requests.RequestException as e:
                 last_exception = e
-                logging.error(f"Request failed on attempt {attempt + 1}: {e}")
+                logging.error("Request failed on attempt %d: %s", attempt + 1, e)
         
         # All retries failed
-        logging.error(f"All retry attempts failed for {url}")
+        logging.error("All retry attempts failed for %s", url)
         raise last_exception
     
     def clear_cache(self):
-        """Clear all cached data."""
-        self._cache.clear()
+        """Clear cached data for this client's base URL, including disk cache entries."""
+        with self._cache_lock:
+            for cache in (self._cache, self._bulk_cache, self._validated):
+                for key in [key for key in cache if key[0] == self.base_url]:
+                    del cache[key]
+        if self._disk_cache is not None:
+            self._disk_cache.clear(self.base_url)
         logging.info("Cache cleared")
     
     def get_cache_stats(self) -> Dict[str, Any]:
-        """Get cache statistics."""
-        total_entries = len(self._cache)
-        valid_entries = sum(1 for entry in self._cache.values() if self._is_cache_valid(entry))
+        """Get cache statistics for this client's base URL, plus this client's hit/miss counts."""
+        with self._cache_lock:
+            self._cache.expire()
+            self._bulk_cache.expire()
+            total_entries = sum(1 for key in self._cache if key[0] == self.base_url)
+            bulk_entries = sum(1 for key in self._bulk_cache if key[0] == self.base_url)
+            hits, misses = self._cache_hits, self._cache_misses
         
         return {
-            'total_entries': total_entries,
-            'valid_entries': valid_entries,
-            'expired_entries': total_entries - valid_entries,
+            'total_entries': total_entries + bulk_entries,
+            'valid_entries': total_entries + bulk_entries,
+            'expired_entries': 0,
+            'bulk_entries': bulk_entries,
+            'hits': hits,
+            'misses': misses,
+            'disk_entries': self._disk_cache.count(self.base_url) if self._disk_cache is not None else 0,
             'cache_ttl': self.cache_ttl
         }
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     # Test the base client
     print("Testing BaseAPIClient...")
     
@@ -3,10 +3,39 @@ CoinGecko API client for cryptocurrency market data.
 """
 
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+import requests
 from api_clients.base import BaseAPIClient
 
-logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# Maximum ids per /coins/markets request (CoinGecko's per_page limit)
+MARKETS_BATCH_SIZE = 250
+
+
+# Shape of a token data result; the defaults double as the failure payload
+_EMPTY_TOKEN_TEMPLATE = {
+    'coin_id': '',
+    'name': 'Unknown',
+    'symbol': '',
+    'price': 0,
+    'market_cap': 0,
+    'volume_24h': 0,
+    'price_change_24h': 0,
+    'price_change_7d': 0,
+    'market_cap_rank': 0,
+    'circulating_supply': 0,
+    'total_supply': 0,
+    'ath': 0,
+    'ath_change_percentage': 0,
+    'last_updated': ''
+}
+
+
+def _empty_token_data(coin_id: str, error: str) -> Dict[str, Any]:
+    """Token data structure returned when a coin could not be fetched."""
+    return {**_EMPTY_TOKEN_TEMPLATE, 'coin_id': coin_id, 'error': error}
 
 
 class CoinGeckoClient(BaseAPIClient):
@@ -14,16 +43,22 @@ class CoinGeckoClient(BaseAPIClient):
     Client for CoinGecko API to fetch cryptocurrency market data.
     """
     
-    def __init__(self, api_key: Optional[str] = None, cache_ttl: int = 300):
+    # The API key is passed as a query param; keep it out of cache keys
+    credential_params = frozenset({'x_cg_pro_api_key'})
+    
+    def __init__(self, api_key: Optional[str] = None, cache_ttl: int = 300,
+                 session: Optional[requests.Session] = None):
         """
         Initialize CoinGecko client.
         
         Args:
             api_key: Optional CoinGecko API key for higher rate limits
             cache_ttl: Cache time-to-live in seconds (default: 300 = 5 minutes)
+            session: HTTP session to share with other clients (default: a new one owned by this client)
         """
         base_url = "https://api.coingecko.com/api/v3"
-        super().__init__(base_url, timeout=10, retries=2, cache_ttl=cache_ttl)
+        super().__init__(base_url, timeout=10, retries=2, cache_ttl=cache_ttl,
+                         session=session)
         self.api_key = api_key
     
     def get_token_data(self, coin_id: str) -> Dict[str, Any]:
@@ -68,49 +103,100 @@ class CoinGeckoClient(BaseAPIClient):
             endpoint = f"coins/{coin_id}"
             data = self.get(endpoint, params=params)
             
-            # Extract relevant market data
-            market_data = data.get('market_data', {})
+            # Extract relevant market data; CoinGecko sends null for unknown sub-objects
+            market_data = data.get('market_data') or {}
+            current_price = market_data.get('current_price') or {}
+            market_cap = market_data.get('market_cap') or {}
+            total_volume = market_data.get('total_volume') or {}
+            ath = market_data.get('ath') or {}
+            ath_change = market_data.get('ath_change_percentage') or {}
             
             result = {
                 'coin_id': coin_id,
                 'name': data.get('name', 'Unknown'),
-                'symbol': data.get('symbol', '').upper(),
-                'price': market_data.get('current_price', {}).get('usd', 0),
-                'market_cap': market_data.get('market_cap', {}).get('usd', 0),
-                'volume_24h': market_data.get('total_volume', {}).get('usd', 0),
+                'symbol': (data.get('symbol') or '').upper(),
+                'price': current_price.get('usd', 0),
+                'market_cap': market_cap.get('usd', 0),
+                'volume_24h': total_volume.get('usd', 0),
                 'price_change_24h': market_data.get('price_change_percentage_24h', 0),
                 'price_change_7d': market_data.get('price_change_percentage_7d', 0),
                 'market_cap_rank': market_data.get('market_cap_rank', 0),
                 'circulating_supply': market_data.get('circulating_supply', 0),
                 'total_supply': market_data.get('total_supply', 0),
-                'ath': market_data.get('ath', {}).get('usd', 0),
-                'ath_change_percentage': market_data.get('ath_change_percentage', {}).get('usd', 0),
+                'ath': ath.get('usd', 0),
+                'ath_change_percentage': ath_change.get('usd', 0),
                 'last_updated': data.get('last_updated', '')
             }
             
-            logging.info(f"Fetched token data for {coin_id}: ${result['price']:.2f}")
+            logger.info("Fetched token data for %s: $%.2f", coin_id, result['price'])
             return result
             
         except Exception as e:
-            logging.error(f"Failed to fetch token data for {coin_id}: {e}")
+            logger.error("Failed to fetch token data for %s: %s", coin_id, e)
             # Return empty data structure on error
-            return {
-                'coin_id': coin_id,
-                'name': 'Unknown',
-                'symbol': '',
-                'price': 0,
-                'market_cap': 0,
-                'volume_24h': 0,
-                'price_change_24h': 0,
-                'price_change_7d': 0,
-                'market_cap_rank': 0,
-                'circulating_supply': 0,
-                'total_supply': 0,
-                'ath': 0,
-                'ath_change_percentage': 0,
-                'last_updated': '',
-                'error': str(e)
-            }
+            return _empty_token_data(coin_id, str(e))
+    
+    def get_tokens_data(self, coin_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch token data for many coins with batched /coins/markets requests.
+        
+        One request covers up to MARKETS_BATCH_SIZE coins, instead of one
+        coins/{id} request per coin, which matters under CoinGecko's rate limit.
+        
+        Args:
+            coin_ids: List of CoinGecko coin IDs
+            
+        Returns:
+            Dictionary mapping coin_id to the same structure as get_token_data
+            (with an 'error' key for coins that could not be fetched)
+        """
+        results = {}
+        unique_ids = list(dict.fromkeys(coin_ids))
+        
+        for start in range(0, len(unique_ids), MARKETS_BATCH_SIZE):
+            chunk = unique_ids[start:start + MARKETS_BATCH_SIZE]
+            try:
+                params = {
+                    'vs_currency': 'usd',
+                    'ids': ','.join(chunk),
+                    'per_page': MARKETS_BATCH_SIZE,
+                    'page': 1,
+                    'sparkline': 'false',
+                    'price_change_percentage': '24h,7d'
+                }
+                
+                if self.api_key:
+                    params['x_cg_pro_api_key'] = self.api_key
+                
+                for entry in self.get("coins/markets", params=params):
+                    results[entry['id']] = {
+                        'coin_id': entry['id'],
+                        'name': entry.get('name') or 'Unknown',
+                        'symbol': (entry.get('symbol') or '').upper(),
+                        'price': entry.get('current_price') or 0,
+                        'market_cap': entry.get('market_cap') or 0,
+                        'volume_24h': entry.get('total_volume') or 0,
+                        'price_change_24h': entry.get('price_change_percentage_24h') or 0,
+                        'price_change_7d': entry.get('price_change_percentage_7d_in_currency') or 0,
+                        # Unranked coins come back as null; score them as unranked, not #0
+                        'market_cap_rank': entry.get('market_cap_rank') or 999,
+                        'circulating_supply': entry.get('circulating_supply') or 0,
+                        'total_supply': entry.get('total_supply') or 0,
+                        'ath': entry.get('ath') or 0,
+                        'ath_change_percentage': entry.get('ath_change_percentage') or 0,
+                        'last_updated': entry.get('last_updated') or ''
+                    }
+            except Exception as e:
+                logger.error("Failed to fetch market data for %d coins: %s", len(chunk), e)
+                for coin_id in chunk:
+                    results[coin_id] = _empty_token_data(coin_id, str(e))
+        
+        for coin_id in unique_ids:
+            if coin_id not in results:
+                results[coin_id] = _empty_token_data(coin_id, f"Coin '{coin_id}' not found")
+        
+        logger.info("Fetched market data for %d coins", len(unique_ids))
+        return results
     
     def get_simple_price(self, coin_ids: list, vs_currencies: list = ['usd']) -> Dict[str, Any]:
         """
@@ -136,15 +222,16 @@ class CoinGeckoClient(BaseAPIClient):
                 params['x_cg_pro_api_key'] = self.api_key
             
             data = self.get("simple/price", params=params)
-            logging.info(f"Fetched simple price data for {len(coin_ids)} coins")
+            logger.info("Fetched simple price data for %d coins", len(coin_ids))
             return data
             
         except Exception as e:
-            logging.error(f"Failed to fetch simple price data: {e}")
+            logger.error("Failed to fetch simple price data: %s", e)
             return {}
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     # Test the CoinGecko client
     print("Testing CoinGeckoClient...")
     
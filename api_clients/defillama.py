@@ -3,10 +3,119 @@ DeFi Llama API client for protocol TVL and DeFi data.
 """
 
 import logging
-from typing import Dict, Any, Optional, List
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterator, Optional, List, Sequence
+import requests
+from cachetools import LRUCache
 from api_clients.base import BaseAPIClient
 
-logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# Concurrent protocol/{slug} requests issued by get_protocols_tvl
+TVL_FETCH_WORKERS = 8
+
+# From this many slugs, one /protocols listing is cheaper than per-protocol requests
+BULK_TVL_THRESHOLD = 16
+
+# Memoized TVL summaries per client; each pins its (multi-MB) source response,
+# so only the most recently used protocols are kept
+TVL_SUMMARY_MEMO_SIZE = 32
+
+# Protocol list fields most callers need (the full entries carry ~30 keys)
+PROTOCOL_SUMMARY_FIELDS = ('name', 'slug', 'tvl', 'category', 'logo')
+
+# Shape of a TVL result; the defaults double as the failure payload
+_EMPTY_TVL_TEMPLATE = {
+    'protocol': '',
+    'slug': '',
+    'tvl': 0,
+    'tvl_change_24h': 0,
+    'tvl_change_7d': 0,
+    'chains': {},
+    'category': 'Unknown',
+    'description': '',
+    'logo': '',
+    'url': '',
+    'last_updated': 0
+}
+
+
+def _percent_change(current: float, previous: float) -> float:
+    """Percentage change from previous to current, 0 when previous is not positive."""
+    return (current - previous) / previous * 100 if previous > 0 else 0
+
+
+def _summarize_tvl(data: Dict[str, Any], protocol_slug: str) -> Dict[str, Any]:
+    """
+    Derive current TVL, 24h/7d changes and per-chain TVL from a protocol response.
+    
+    Only the last eight history points are ever read, so the (often multi-thousand
+    point) 'tvl' series is indexed directly rather than converted or scanned.
+    """
+    history = data.get('tvl')
+    tvl_change_24h = 0
+    tvl_change_7d = 0
+    last_updated = 0
+    
+    if isinstance(history, list) and history:
+        latest = history[-1]
+        current_tvl = latest.get('totalLiquidityUSD', 0)
+        last_updated = latest.get('date', 0)
+        if len(history) > 1:
+            tvl_change_24h = _percent_change(
+                current_tvl, history[-2].get('totalLiquidityUSD', current_tvl))
+        if len(history) > 7:
+            tvl_change_7d = _percent_change(
+                current_tvl, history[-8].get('totalLiquidityUSD', current_tvl))
+    else:
+        current_tvl = history or 0
+    
+    # chainTvls values are either {'tvl': [...]} summaries or raw history lists
+    chains = {}
+    for chain, values in data.get('chainTvls', {}).items():
+        if isinstance(values, dict):
+            if 'tvl' in values:
+                chains[chain] = values['tvl']
+        elif values:
+            chains[chain] = values[-1].get('totalLiquidityUSD', 0)
+    
+    return {
+        'protocol': data.get('name', protocol_slug),
+        'slug': protocol_slug,
+        'tvl': current_tvl,
+        'tvl_change_24h': tvl_change_24h,
+        'tvl_change_7d': tvl_change_7d,
+        'chains': chains,
+        'category': data.get('category', 'Unknown'),
+        'description': data.get('description', ''),
+        'logo': data.get('logo', ''),
+        'url': data.get('url', ''),
+        'last_updated': last_updated
+    }
+
+
+def _summarize_listing_tvl(protocol: Dict[str, Any], protocol_slug: str) -> Dict[str, Any]:
+    """
+    Build a TVL summary from a /protocols listing entry.
+    
+    The listing carries current TVL, precomputed 1d/7d changes and per-chain
+    TVL, but no history, so 'last_updated' is left at 0.
+    """
+    return {
+        'protocol': protocol.get('name', protocol_slug),
+        'slug': protocol_slug,
+        'tvl': protocol.get('tvl') or 0,
+        'tvl_change_24h': protocol.get('change_1d') or 0,
+        'tvl_change_7d': protocol.get('change_7d') or 0,
+        'chains': dict(protocol.get('chainTvls') or {}),
+        'category': protocol.get('category', 'Unknown'),
+        'description': protocol.get('description', ''),
+        'logo': protocol.get('logo', ''),
+        'url': protocol.get('url', ''),
+        'last_updated': 0
+    }
 
 
 class DefiLlamaClient(BaseAPIClient):
@@ -14,15 +123,29 @@ class DefiLlamaClient(BaseAPIClient):
     Client for DeFi Llama API to fetch protocol TVL and DeFi metrics.
     """
     
-    def __init__(self, cache_ttl: int = 300):
+    # Multi-megabyte listings, cached apart from per-protocol responses
+    bulk_endpoints = frozenset({'protocols', 'chains'})
+    
+    def __init__(self, cache_ttl: int = 300,
+                 session: Optional[requests.Session] = None):
         """
         Initialize DeFi Llama client.
         
         Args:
             cache_ttl: Cache time-to-live in seconds (default: 300 = 5 minutes)
+            session: HTTP session to share with other clients (default: a new one owned by this client)
         """
         base_url = "https://api.llama.fi"
-        super().__init__(base_url, timeout=10, retries=2, cache_ttl=cache_ttl)
+        super().__init__(base_url, timeout=10, retries=2, cache_ttl=cache_ttl,
+                         session=session)
+        # Lookup indexes over the protocols list, rebuilt when the list is refetched
+        self._protocols_source: Optional[List[Dict[str, Any]]] = None
+        self._name_index: Dict[str, Dict[str, Any]] = {}
+        self._slug_index: Dict[str, Dict[str, Any]] = {}
+        self._index_lock = threading.Lock()
+        # protocol slug -> (source response, derived TVL summary), bounded so
+        # responses evicted from the API cache aren't kept alive here indefinitely
+        self._tvl_summaries: LRUCache = LRUCache(maxsize=TVL_SUMMARY_MEMO_SIZE)
     
     def get_protocol_tvl(self, protocol_slug: str) -> Dict[str, Any]:
         """
@@ -51,85 +174,95 @@ class DefiLlamaClient(BaseAPIClient):
             endpoint = f"protocol/{protocol_slug}"
             data = self.get(endpoint)
             
-            # Calculate TVL changes if historical data available
-            tvl_change_24h = 0
-            tvl_change_7d = 0
+            # Reuse the summary while the cache keeps handing back the same response
+            with self._index_lock:
+                memo = self._tvl_summaries.get(protocol_slug)
+            if memo is not None and memo[0] is data:
+                return {**memo[1], 'chains': dict(memo[1]['chains'])}
             
-            if 'tvl' in data and isinstance(data['tvl'], list) and len(data['tvl']) > 0:
-                current_tvl = data['tvl'][-1].get('totalLiquidityUSD', 0)
-                
-                # Calculate 24h change
-                if len(data['tvl']) > 1:
-                    tvl_24h_ago = data['tvl'][-2].get('totalLiquidityUSD', current_tvl)
-                    if tvl_24h_ago > 0:
-                        tvl_change_24h = ((current_tvl - tvl_24h_ago) / tvl_24h_ago) * 100
-                
-                # Calculate 7d change (approximate)
-                if len(data['tvl']) > 7:
-                    tvl_7d_ago = data['tvl'][-8].get('totalLiquidityUSD', current_tvl)
-                    if tvl_7d_ago > 0:
-                        tvl_change_7d = ((current_tvl - tvl_7d_ago) / tvl_7d_ago) * 100
-            else:
-                current_tvl = data.get('tvl', 0)
+            result = _summarize_tvl(data, protocol_slug)
+            with self._index_lock:
+                self._tvl_summaries[protocol_slug] = (data, result)
+            result = {**result, 'chains': dict(result['chains'])}
             
-            # Extract chain-specific TVL
-            chain_tvls = data.get('chainTvls', {})
-            chains = {}
-            for chain, values in chain_tvls.items():
-                if isinstance(values, dict) and 'tvl' in values:
-                    chains[chain] = values['tvl']
-                elif isinstance(values, list) and len(values) > 0:
-                    chains[chain] = values[-1].get('totalLiquidityUSD', 0)
-            
-            result = {
-                'protocol': data.get('name', protocol_slug),
-                'slug': protocol_slug,
-                'tvl': current_tvl,
-                'tvl_change_24h': tvl_change_24h,
-                'tvl_change_7d': tvl_change_7d,
-                'chains': chains,
-                'category': data.get('category', 'Unknown'),
-                'description': data.get('description', ''),
-                'logo': data.get('logo', ''),
-                'url': data.get('url', ''),
-                'last_updated': data['tvl'][-1].get('date', 0) if isinstance(data.get('tvl'), list) and len(data['tvl']) > 0 else 0
-            }
-            
-            logging.info(f"Fetched TVL data for {protocol_slug}: ${result['tvl']:,.0f}")
+            logger.info("Fetched TVL data for %s: $%.0f", protocol_slug, result['tvl'])
             return result
             
         except Exception as e:
-            logging.error(f"Failed to fetch TVL data for {protocol_slug}: {e}")
+            logger.error("Failed to fetch TVL data for %s: %s", protocol_slug, e)
             # Return empty data structure on error
-            return {
-                'protocol': protocol_slug,
-                'slug': protocol_slug,
-                'tvl': 0,
-                'tvl_change_24h': 0,
-                'tvl_change_7d': 0,
-                'chains': {},
-                'category': 'Unknown',
-                'description': '',
-                'logo': '',
-                'url': '',
-                'last_updated': 0,
-                'error': str(e)
-            }
+            return {**_EMPTY_TVL_TEMPLATE, 'protocol': protocol_slug, 'slug': protocol_slug,
+                    'chains': {}, 'error': str(e)}
+    
+    def get_protocols_tvl(self, protocol_slugs: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch TVL data for several protocols.
+        
+        From BULK_TVL_THRESHOLD slugs on, or whenever the listing is already
+        cached, summaries come from the single /protocols listing (one request,
+        kept in the bulk cache). Smaller sets, and slugs missing from the
+        listing, use per-protocol requests issued in parallel, so latency is
+        that of the slowest request rather than the sum.
+        
+        Args:
+            protocol_slugs: List of DeFi Llama protocol slugs
+            
+        Returns:
+            Dictionary mapping slug to the same structure as get_protocol_tvl
+        """
+        unique_slugs = list(dict.fromkeys(protocol_slugs))
+        results = {}
+        # A listing already cached for other lookups is free to use for any batch size
+        if len(unique_slugs) >= BULK_TVL_THRESHOLD or self.get_cached("protocols") is not None:
+            slug_index = self._get_protocol_indexes()[1]
+            for slug in unique_slugs:
+                protocol = slug_index.get(slug.lower())
+                if protocol is not None:
+                    results[slug] = _summarize_listing_tvl(protocol, slug)
+        
+        remaining = [slug for slug in unique_slugs if slug not in results]
+        if remaining:
+            with ThreadPoolExecutor(max_workers=min(TVL_FETCH_WORKERS, len(remaining)),
+                                    thread_name_prefix="defillama") as pool:
+                results.update(zip(remaining, pool.map(self.get_protocol_tvl, remaining)))
+        return {slug: results[slug] for slug in unique_slugs}
     
-    def get_all_protocols(self) -> List[Dict[str, Any]]:
+    def get_all_protocols(self, fields: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
         """
         Fetch list of all protocols with basic TVL data.
         
+        Args:
+            fields: Keys to keep in each protocol dict (default: all ~30 fields)
+        
         Returns:
             List of protocol dictionaries with basic info
         """
         try:
             data = self.get("protocols")
-            logging.info(f"Fetched {len(data)} protocols from DeFi Llama")
-            return data
+            logger.info("Fetched %d protocols from DeFi Llama", len(data))
         except Exception as e:
-            logging.error(f"Failed to fetch protocols list: {e}")
+            logger.error("Failed to fetch protocols list: %s", e)
             return []
+        if fields is None:
+            return data
+        return list(self.iter_protocols(fields, protocols=data))
+    
+    def iter_protocols(self, fields: Sequence[str] = PROTOCOL_SUMMARY_FIELDS,
+                       protocols: Optional[List[Dict[str, Any]]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield slim protocol dicts holding only the requested fields.
+        
+        Args:
+            fields: Keys to keep in each protocol dict
+            protocols: Full protocols list (default: fetched via get_all_protocols)
+            
+        Yields:
+            Protocol dictionaries restricted to the fields present
+        """
+        if protocols is None:
+            protocols = self.get_all_protocols()
+        for protocol in protocols:
+            yield {field: protocol[field] for field in fields if field in protocol}
     
     def get_protocol_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """
@@ -142,20 +275,48 @@ class DefiLlamaClient(BaseAPIClient):
             Protocol data if found, None otherwise
         """
         try:
-            protocols = self.get_all_protocols()
-            name_lower = name.lower()
-            
-            for protocol in protocols:
-                if protocol.get('name', '').lower() == name_lower:
-                    return protocol
-            
-            logging.warning(f"Protocol '{name}' not found")
-            return None
+            protocol = self._get_protocol_indexes()[0].get(name.lower())
+            if protocol is None:
+                logger.warning("Protocol '%s' not found", name)
+            return protocol
             
         except Exception as e:
-            logging.error(f"Failed to search for protocol {name}: {e}")
+            logger.error("Failed to search for protocol %s: %s", name, e)
             return None
     
+    def get_protocol_by_slug(self, slug: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a protocol by its DeFi Llama slug in the protocols list.
+        
+        Args:
+            slug: Protocol slug (e.g., 'aave-v3')
+            
+        Returns:
+            Protocol data if found, None otherwise
+        """
+        return self._get_protocol_indexes()[1].get(slug.lower())
+    
+    def _get_protocol_indexes(self):
+        """
+        Get (name, slug) lookup dicts over the protocols list.
+        
+        The indexes are built in a single pass and reused for as long as
+        get_all_protocols keeps returning the same cached list object.
+        """
+        protocols = self.get_all_protocols()
+        with self._index_lock:
+            if protocols is not self._protocols_source:
+                name_index = {}
+                slug_index = {}
+                for protocol in protocols:
+                    # First match wins, as with the previous linear scan
+                    name_index.setdefault(protocol.get('name', '').lower(), protocol)
+                    if protocol.get('slug'):
+                        slug_index.setdefault(protocol['slug'].lower(), protocol)
+                self._name_index, self._slug_index = name_index, slug_index
+                self._protocols_source = protocols
+            return self._name_index, self._slug_index
+    
     def get_chains(self) -> List[Dict[str, Any]]:
         """
         Fetch list of all chains with TVL data.
@@ -165,14 +326,15 @@ class DefiLlamaClient(BaseAPIClient):
         """
         try:
             data = self.get("chains")
-            logging.info(f"Fetched {len(data)} chains from DeFi Llama")
+            logger.info("Fetched %d chains from DeFi Llama", len(data))
             return data
         except Exception as e:
-            logging.error(f"Failed to fetch chains list: {e}")
+            logger.error("Failed to fetch chains list: %s", e)
             return []
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     # Test the DeFi Llama client
     print("Testing DefiLlamaClient...")
     
@@ -205,11 +367,11 @@ if __name__ == "__main__":
         
         # Test 4: Get all protocols (limited output)
         print("\n4. Fetching all protocols:")
-        all_protocols = client.get_all_protocols()
+        all_protocols = client.get_all_protocols(fields=PROTOCOL_SUMMARY_FIELDS)
         print(f"   Total protocols: {len(all_protocols)}")
         if all_protocols:
             print(f"   Top 3 by TVL:")
-            sorted_protocols = sorted(all_protocols, key=lambda x: x.get('tvl', 0), reverse=True)
+            sorted_protocols = sorted(all_protocols, key=lambda x: x.get('tvl') or 0, reverse=True)
             for i, p in enumerate(sorted_protocols[:3], 1):
                 print(f"      {i}. {p.get('name', 'Unknown')}: ${p.get('tvl', 0):,.0f}")
         
@@ -3,22 +3,31 @@ Streamlit Web Application for Multi-Chain Technical Risk Scoring System.
 """
 
 import streamlit as st
-import json
-import re
+import functools
+import importlib
+import logging
 from typing import Dict, Any
 
 # Import updated modules
-from adapters import hedera, ethereum
 from features.tech import build_tech_features
 from engine.tech_baseline import tech_baseline, get_risk_category
 from utils.io import save_receipt
 from config import PROTOTYPE_VERSION
 
-# Mapping chains to their adapter modules
-ADAPTERS = {
-    "hedera": hedera,
-    "ethereum": ethereum,
-}
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# Chains with an adapter module at adapters/<chain>.py
+SUPPORTED_CHAINS = ("hedera", "ethereum")
+
+
+@functools.cache
+def _get_adapter(chain: str):
+    """Import a chain adapter on first use, so only the selected chain pays its import cost."""
+    if chain not in SUPPORTED_CHAINS:
+        raise KeyError(chain)
+    return importlib.import_module(f"adapters.{chain}")
+
 
 def run_analysis(entity_id: str, chain: str, network: str) -> Dict[str, Any]:
     """
@@ -26,7 +35,7 @@ def run_analysis(entity_id: str, chain: str, network: str) -> Dict[str, Any]:
     """
     try:
         st.write(f"🔍 Fetching data from {chain.capitalize()} {network.capitalize()}...")
-        adapter = ADAPTERS[chain]
+        adapter = _get_adapter(chain)
         tech_facts = adapter.get_tech_facts(entity_id, network)
 
         if "error" in tech_facts:
@@ -87,7 +96,7 @@ def display_results(results: Dict[str, Any]):
     receipt_path = results.get("receipt_path")
     if receipt_path:
         try:
-            with open(receipt_path, "r") as f:
+            with open(receipt_path, "rb") as f:
                 st.download_button(
                     "📁 Download JSON Receipt",
                     data=f.read(),
@@ -105,7 +114,7 @@ def main():
 
     # --- Inputs ---
     st.header("📋 Analysis Input")
-    chain = st.selectbox("Select Blockchain", ("hedera", "ethereum"))
+    chain = st.selectbox("Select Blockchain", SUPPORTED_CHAINS)
     
     network_options = ["mainnet", "testnet"]
     if chain == "ethereum":
@@ -119,9 +128,9 @@ def main():
         if not entity_id:
             st.warning("Please enter an address or ID.")
         # Input validation based on selected chain
-        elif chain == "ethereum" and (not entity_id.startswith("0x") or len(entity_id) != 42):
+        elif chain == "ethereum" and not _get_adapter(chain).validate_ethereum_address(entity_id):
             st.error("Invalid input. Provide a 0x... address.")
-        elif chain == "hedera" and not re.match(r"^\d+\.\d+\.\d+$", entity_id):
+        elif chain == "hedera" and not _get_adapter(chain).validate_hedera_id(entity_id):
             st.error("Invalid input. Provide a Hedera ID (e.g., 0.0.12345).")
         else:
             with st.spinner("Analyzing..."):
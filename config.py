@@ -4,6 +4,9 @@ Handles environment variables and network settings with safety enforcements.
 """
 
 import os
+from types import MappingProxyType
+from typing import Mapping
+
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -33,6 +36,7 @@ ETHERSCAN_EXPLORER = os.getenv("ETHERSCAN_EXPLORER", "https://etherscan.io")
 API_TIMEOUT = int(os.getenv("API_TIMEOUT", "10"))
 API_RETRIES = int(os.getenv("API_RETRIES", "2"))
 REQUEST_DELAY = float(os.getenv("REQUEST_DELAY", "0.1"))
+MAX_CONCURRENT_PER_HOST = int(os.getenv("MAX_CONCURRENT_PER_HOST", "8"))
 
 # Dashboard API configuration
 COINGECKO_API_KEY = os.getenv("COINGECKO_API_KEY", "")  # Optional, for higher rate limits
@@ -41,6 +45,20 @@ DEFILLAMA_BASE_URL = os.getenv("DEFILLAMA_BASE_URL", "https://api.llama.fi")
 
 # Cache settings
 CACHE_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", "300"))  # 5 minutes
+VERIFICATION_CACHE_TTL = int(os.getenv("VERIFICATION_CACHE_TTL", "3600"))  # 1 hour
+VERIFICATION_CACHE_SIZE = int(os.getenv("VERIFICATION_CACHE_SIZE", "4096"))
+TECH_FACTS_CACHE_SIZE = int(os.getenv("TECH_FACTS_CACHE_SIZE", "512"))  # whole adapter results, per process
+DISK_CACHE_PATH = os.getenv("DISK_CACHE_PATH", "cache/cache.sqlite3")  # empty disables persistence
+
+# Per-endpoint cache TTLs (seconds) for the market data API clients, matched with
+# fnmatch against the endpoint path. Endpoints not listed use the client's cache_ttl.
+CACHE_TTL_TIERS = {
+    "simple/price": 60,        # prices update about once a minute
+    "coins/*": 300,            # coin detail and market snapshots
+    "protocol/*": 600,         # per-protocol TVL history
+    "protocols": 1800,         # full protocol list, large and slow-moving
+    "chains": 1800,
+}
 DASHBOARD_REFRESH_INTERVAL = int(os.getenv("DASHBOARD_REFRESH_INTERVAL", "900"))  # 15 minutes
 
 # Version info
@@ -58,7 +76,29 @@ def assert_read_only():
         )
 
 
-def get_chain_config(chain: str = None, network: str = None) -> dict:
+# Per chain/network settings, built once; network None applies to every network
+_CHAIN_CONFIG = {
+    ("hedera", "testnet"): MappingProxyType({
+        "mirror_api": HEDERA_MIRROR_TESTNET,
+        "explorer_base": HASHSCAN_TESTNET,
+        "explorer_name": "HashScan"
+    }),
+    ("hedera", "mainnet"): MappingProxyType({
+        "mirror_api": HEDERA_MIRROR_MAINNET,
+        "explorer_base": HASHSCAN_MAINNET,
+        "explorer_name": "HashScan"
+    }),
+    ("ethereum", None): MappingProxyType({
+        "etherscan_api": ETHERSCAN_BASE,
+        "etherscan_key": ETHERSCAN_API_KEY,
+        "sourcify_api": SOURCIFY_API,
+        "explorer_base": ETHERSCAN_EXPLORER,
+        "explorer_name": "Etherscan"
+    }),
+}
+
+
+def get_chain_config(chain: str = None, network: str = None) -> Mapping[str, str]:
     """
     Get configuration for specific chain and network.
     
@@ -67,34 +107,15 @@ def get_chain_config(chain: str = None, network: str = None) -> dict:
         network: 'testnet' or 'mainnet' (defaults to ACTIVE_NETWORK)
         
     Returns:
-        Dictionary with chain-specific configuration
+        Read-only mapping with chain-specific configuration
     """
     chain = chain or ACTIVE_CHAIN
     network = network or ACTIVE_NETWORK
     
-    if chain == "hedera":
-        if network == "testnet":
-            return {
-                "mirror_api": HEDERA_MIRROR_TESTNET,
-                "explorer_base": HASHSCAN_TESTNET,
-                "explorer_name": "HashScan"
-            }
-        elif network == "mainnet":
-            return {
-                "mirror_api": HEDERA_MIRROR_MAINNET,
-                "explorer_base": HASHSCAN_MAINNET,
-                "explorer_name": "HashScan"
-            }
-    elif chain == "ethereum":
-        return {
-            "etherscan_api": ETHERSCAN_BASE,
-            "etherscan_key": ETHERSCAN_API_KEY,
-            "sourcify_api": SOURCIFY_API,
-            "explorer_base": ETHERSCAN_EXPLORER,
-            "explorer_name": "Etherscan"
-        }
-    
-    raise ValueError(f"Unsupported chain/network combination: {chain}/{network}")
+    config = _CHAIN_CONFIG.get((chain, network)) or _CHAIN_CONFIG.get((chain, None))
+    if config is None:
+        raise ValueError(f"Unsupported chain/network combination: {chain}/{network}")
+    return config
 
 
 def get_mirror_endpoint(path: str, network: str = None) -> str:
@@ -123,10 +144,12 @@ def get_explorer_url(chain: str, entity_type: str, entity_id: str, network: str
     raise ValueError(f"Unsupported chain: {chain}")
 
 
-def validate_config():
-    """Validate configuration for active chain/network."""
-    import requests
-    
+# Successful connectivity checks are remembered in the disk cache for this long
+CONFIG_CHECK_TTL = 600
+
+
+def validate_config_syntactic():
+    """Validate configuration for active chain/network without any network access."""
     # Enforce read-only mode
     assert_read_only()
     
@@ -140,6 +163,30 @@ def validate_config():
     if (ACTIVE_CHAIN, ACTIVE_NETWORK) not in supported_combinations:
         raise ValueError(f"Unsupported chain/network: {ACTIVE_CHAIN}/{ACTIVE_NETWORK}")
     
+    if ACTIVE_CHAIN == "ethereum" and not ETHERSCAN_API_KEY:
+        raise ValueError("ETHERSCAN_API_KEY is required for Ethereum support")
+    
+    return True
+
+
+def validate_config_network(use_cache: bool = True):
+    """
+    Test connectivity to the active chain's API.
+    
+    A successful check is cached on disk for CONFIG_CHECK_TTL seconds, so
+    repeated runs within that window skip the HTTP round trip.
+    
+    Args:
+        use_cache: Whether to reuse a recent successful check (default: True)
+    """
+    import requests
+    from utils.cache import get_disk_cache
+    
+    disk = get_disk_cache()
+    cache_key = (ACTIVE_CHAIN, ACTIVE_NETWORK)
+    if use_cache and disk is not None and disk.get("config_check", cache_key):
+        return True
+    
     # Test connectivity based on active chain
     if ACTIVE_CHAIN == "hedera":
         try:
@@ -150,9 +197,6 @@ def validate_config():
             raise ConnectionError(f"Failed to connect to Hedera Mirror Node: {e}")
     
     elif ACTIVE_CHAIN == "ethereum":
-        if not ETHERSCAN_API_KEY:
-            raise ValueError("ETHERSCAN_API_KEY is required for Ethereum support")
-        
         try:
             # Test Etherscan API
             config = get_chain_config("ethereum")
@@ -162,11 +206,20 @@ def validate_config():
         except Exception as e:
             raise ConnectionError(f"Failed to connect to Etherscan API: {e}")
     
+    if disk is not None:
+        disk.set("config_check", cache_key, True, CONFIG_CHECK_TTL)
     return True
 
 
+def validate_config():
+    """Validate configuration for active chain/network, including connectivity."""
+    validate_config_syntactic()
+    return validate_config_network()
+
+
 if __name__ == "__main__":
     import logging
+    import sys
     logging.basicConfig(level=logging.INFO)
 
     logging.info(f"Active Chain: {ACTIVE_CHAIN}")
@@ -179,7 +232,11 @@ if __name__ == "__main__":
         logging.warning("Etherscan API Key is NOT set.")
 
     try:
-        validate_config()
-        logging.info("✅ Configuration valid and services accessible")
+        if "--offline" in sys.argv:
+            validate_config_syntactic()
+            logging.info("✅ Configuration valid (connectivity not checked)")
+        else:
+            validate_config()
+            logging.info("✅ Configuration valid and services accessible")
     except Exception as e:
         logging.error(f"❌ Configuration error: {e}")
@@ -0,0 +1,66 @@
+"""
+Shared API clients and risk aggregator for the Risk Dashboard.
+Streamlit reruns the script on every interaction; caching the clients as
+resources keeps their connection pools alive across reruns and sessions,
+and a background warmer keeps their response caches filled.
+"""
+
+import logging
+import threading
+import time
+
+import streamlit as st
+
+from api_clients.coingecko import CoinGeckoClient
+from api_clients.defillama import DefiLlamaClient
+from engine.risk_aggregator import RiskAggregator
+from config import COINGECKO_API_KEY, DASHBOARD_REFRESH_INTERVAL
+from utils.http import get_session
+
+logger = logging.getLogger(__name__)
+
+
+@st.cache_resource
+def get_coingecko() -> CoinGeckoClient:
+    """Get the process-wide CoinGecko client."""
+    return CoinGeckoClient(api_key=COINGECKO_API_KEY or None, session=get_session())
+
+
+@st.cache_resource
+def get_defillama() -> DefiLlamaClient:
+    """Get the process-wide DeFi Llama client."""
+    return DefiLlamaClient(session=get_session())
+
+
+@st.cache_resource
+def get_risk_aggregator() -> RiskAggregator:
+    """Get the process-wide risk aggregator (stateless, so safe to share)."""
+    return RiskAggregator()
+
+
+def _warm_periodically(manager, interval: int) -> None:
+    """Re-warm the shared caches every interval seconds."""
+    while True:
+        try:
+            manager.warm_caches()
+        except Exception as e:
+            logger.warning("Cache warm-up failed: %s", e)
+        time.sleep(interval)
+
+
+@st.cache_resource
+def start_cache_warmer(_manager, interval: int = DASHBOARD_REFRESH_INTERVAL) -> threading.Thread:
+    """
+    Start the background cache warmer once per process.
+    
+    Args:
+        _manager: ProtocolManager whose protocols are prefetched (not hashed by Streamlit)
+        interval: Seconds between warm-ups
+        
+    Returns:
+        The daemon warmer thread
+    """
+    thread = threading.Thread(target=_warm_periodically, args=(_manager, interval),
+                              name="cache-warmer", daemon=True)
+    thread.start()
+    return thread
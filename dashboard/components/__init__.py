@@ -4,12 +4,14 @@ Contains reusable Streamlit components for the Risk Dashboard.
 """
 
 from .protocol_card import render_protocol_card
+from .protocol_table import render_protocol_table
 from .risk_radar import render_risk_radar_chart
 from .detail_view import render_protocol_detail
 from .methodology import render_methodology_page
 
 __all__ = [
     'render_protocol_card',
+    'render_protocol_table',
     'render_risk_radar_chart',
     'render_protocol_detail',
     'render_methodology_page'
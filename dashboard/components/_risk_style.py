@@ -0,0 +1,30 @@
+"""
+Risk Style Lookup.
+Maps a 0-100 risk score to its traffic-light emoji and colors.
+"""
+
+from bisect import bisect_right
+from typing import Tuple
+
+# Lower bounds of the medium (40) and low (70) risk bands
+RISK_THRESHOLDS = (40, 70)
+
+# (emoji, CSS color) per band: high, medium, low risk
+_STYLES = (("🔴", "red"), ("🟡", "orange"), ("🟢", "green"))
+
+# (fill, line) radar colors per band: high, medium, low risk
+_RADAR_COLORS = (
+    ('rgba(255, 0, 0, 0.3)', 'rgb(200, 0, 0)'),
+    ('rgba(255, 165, 0, 0.3)', 'rgb(255, 140, 0)'),
+    ('rgba(0, 200, 0, 0.3)', 'rgb(0, 150, 0)'),
+)
+
+
+def risk_style(score: float) -> Tuple[str, str]:
+    """Traffic-light emoji and CSS color for a risk score."""
+    return _STYLES[bisect_right(RISK_THRESHOLDS, score)]
+
+
+def radar_colors(score: float) -> Tuple[str, str]:
+    """Radar chart fill and line colors for a risk score."""
+    return _RADAR_COLORS[bisect_right(RISK_THRESHOLDS, score)]
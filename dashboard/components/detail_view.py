@@ -3,12 +3,40 @@ Protocol Detail View Component.
 Renders detailed risk assessment for a single protocol.
 """
 
+import html
 import streamlit as st
 from typing import Dict, Any
 from .risk_radar import render_risk_radar_chart
+from ._risk_style import risk_style
 from dashboard.protocol_manager import ProtocolManager
 
 
+# (display name, score key, emoji) in display order
+_CATEGORIES = (
+    ('Security', 'security', '🔒'),
+    ('Financial', 'financial', '💰'),
+    ('Operational', 'operational', '⚙️'),
+    ('Market', 'market', '📈')
+)
+
+_INFO_ROW_TEMPLATE = (
+    "<div style='display: flex; gap: 2rem; flex-wrap: wrap;'>"
+    "<div style='flex: 1;'><b>Chain:</b> {chain}<br><b>Category:</b> {category}</div>"
+    "<div style='flex: 1;'><b>Contract:</b> <code>{contract}</code><br>"
+    "<a href='{explorer_url}' target='_blank'>View on Etherscan</a></div>"
+    "</div>"
+)
+
+# Per-color opening markup for category scores; st.html skips Markdown parsing
+_SCORE_HTML_PREFIX = {
+    color: f"<p><b>Score:</b> <span style='color: {color}; font-weight: bold; font-size: 1.2em;'>"
+    for color in ('red', 'orange', 'green')
+}
+
+# Hover tooltips stay; the zoom/pan/export toolbar is not useful on a 4-axis radar
+_RADAR_CHART_CONFIG = {'displayModeBar': False}
+
+
 def render_protocol_detail(protocol_data: Dict[str, Any]):
     """
     Render detailed protocol view with comprehensive risk information.
@@ -24,30 +52,32 @@ def render_protocol_detail(protocol_data: Dict[str, Any]):
     Args:
         protocol_data: Protocol risk data dictionary
     """
+    # Look each field up once; sections receive only what they render
+    scores = protocol_data['scores']
+    _render_header(protocol_data['name'], scores['overall'], protocol_data['risk_indicator'])
+    # The radar reads only the four category keys, so the scores dict is passed as-is
+    _render_radar(scores)
+    _render_categories(scores, protocol_data['reasons'])
+    _render_meta(protocol_data)
+
+
+def _show_list():
+    """Back button callback; runs before the rerun, so the list renders in the same run."""
+    st.session_state.current_view = 'list'
+
+
+def _render_header(name: str, overall_score: int, risk_indicator: str):
+    """Back button, protocol name and overall score banner."""
     # Header with back button
     col1, col2 = st.columns([1, 5])
     with col1:
-        if st.button("← Back", key="back_button"):
-            st.session_state.current_view = 'list'
-            st.rerun()
+        st.button("← Back", key="back_button", on_click=_show_list)
     
     with col2:
-        st.title(protocol_data['name'])
-    
-    # Overall risk score section
-    overall_score = protocol_data['scores']['overall']
-    risk_indicator = protocol_data['risk_indicator']
+        st.title(name)
     
     # Determine traffic light emoji and color
-    if overall_score >= 70:
-        traffic_light = "🟢"
-        risk_color = "green"
-    elif overall_score >= 40:
-        traffic_light = "🟡"
-        risk_color = "orange"
-    else:
-        traffic_light = "🔴"
-        risk_color = "red"
+    traffic_light, risk_color = risk_style(overall_score)
     
     # Display overall score prominently
     st.markdown(
@@ -64,66 +94,55 @@ def render_protocol_detail(protocol_data: Dict[str, Any]):
         """,
         unsafe_allow_html=True
     )
-    
-    # Risk radar chart
+
+
+@st.fragment
+def _render_radar(category_scores: Dict[str, int]):
+    """Radar chart section; reruns on its own without redrawing the rest of the page."""
     st.subheader("Risk Category Breakdown")
-    category_scores = {
-        'security': protocol_data['scores']['security'],
-        'financial': protocol_data['scores']['financial'],
-        'operational': protocol_data['scores']['operational'],
-        'market': protocol_data['scores']['market']
-    }
-    
     fig = render_risk_radar_chart(category_scores)
-    st.plotly_chart(fig, use_container_width=True)
-    
+    st.plotly_chart(fig, use_container_width=True, config=_RADAR_CHART_CONFIG)
+
+
+@st.fragment
+def _render_categories(scores: Dict[str, int], reasons_by_category: Dict[str, Any]):
+    """Per-category score and reasons expanders."""
     # Detailed category breakdowns
     st.subheader("Detailed Risk Analysis")
     
-    categories = [
-        ('Security', 'security', '🔒'),
-        ('Financial', 'financial', '💰'),
-        ('Operational', 'operational', '⚙️'),
-        ('Market', 'market', '📈')
-    ]
-    
-    for display_name, key, emoji in categories:
-        score = protocol_data['scores'][key]
-        reasons = protocol_data['reasons'].get(key, [])
+    for display_name, key, emoji in _CATEGORIES:
+        score = scores[key]
+        reasons = reasons_by_category.get(key, [])
         
         # Determine score color
-        if score >= 70:
-            score_color = "green"
-        elif score >= 40:
-            score_color = "orange"
-        else:
-            score_color = "red"
+        score_color = risk_style(score)[1]
         
-        with st.expander(f"{emoji} {display_name} Risk: {score}/100", expanded=True):
-            st.markdown(f"**Score:** <span style='color: {score_color}; font-weight: bold; font-size: 1.2em;'>{score}/100</span>", unsafe_allow_html=True)
+        # Categories without reasons start collapsed; their body is a single line
+        with st.expander(f"{emoji} {display_name} Risk: {score}/100", expanded=bool(reasons)):
+            st.html(f"{_SCORE_HTML_PREFIX[score_color]}{score}/100</span></p>")
             
             if reasons:
-                st.markdown("**Key Factors:**")
-                for reason in reasons:
-                    st.markdown(f"• {reason}")
+                # One markdown element for the whole list rather than one per reason
+                st.markdown("**Key Factors:**\n\n" + "\n".join(f"- {reason}" for reason in reasons))
             else:
-                st.markdown("*No specific risk factors identified*")
-    
+                st.caption("*No specific risk factors identified*")
+
+
+def _render_meta(protocol_data: Dict[str, Any]):
+    """Protocol information, data freshness and API status."""
     # Protocol information section
     st.subheader("Protocol Information")
     
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown(f"**Chain:** {protocol_data['chain'].capitalize()}")
-        st.markdown(f"**Category:** {protocol_data.get('category', 'Unknown').capitalize()}")
-    
-    with col2:
-        st.markdown(f"**Contract:** `{protocol_data['contract_address'][:10]}...{protocol_data['contract_address'][-8:]}`")
-        
-        # Explorer link
-        explorer_url = f"https://etherscan.io/address/{protocol_data['contract_address']}"
-        st.markdown(f"[View on Etherscan]({explorer_url})")
+    # Display strings are precomputed by ProtocolManager; one HTML row instead of two columns
+    st.markdown(
+        _INFO_ROW_TEMPLATE.format(
+            chain=html.escape(protocol_data['chain_display']),
+            category=html.escape(protocol_data['category_display']),
+            contract=html.escape(protocol_data['contract_short']),
+            explorer_url=html.escape(protocol_data['explorer_url'], quote=True)
+        ),
+        unsafe_allow_html=True
+    )
     
     # Data freshness section
     st.divider()
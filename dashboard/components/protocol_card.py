@@ -3,9 +3,62 @@ Protocol Card Component.
 Renders a summary card for a protocol with risk score and key information.
 """
 
+import html
 import streamlit as st
+from functools import lru_cache
+from string import Template
 from typing import Dict, Any
 
+from ._risk_style import risk_style
+
+
+# Display label per risk category key
+_CATEGORY_LABELS = {
+    'security': 'Security',
+    'financial': 'Financial',
+    'operational': 'Operational',
+    'market': 'Market'
+}
+
+
+_CARD_TEMPLATE = Template("""
+<div style="
+    border: 1px solid #ddd;
+    border-radius: 10px;
+    padding: 20px;
+    margin: 10px 0;
+    background-color: #f9f9f9;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+">
+    <h3 style="margin-top: 0;">$traffic_light $name</h3>
+    <div style="font-size: 2em; font-weight: bold; color: $risk_color; margin: 10px 0;">
+        $score/100
+    </div>
+    <div style="color: $risk_color; font-weight: bold; margin-bottom: 15px;">
+        $risk_indicator
+    </div>
+</div>
+""")
+
+
+@lru_cache(maxsize=256)
+def _card_html(name: str, score: int, risk_indicator: str) -> str:
+    """Card header HTML for one protocol, reused across reruns while unchanged."""
+    traffic_light, risk_color = risk_style(score)
+    return _CARD_TEMPLATE.substitute(
+        traffic_light=traffic_light,
+        name=html.escape(name),
+        risk_color=risk_color,
+        score=score,
+        risk_indicator=html.escape(risk_indicator)
+    )
+
+
+def _show_detail(protocol_id: str):
+    """View Details callback; runs before the rerun, so the detail view renders in the same run."""
+    st.session_state.current_view = 'detail'
+    st.session_state.selected_protocol = protocol_id
+
 
 def render_protocol_card(protocol_data: Dict[str, Any], key_prefix: str = ""):
     """
@@ -26,65 +79,30 @@ def render_protocol_card(protocol_data: Dict[str, Any], key_prefix: str = ""):
     overall_score = protocol_data['scores']['overall']
     risk_indicator = protocol_data['risk_indicator']
     
-    # Determine traffic light emoji
-    if overall_score >= 70:
-        traffic_light = "🟢"
-        risk_color = "green"
-    elif overall_score >= 40:
-        traffic_light = "🟡"
-        risk_color = "orange"
-    else:
-        traffic_light = "🔴"
-        risk_color = "red"
-    
     # Create card container
     with st.container():
         st.markdown(
-            f"""
-            <div style="
-                border: 1px solid #ddd;
-                border-radius: 10px;
-                padding: 20px;
-                margin: 10px 0;
-                background-color: #f9f9f9;
-                box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            ">
-                <h3 style="margin-top: 0;">{traffic_light} {name}</h3>
-                <div style="font-size: 2em; font-weight: bold; color: {risk_color}; margin: 10px 0;">
-                    {overall_score}/100
-                </div>
-                <div style="color: {risk_color}; font-weight: bold; margin-bottom: 15px;">
-                    {risk_indicator}
-                </div>
-            </div>
-            """,
+            _card_html(name, overall_score, risk_indicator),
             unsafe_allow_html=True
         )
         
-        # Get top 2 risk factors (reasons with lowest scores)
-        category_scores = protocol_data['scores']
-        categories = ['security', 'financial', 'operational', 'market']
-        
-        # Sort categories by score (ascending) to get highest risks
-        sorted_categories = sorted(
-            categories,
-            key=lambda c: category_scores[c]
-        )
-        
-        # Display top 2 risk factors
-        st.markdown("**Key Risk Factors:**")
-        for i, category in enumerate(sorted_categories[:2]):
-            reasons = protocol_data['reasons'].get(category, [])
+        # Display top 2 risk factors as one element (the header is memoized above;
+        # reasons are per-load lists, so this part is rebuilt each render)
+        factor_lines = ["**Key Risk Factors:**"]
+        # Lowest-scoring categories, precomputed by ProtocolManager
+        reasons_by_category = protocol_data['reasons']
+        for category in protocol_data['sorted_risk_keys']:
+            reasons = reasons_by_category.get(category)
             if reasons:
                 reason_text = reasons[0]  # Show first reason
-                st.markdown(f"• {category.capitalize()}: {reason_text}")
+                factor_lines.append(f"• {_CATEGORY_LABELS[category]}: {reason_text}")
+        st.markdown("  \n".join(factor_lines))
         
         # Navigation button
-        if st.button(
+        st.button(
             f"View Details →",
             key=f"{key_prefix}btn_{protocol_id}",
-            use_container_width=True
-        ):
-            st.session_state.current_view = 'detail'
-            st.session_state.selected_protocol = protocol_id
-            st.rerun()
+            use_container_width=True,
+            on_click=_show_detail,
+            args=(protocol_id,)
+        )
@@ -0,0 +1,66 @@
+"""
+Protocol Table Component.
+Renders every protocol's scores as one table, a lighter alternative to the card grid.
+"""
+
+import streamlit as st
+from functools import partial
+from typing import Dict, Any, List, Sequence
+
+from ._risk_style import risk_style
+
+
+# Score columns, drawn as 0-100 bars
+_SCORE_COLUMNS = ('Overall', 'Security', 'Financial', 'Operational', 'Market')
+
+_COLUMN_CONFIG = {
+    column: st.column_config.ProgressColumn(column, min_value=0, max_value=100, format="%d")
+    for column in _SCORE_COLUMNS
+}
+
+
+def _show_selected_detail(protocol_ids: Sequence[str], table_key: str):
+    """Row selection callback; opens the selected protocol's detail view."""
+    rows = st.session_state[table_key].selection.rows
+    if rows:
+        st.session_state.current_view = 'detail'
+        st.session_state.selected_protocol = protocol_ids[rows[0]]
+        # A new table key next time, so returning to the list starts unselected
+        st.session_state.protocol_table_version = st.session_state.get('protocol_table_version', 0) + 1
+
+
+def render_protocol_table(protocols_data: List[Dict[str, Any]]):
+    """
+    Render all protocols as a single table with one row per protocol.
+
+    One dataframe element replaces the card grid's several elements per
+    protocol; selecting a row opens that protocol's detail view.
+
+    Args:
+        protocols_data: List of protocol risk data dictionaries
+    """
+    rows = []
+    for protocol_data in protocols_data:
+        scores = protocol_data['scores']
+        rows.append({
+            'Protocol': f"{risk_style(scores['overall'])[0]} {protocol_data['name']}",
+            'Overall': scores['overall'],
+            'Security': scores['security'],
+            'Financial': scores['financial'],
+            'Operational': scores['operational'],
+            'Market': scores['market'],
+            'Risk': protocol_data['risk_indicator']
+        })
+
+    table_key = f"protocol_table_{st.session_state.get('protocol_table_version', 0)}"
+    protocol_ids = tuple(protocol_data['protocol_id'] for protocol_data in protocols_data)
+    st.dataframe(
+        rows,
+        column_config=_COLUMN_CONFIG,
+        hide_index=True,
+        use_container_width=True,
+        key=table_key,
+        on_select=partial(_show_selected_detail, protocol_ids, table_key),
+        selection_mode="single-row"
+    )
+    st.caption("Select a row to view its details.")
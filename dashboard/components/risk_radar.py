@@ -4,8 +4,37 @@ Renders an interactive radar chart showing risk scores across categories.
 """
 
 import plotly.graph_objects as go
+import streamlit as st
 from typing import Dict
 
+from ._risk_style import radar_colors
+
+
+# Categories in display order, closed by repeating the first axis
+_THETA_CLOSED = ('Security', 'Financial', 'Operational', 'Market', 'Security')
+
+_HOVER_TEMPLATE = '<b>%{theta}</b><br>Score: %{r}/100<extra></extra>'
+
+_RADAR_LAYOUT = {
+    'polar': {
+        'radialaxis': {
+            'visible': True,
+            'range': [0, 100],
+            'tickmode': 'linear',
+            'tick0': 0,
+            'dtick': 50,
+            'showticklabels': True
+        },
+        'angularaxis': {
+            'direction': 'clockwise',
+            'period': 4
+        }
+    },
+    'showlegend': False,
+    'height': 400,
+    'margin': {'l': 80, 'r': 80, 't': 40, 'b': 40}
+}
+
 
 def render_risk_radar_chart(category_scores: Dict[str, int]) -> go.Figure:
     """
@@ -21,68 +50,43 @@ def render_risk_radar_chart(category_scores: Dict[str, int]) -> go.Figure:
                         'operational', 'market' and integer scores 0-100
     
     Returns:
-        Plotly Figure object
+        Plotly Figure object (shared across sessions; do not mutate)
     """
-    # Define categories in display order
-    categories = ['Security', 'Financial', 'Operational', 'Market']
-    
-    # Extract scores in the same order
-    scores = [
-        category_scores.get('security', 0),
-        category_scores.get('financial', 0),
-        category_scores.get('operational', 0),
-        category_scores.get('market', 0)
-    ]
-    
-    # Close the radar chart by repeating the first value
-    scores_closed = scores + [scores[0]]
-    categories_closed = categories + [categories[0]]
+    # Scores are rounded so reruns with unchanged scores hit the figure cache. They
+    # are not snapped to coarser buckets: the hover tooltip reports the exact score,
+    # and with one figure per tracked protocol the cache stays small regardless.
+    return _radar_figure(
+        round(category_scores.get('security', 0)),
+        round(category_scores.get('financial', 0)),
+        round(category_scores.get('operational', 0)),
+        round(category_scores.get('market', 0))
+    )
+
+
+@st.cache_resource(max_entries=128)
+def _radar_figure(security: int, financial: int, operational: int, market: int) -> go.Figure:
+    """
+    Build the radar Figure for one set of category scores.
     
+    The Figure is cached as a shared resource: every session and rerun gets the
+    same object, with no pickling or copying. Callers must not mutate it.
+    """
     # Determine overall color based on average score
-    avg_score = sum(scores) / len(scores)
-    if avg_score >= 70:
-        fill_color = 'rgba(0, 200, 0, 0.3)'  # Green
-        line_color = 'rgb(0, 150, 0)'
-    elif avg_score >= 40:
-        fill_color = 'rgba(255, 165, 0, 0.3)'  # Orange
-        line_color = 'rgb(255, 140, 0)'
-    else:
-        fill_color = 'rgba(255, 0, 0, 0.3)'  # Red
-        line_color = 'rgb(200, 0, 0)'
-    
-    # Create radar chart
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatterpolar(
-        r=scores_closed,
-        theta=categories_closed,
-        fill='toself',
-        fillcolor=fill_color,
-        line=dict(color=line_color, width=2),
-        name='Risk Scores',
-        hovertemplate='<b>%{theta}</b><br>Score: %{r}/100<extra></extra>'
-    ))
-    
-    # Update layout
-    fig.update_layout(
-        polar=dict(
-            radialaxis=dict(
-                visible=True,
-                range=[0, 100],
-                tickmode='linear',
-                tick0=0,
-                dtick=25,
-                showticklabels=True,
-                ticks='outside'
-            ),
-            angularaxis=dict(
-                direction='clockwise',
-                period=4
-            )
-        ),
-        showlegend=False,
-        height=400,
-        margin=dict(l=80, r=80, t=40, b=40)
-    )
+    avg_score = (security + financial + operational + market) * 0.25
+    fill_color, line_color = radar_colors(avg_score)
     
-    return fig
+    # Built in one Figure call, so Plotly validates the spec once
+    return go.Figure({
+        'data': [{
+            'type': 'scatterpolar',
+            # Close the radar chart by repeating the first value
+            'r': (security, financial, operational, market, security),
+            'theta': _THETA_CLOSED,
+            'fill': 'toself',
+            'fillcolor': fill_color,
+            'line': {'color': line_color, 'width': 2},
+            'name': 'Risk Scores',
+            'hovertemplate': _HOVER_TEMPLATE
+        }],
+        'layout': _RADAR_LAYOUT
+    })
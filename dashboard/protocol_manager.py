@@ -3,23 +3,217 @@ Protocol Manager for Risk Dashboard.
 Manages protocol configurations and coordinates data fetching from multiple sources.
 """
 
-import json
+import copy
 import logging
 import os
-from typing import Dict, Any, List, Optional
+import threading
+from typing import Dict, Any, List, Mapping, Optional, Tuple
 from pathlib import Path
+from types import MappingProxyType
+
+import orjson
+from cachetools import LRUCache
 
 from api_clients.coingecko import CoinGeckoClient
 from api_clients.defillama import DefiLlamaClient
 from engine.risk_aggregator import RiskAggregator
-from adapters.ethereum import get_tech_facts
+from adapters.ethereum import get_tech_facts, get_tech_facts_batch
 from features.tech import build_tech_features
+from utils.cache import get_disk_cache
+from utils.http import get_session
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Risk categories in display order
+RISK_CATEGORIES = ('security', 'financial', 'operational', 'market')
+
+
+# Keys every protocols.json entry must define
+REQUIRED_FIELDS = frozenset({
+    'id', 'name', 'chain', 'contract_address', 'coingecko_id', 'defillama_slug'
+})
+
+# Values for optional protocols.json keys, filled in at load time
+PROTOCOL_DEFAULTS = {
+    'network': 'mainnet',
+    'category': 'Unknown'
+}
+
+# Scores reported for a protocol that failed to load
+_ERROR_SCORES = dict.fromkeys(('overall',) + RISK_CATEGORIES, 0)
+
+# Source names in the order they are reported in metadata['data_sources']
+_DATA_SOURCES = ('ethereum', 'coingecko', 'defillama')
+
+# Shared by every ProtocolManager for the per-protocol on-chain, market and TVL
+# fetches: enough for each get_all_protocols worker (MAX_FETCH_WORKERS = 8) to
+# have all three sources in flight
+_SOURCE_EXECUTOR = ThreadPoolExecutor(max_workers=24, thread_name_prefix="protocol-sources")
+
+# Stand-ins used when a source fails outright; shared, since RiskAggregator
+# only reads its inputs
+_DEFAULT_TECH_FEATURES = {
+    'verified': False,
+    'has_admin_key': False,
+    'has_supply_key': False,
+    'has_pause_key': False,
+    'has_freeze_key': False,
+    'has_wipe_key': False,
+    'has_kyc_key': False,
+    'has_fee_key': False,
+    'upgradeable': False
+}
+_DEFAULT_MARKET_DATA = {
+    'price': 0,
+    'market_cap': 0,
+    'volume_24h': 0,
+    'price_change_24h': 0,
+    'market_cap_rank': 999
+}
+_DEFAULT_TVL_DATA = {
+    'tvl': 0,
+    'tvl_change_24h': 0,
+    'chains': {}
+}
+# Stand-in used when risk aggregation fails
+_DEFAULT_RISK_ASSESSMENT = {
+    'overall_score': 0,
+    'risk_indicator': '⚠️ Data Unavailable',
+    'category_scores': {
+        'security': 0,
+        'financial': 0,
+        'operational': 0,
+        'market': 0
+    },
+    'reasons': {
+        'security': ['Data unavailable'],
+        'financial': ['Data unavailable'],
+        'operational': ['Data unavailable'],
+        'market': ['Data unavailable']
+    }
+}
+_SOURCE_DEFAULTS = {
+    'ethereum': _DEFAULT_TECH_FEATURES,
+    'coingecko': _DEFAULT_MARKET_DATA,
+    'defillama': _DEFAULT_TVL_DATA
+}
+
+
+
+def _top_risk_categories(category_scores: Dict[str, int], count: int = 2) -> Tuple[str, ...]:
+    """Categories with the lowest scores (highest risk) first, computed once per load."""
+    # Pack scores in category order once, then sort (index, score) pairs by score
+    scores = tuple(category_scores[category] for category in RISK_CATEGORIES)
+    ranked = sorted(enumerate(scores), key=itemgetter(1))[:count]
+    return tuple(RISK_CATEGORIES[index] for index, _ in ranked)
+
+
+
+def _display_fields(protocol_config: Mapping[str, Any]) -> Dict[str, str]:
+    """Display strings derived from a protocol's static configuration."""
+    address = protocol_config['contract_address']
+    return {
+        'chain_display': protocol_config['chain'].capitalize(),
+        'category_display': protocol_config['category'].capitalize(),
+        'contract_short': f"{address[:10]}...{address[-8:]}",
+        'explorer_url': f"https://etherscan.io/address/{address}"
+    }
+
+
+# (upper bound in seconds, seconds per unit, unit name) for data age strings
+_AGE_UNITS = (
+    (60, 1, 'second'),
+    (3600, 60, 'minute'),
+    (86400, 3600, 'hour'),
+    (float('inf'), 86400, 'day'),
+)
+
+
+@lru_cache(maxsize=256)
+def _format_age(age_seconds: int) -> str:
+    """Human-readable form of an age in seconds, e.g. "2 minutes ago"."""
+    for limit, unit_seconds, unit in _AGE_UNITS:
+        if age_seconds < limit:
+            count = age_seconds // unit_seconds
+            return f"{count} {unit}{'s' if count != 1 else ''} ago"
+
+
+@lru_cache(maxsize=8)
+def _parse_protocols_file(path: str, mtime_ns: int, size: int) -> Dict[str, Mapping[str, Any]]:
+    """
+    Parse and validate a protocols.json file.
+    
+    Memoized on (path, mtime_ns, size), so the file is only re-read when it
+    changes; mtime_ns and size are part of the key but unused otherwise.
+    
+    Args:
+        path: Absolute path of the configuration file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+        
+    Returns:
+        Dictionary mapping protocol IDs to their configurations
+        
+    Raises:
+        ValueError: If JSON is invalid or missing required fields
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = orjson.loads(f.read())
+    except orjson.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON in configuration file: {e}")
+    
+    # Validate structure
+    if 'protocols' not in data:
+        raise ValueError("Configuration must contain 'protocols' key")
+    
+    protocols_list = data['protocols']
+    
+    if not isinstance(protocols_list, list):
+        raise ValueError("'protocols' must be a list")
+    
+    if len(protocols_list) == 0:
+        raise ValueError("No protocols configured")
+    
+    # Convert list to dictionary keyed by protocol ID
+    protocols_dict = {}
+    for protocol in protocols_list:
+        # Validate required fields
+        missing_fields = REQUIRED_FIELDS.difference(protocol)
+        
+        if missing_fields:
+            logger.warning(
+                f"Protocol '{protocol.get('name', 'Unknown')}' missing fields: "
+                f"{sorted(missing_fields)}. Skipping."
+            )
+            continue
+        
+        invalid_fields = [field for field in REQUIRED_FIELDS if not isinstance(protocol[field], str)]
+        if invalid_fields:
+            logger.warning(
+                f"Protocol '{protocol['name']}' has non-string fields: "
+                f"{sorted(invalid_fields)}. Skipping."
+            )
+            continue
+        
+        # Fill optional fields once, and freeze the entry: parsed configs are
+        # shared by every manager through the lru_cache
+        protocol = MappingProxyType({**PROTOCOL_DEFAULTS, **protocol})
+        protocol_id = protocol['id']
+        protocols_dict[protocol_id] = protocol
+        logger.debug("Loaded protocol: %s - %s", protocol_id, protocol['name'])
+    
+    if len(protocols_dict) == 0:
+        raise ValueError("No valid protocols found in configuration")
+    
+    return protocols_dict
+
+
 class ProtocolManager:
     """
     Manages protocol configurations and coordinates data fetching.
@@ -35,13 +229,31 @@ class ProtocolManager:
     # Cache refresh interval in seconds (15 minutes)
     CACHE_REFRESH_INTERVAL = 900
     
-    def __init__(self, config_path: str = None):
+    # Protocol results kept in memory; least recently used are evicted first
+    CACHE_MAX_ENTRIES = 256
+    
+    # Disk cache namespace for persisted protocol results
+    DISK_CACHE_NAMESPACE = "protocol_risk"
+    
+    # Seconds a failed source is skipped before being retried
+    NEGATIVE_CACHE_TTL = 60
+    
+    # Protocols processed concurrently by get_all_protocols
+    MAX_FETCH_WORKERS = 8
+    
+    def __init__(self, config_path: str = None,
+                 coingecko_client: Optional[CoinGeckoClient] = None,
+                 defillama_client: Optional[DefiLlamaClient] = None,
+                 risk_aggregator: Optional[RiskAggregator] = None):
         """
         Initialize the Protocol Manager.
         
         Args:
             config_path: Path to protocols.json configuration file.
                         Defaults to 'dashboard/protocols.json'
+            coingecko_client: Shared CoinGecko client; a new one is created if omitted
+            defillama_client: Shared DeFi Llama client; a new one is created if omitted
+            risk_aggregator: Shared RiskAggregator; a new one is created if omitted
         
         Raises:
             FileNotFoundError: If configuration file doesn't exist
@@ -55,26 +267,48 @@ class ProtocolManager:
         
         # Load protocol configurations
         self.protocols = self._load_protocol_configs()
+        # (protocol_id, config) pairs in configuration order, for iteration without
+        # re-indexing self.protocols; rebuild if protocols are ever added or removed
+        self._protocols_items = tuple(self.protocols.items())
+        # Per-protocol display strings; the configs never change, so build them once
+        self._display = {
+            protocol_id: _display_fields(config) for protocol_id, config in self.protocols.items()
+        }
         logger.info(f"Loaded {len(self.protocols)} protocol configurations")
         
         # Initialize API clients
-        self.coingecko_client = CoinGeckoClient()
-        self.defillama_client = DefiLlamaClient()
+        # Clients created here share the process-wide keep-alive session
+        self.coingecko_client = coingecko_client or CoinGeckoClient(session=get_session())
+        self.defillama_client = defillama_client or DefiLlamaClient(session=get_session())
         logger.info("Initialized API clients: CoinGecko, DeFi Llama")
         
         # Initialize risk aggregator
-        self.risk_aggregator = RiskAggregator()
+        self.risk_aggregator = risk_aggregator or RiskAggregator()
         logger.info("Initialized RiskAggregator")
         
         # Initialize protocol data cache
-        # Structure: {protocol_id: {data: dict, timestamp: int}}
-        self._protocol_cache = {}
+        # Structure: {protocol_id: {data: dict, bytes: Optional[bytes], timestamp: float (time.monotonic())}}
+        self._protocol_cache = LRUCache(maxsize=self.CACHE_MAX_ENTRIES)
+        # Last failure time per (protocol_id, source), so failing APIs aren't retried
+        # on every request
+        self._api_neg_cache = {}
+        # Written from get_all_protocols' worker threads
+        self._cache_lock = threading.Lock()
+        # protocol_id -> (serialized scoring inputs, risk assessment) from the last fetch,
+        # so a refetch that returns unchanged data skips aggregation; guarded by _cache_lock
+        self._last_assessment: Dict[str, Tuple[bytes, Dict[str, Any]]] = {}
+        
+        # protocol_id -> Future of the fetch currently running for it
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
         logger.info("Initialized protocol data cache")
     
-    def _load_protocol_configs(self) -> Dict[str, Dict[str, Any]]:
+    def _load_protocol_configs(self) -> Dict[str, Mapping[str, Any]]:
         """
         Load protocol configurations from JSON file.
         
+        The parsed file is shared between managers until it changes on disk.
+        
         Returns:
             Dictionary mapping protocol IDs to their configurations
             
@@ -90,54 +324,16 @@ class ProtocolManager:
                     f"Protocol configuration file not found: {self.config_path}"
                 )
             
-            with open(config_file, 'r') as f:
-                data = json.load(f)
+            stat = config_file.stat()
+            return dict(_parse_protocols_file(
+                str(config_file.resolve()), stat.st_mtime_ns, stat.st_size
+            ))
             
-            # Validate structure
-            if 'protocols' not in data:
-                raise ValueError("Configuration must contain 'protocols' key")
-            
-            protocols_list = data['protocols']
-            
-            if not isinstance(protocols_list, list):
-                raise ValueError("'protocols' must be a list")
-            
-            if len(protocols_list) == 0:
-                raise ValueError("No protocols configured")
-            
-            # Convert list to dictionary keyed by protocol ID
-            protocols_dict = {}
-            for protocol in protocols_list:
-                # Validate required fields
-                required_fields = ['id', 'name', 'chain', 'contract_address', 
-                                 'coingecko_id', 'defillama_slug']
-                
-                missing_fields = [field for field in required_fields 
-                                if field not in protocol]
-                
-                if missing_fields:
-                    logger.warning(
-                        f"Protocol '{protocol.get('name', 'Unknown')}' missing fields: "
-                        f"{missing_fields}. Skipping."
-                    )
-                    continue
-                
-                protocol_id = protocol['id']
-                protocols_dict[protocol_id] = protocol
-                logger.debug(f"Loaded protocol: {protocol_id} - {protocol['name']}")
-            
-            if len(protocols_dict) == 0:
-                raise ValueError("No valid protocols found in configuration")
-            
-            return protocols_dict
-            
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON in configuration file: {e}")
         except Exception as e:
             logger.error(f"Error loading protocol configurations: {e}")
             raise
     
-    def get_protocol_config(self, protocol_id: str) -> Optional[Dict[str, Any]]:
+    def get_protocol_config(self, protocol_id: str) -> Optional[Mapping[str, Any]]:
         """
         Get configuration for a specific protocol.
         
@@ -145,16 +341,16 @@ class ProtocolManager:
             protocol_id: Protocol identifier
             
         Returns:
-            Protocol configuration dictionary or None if not found
+            Read-only protocol configuration mapping or None if not found
         """
         return self.protocols.get(protocol_id)
     
-    def list_protocols(self) -> List[Dict[str, Any]]:
+    def list_protocols(self) -> List[Mapping[str, Any]]:
         """
         Get list of all configured protocols.
         
         Returns:
-            List of protocol configuration dictionaries
+            List of read-only protocol configuration mappings
         """
         return list(self.protocols.values())
     
@@ -167,6 +363,42 @@ class ProtocolManager:
         """
         return list(self.protocols.keys())
     
+    def _lookup_cache(self, protocol_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a protocol's valid cache entry from memory, or else from the disk cache.
+        
+        A disk hit (e.g. after a restart) is promoted into memory, backdated so
+        it expires at the same time as the disk copy.
+        
+        Args:
+            protocol_id: Protocol identifier
+            
+        Returns:
+            Cache entry dict, or None if neither cache holds valid data
+        """
+        with self._cache_lock:
+            cache_entry = self._protocol_cache.get(protocol_id)
+        if cache_entry is not None and time.monotonic() - cache_entry['timestamp'] < self.CACHE_REFRESH_INTERVAL:
+            return cache_entry
+        
+        disk = get_disk_cache()
+        if disk is None:
+            return None
+        data, expires = disk.get_with_expiry(self.DISK_CACHE_NAMESPACE, protocol_id)
+        if data is None:
+            return None
+        
+        remaining = expires - time.time()
+        cache_entry = {
+            'data': data,
+            'bytes': None,
+            'timestamp': time.monotonic() - (self.CACHE_REFRESH_INTERVAL - remaining)
+        }
+        with self._cache_lock:
+            self._protocol_cache[protocol_id] = cache_entry
+        logger.debug("Loaded cached data for protocol %s from disk", protocol_id)
+        return cache_entry
+    
     def _is_cache_valid(self, protocol_id: str) -> bool:
         """
         Check if cached data for a protocol is still valid.
@@ -177,13 +409,7 @@ class ProtocolManager:
         Returns:
             True if cache exists and is within refresh interval, False otherwise
         """
-        if protocol_id not in self._protocol_cache:
-            return False
-        
-        cache_entry = self._protocol_cache[protocol_id]
-        cache_age = time.time() - cache_entry['timestamp']
-        
-        return cache_age < self.CACHE_REFRESH_INTERVAL
+        return self._lookup_cache(protocol_id) is not None
     
     def _get_cached_data(self, protocol_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -195,54 +421,163 @@ class ProtocolManager:
         Returns:
             Cached protocol data or None if cache is invalid
         """
-        if self._is_cache_valid(protocol_id):
-            logger.info(f"Using cached data for protocol: {protocol_id}")
-            return self._protocol_cache[protocol_id]['data']
+        cache_entry = self._lookup_cache(protocol_id)
+        if cache_entry is None:
+            return None
+        
+        logger.debug("Using cached data for protocol: %s", protocol_id)
+        return cache_entry['data']
+    
+    def _recently_failed(self, protocol_id: str, source: str) -> bool:
+        """
+        Check whether a source failed for a protocol within NEGATIVE_CACHE_TTL.
+        
+        Args:
+            protocol_id: Protocol identifier
+            source: Data source name ('ethereum', 'coingecko' or 'defillama')
+            
+        Returns:
+            True if the source should be skipped for now
+        """
+        with self._cache_lock:
+            failed_at = self._api_neg_cache.get((protocol_id, source))
+        return failed_at is not None and time.monotonic() - failed_at < self.NEGATIVE_CACHE_TTL
+    
+    def _record_source_result(self, protocol_id: str, source: str, succeeded: bool) -> None:
+        """
+        Remember a source failure for a protocol, or forget it after a success.
         
-        return None
+        Args:
+            protocol_id: Protocol identifier
+            source: Data source name
+            succeeded: Whether the fetch returned usable data
+        """
+        with self._cache_lock:
+            if succeeded:
+                self._api_neg_cache.pop((protocol_id, source), None)
+            else:
+                self._api_neg_cache[(protocol_id, source)] = time.monotonic()
     
     def _cache_protocol_data(self, protocol_id: str, data: Dict[str, Any]) -> None:
         """
-        Cache protocol data with current timestamp.
+        Cache protocol data with current timestamp, in memory and on disk.
         
         Args:
             protocol_id: Protocol identifier
             data: Protocol risk data to cache
         """
-        self._protocol_cache[protocol_id] = {
-            'data': data,
-            'timestamp': time.time()
-        }
-        logger.debug(f"Cached data for protocol: {protocol_id}")
+        with self._cache_lock:
+            self._protocol_cache[protocol_id] = {
+                'data': data,
+                # JSON encoding of data, filled in on first get_protocol_risk_data_bytes call
+                'bytes': None,
+                'timestamp': time.monotonic()
+            }
+        # Written through to disk so a restarted dashboard starts warm
+        disk = get_disk_cache()
+        if disk is not None:
+            disk.set(self.DISK_CACHE_NAMESPACE, protocol_id, data, self.CACHE_REFRESH_INTERVAL)
+        logger.debug("Cached data for protocol: %s", protocol_id)
     
     @staticmethod
-    def format_data_age(timestamp: int) -> str:
+    def format_data_age(timestamp: int, now: Optional[float] = None) -> str:
         """
         Format data age in human-readable format.
         
         Args:
             timestamp: Unix timestamp of last update
+            now: Current Unix time; read from the clock if omitted, so callers
+                 formatting several ages can read it once
             
         Returns:
             Human-readable string like "2 minutes ago", "1 hour ago", etc.
         """
-        age_seconds = int(time.time() - timestamp)
-        
-        if age_seconds < 60:
-            return f"{age_seconds} second{'s' if age_seconds != 1 else ''} ago"
+        if now is None:
+            now = time.time()
+        age_seconds = int(now - timestamp)
+        # Past the first minute only whole minutes are shown, so ages share cache entries
+        if age_seconds >= 60:
+            age_seconds -= age_seconds % 60
+        return _format_age(age_seconds)
+    
+    def _fetch_tech(self, protocol_config: Mapping[str, Any]) -> Tuple[Dict[str, Any], Optional[str], Optional[str]]:
+        """
+        Fetch on-chain data and build tech features for a protocol.
         
-        age_minutes = age_seconds // 60
-        if age_minutes < 60:
-            return f"{age_minutes} minute{'s' if age_minutes != 1 else ''} ago"
+        Args:
+            protocol_config: Protocol configuration
+            
+        Returns:
+            Tuple of (tech features, source name or None, failure string or None)
+        """
+        network = protocol_config['network']
+        try:
+            logger.debug("Fetching on-chain data for %s", protocol_config['contract_address'])
+            tech_facts = get_tech_facts(protocol_config['contract_address'], network)
+            tech_features = build_tech_features(tech_facts, protocol_config['chain'], network)
+            logger.debug("✓ On-chain data fetched successfully")
+            return tech_features, 'ethereum', None
+        except Exception as e:
+            logger.error(f"Failed to fetch on-chain data: {e}")
+            return _DEFAULT_TECH_FEATURES, None, f"ethereum: {str(e)}"
+    
+    def _fetch_market(self, protocol_config: Mapping[str, Any],
+                      prefetched: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, Any], Optional[str], Optional[str]]:
+        """
+        Fetch market data for a protocol from CoinGecko.
         
-        age_hours = age_minutes // 60
-        if age_hours < 24:
-            return f"{age_hours} hour{'s' if age_hours != 1 else ''} ago"
+        Args:
+            protocol_config: Protocol configuration
+            prefetched: Already fetched token data; used instead of a request if given
+            
+        Returns:
+            Tuple of (market data, source name or None, failure string or None)
+        """
+        try:
+            if prefetched is not None:
+                market_data = prefetched
+            else:
+                logger.debug("Fetching market data for %s", protocol_config['coingecko_id'])
+                market_data = self.coingecko_client.get_token_data(protocol_config['coingecko_id'])
+            if 'error' in market_data:
+                logger.warning(f"CoinGecko returned error: {market_data['error']}")
+                return market_data, None, f"coingecko: {market_data['error']}"
+            logger.debug("✓ Market data fetched successfully")
+            return market_data, 'coingecko', None
+        except Exception as e:
+            logger.error(f"Failed to fetch market data: {e}")
+            return _DEFAULT_MARKET_DATA, None, f"coingecko: {str(e)}"
+    
+    def _fetch_tvl(self, protocol_config: Mapping[str, Any],
+                   prefetched: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, Any], Optional[str], Optional[str]]:
+        """
+        Fetch TVL data for a protocol from DeFi Llama.
         
-        age_days = age_hours // 24
-        return f"{age_days} day{'s' if age_days != 1 else ''} ago"
+        Args:
+            protocol_config: Protocol configuration
+            prefetched: Already fetched TVL data; used instead of a request if given
+            
+        Returns:
+            Tuple of (TVL data, source name or None, failure string or None)
+        """
+        try:
+            if prefetched is not None:
+                tvl_data = prefetched
+            else:
+                logger.debug("Fetching TVL data for %s", protocol_config['defillama_slug'])
+                tvl_data = self.defillama_client.get_protocol_tvl(protocol_config['defillama_slug'])
+            if 'error' in tvl_data:
+                logger.warning(f"DeFi Llama returned error: {tvl_data['error']}")
+                return tvl_data, None, f"defillama: {tvl_data['error']}"
+            logger.debug("✓ TVL data fetched successfully")
+            return tvl_data, 'defillama', None
+        except Exception as e:
+            logger.error(f"Failed to fetch TVL data: {e}")
+            return _DEFAULT_TVL_DATA, None, f"defillama: {str(e)}"
     
-    def get_protocol_risk_data(self, protocol_id: str, force_refresh: bool = False) -> Dict[str, Any]:
+    def get_protocol_risk_data(self, protocol_id: str, force_refresh: bool = False,
+                               market_data: Optional[Dict[str, Any]] = None,
+                               tvl_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Fetch and aggregate all risk data for a protocol.
         
@@ -258,6 +593,9 @@ class ProtocolManager:
         Args:
             protocol_id: Protocol identifier
             force_refresh: If True, bypass cache and fetch fresh data
+            market_data: Pre-fetched CoinGecko token data (e.g. from a batched
+                get_tokens_data call); fetched individually if None
+            tvl_data: Pre-fetched DeFi Llama TVL data; fetched individually if None
             
         Returns:
             Dictionary with comprehensive risk assessment:
@@ -301,123 +639,130 @@ class ProtocolManager:
         if not force_refresh:
             cached_data = self._get_cached_data(protocol_id)
             if cached_data is not None:
-                # Add cache status to metadata
-                cached_data['metadata']['cache_status'] = 'cached'
+                # Add cache status to metadata; bytes encoded under the old
+                # status are dropped so get_protocol_risk_data_bytes agrees
+                with self._cache_lock:
+                    if cached_data['metadata']['cache_status'] != 'cached':
+                        cached_data['metadata']['cache_status'] = 'cached'
+                        cache_entry = self._protocol_cache.get(protocol_id)
+                        if cache_entry is not None and cache_entry['data'] is cached_data:
+                            cache_entry['bytes'] = None
                 return cached_data
         
-        logger.info(f"Fetching risk data for protocol: {protocol_id} ({protocol_config['name']})")
-        
-        # Track data sources and failures
-        data_sources = []
-        api_failures = []
-        
-        # Initialize data containers with defaults
-        tech_features = {}
-        market_data = {}
-        tvl_data = {}
+        # Single flight: concurrent callers for the same protocol wait for the
+        # first one's fetch instead of repeating it
+        with self._inflight_lock:
+            inflight = self._inflight.get(protocol_id)
+            if inflight is None:
+                future = self._inflight[protocol_id] = Future()
+        if inflight is not None:
+            logger.debug("Waiting for in-flight fetch of %s", protocol_id)
+            return inflight.result()
         
-        # 1. Fetch on-chain data using Ethereum adapter
         try:
-            logger.info(f"Fetching on-chain data for {protocol_config['contract_address']}")
-            tech_facts = get_tech_facts(
-                protocol_config['contract_address'],
-                protocol_config.get('network', 'mainnet')
-            )
-            tech_features = build_tech_features(
-                tech_facts,
-                protocol_config['chain'],
-                protocol_config.get('network', 'mainnet')
-            )
-            data_sources.append('ethereum')
-            logger.info(f"✓ On-chain data fetched successfully")
-        except Exception as e:
-            logger.error(f"Failed to fetch on-chain data: {e}")
-            api_failures.append(f"ethereum: {str(e)}")
-            # Provide default tech features
-            tech_features = {
-                'verified': False,
-                'has_admin_key': False,
-                'has_supply_key': False,
-                'has_pause_key': False,
-                'has_freeze_key': False,
-                'has_wipe_key': False,
-                'has_kyc_key': False,
-                'has_fee_key': False,
-                'upgradeable': False
-            }
+            result = self._fetch_protocol_risk_data(protocol_id, protocol_config, market_data, tvl_data)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                del self._inflight[protocol_id]
+    
+    def _fetch_protocol_risk_data(self, protocol_id: str, protocol_config: Mapping[str, Any],
+                                  market_data: Optional[Dict[str, Any]],
+                                  tvl_data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Fetch all sources, score them and cache the result (no cache lookup).
         
-        # 2. Fetch market data from CoinGecko
-        try:
-            logger.info(f"Fetching market data for {protocol_config['coingecko_id']}")
-            market_data = self.coingecko_client.get_token_data(protocol_config['coingecko_id'])
-            if 'error' not in market_data:
-                data_sources.append('coingecko')
-                logger.info(f"✓ Market data fetched successfully")
+        Args:
+            protocol_id: Protocol identifier
+            protocol_config: Protocol configuration
+            market_data: Pre-fetched CoinGecko token data, or None to fetch it
+            tvl_data: Pre-fetched DeFi Llama TVL data, or None to fetch it
+            
+        Returns:
+            Protocol risk data, as described in get_protocol_risk_data
+        """
+        logger.debug("Fetching risk data for protocol: %s (%s)", protocol_id, protocol_config['name'])
+        # Wall-clock time recorded as the data's last_updated
+        fetched_at = int(time.time())
+        
+        # The three sources are independent, so fetch them concurrently;
+        # results are gathered in a fixed order to keep data_sources stable
+        calls = (
+            (self._fetch_tech, (protocol_config,), None),
+            (self._fetch_market, (protocol_config, market_data), market_data),
+            (self._fetch_tvl, (protocol_config, tvl_data), tvl_data),
+        )
+        futures = []
+        for source, (fetch, args, prefetched) in zip(_DATA_SOURCES, calls):
+            if prefetched is not None:
+                # Already fetched, only checked for errors; no thread needed
+                future = Future()
+                future.set_result(fetch(*args))
+                futures.append(future)
+            elif self._recently_failed(protocol_id, source):
+                # Don't hit a source that just failed (e.g. rate limited) again
+                futures.append(None)
             else:
-                api_failures.append(f"coingecko: {market_data['error']}")
-                logger.warning(f"CoinGecko returned error: {market_data['error']}")
-        except Exception as e:
-            logger.error(f"Failed to fetch market data: {e}")
-            api_failures.append(f"coingecko: {str(e)}")
-            # Provide default market data
-            market_data = {
-                'price': 0,
-                'market_cap': 0,
-                'volume_24h': 0,
-                'price_change_24h': 0,
-                'market_cap_rank': 999
-            }
+                futures.append(_SOURCE_EXECUTOR.submit(fetch, *args))
         
-        # 3. Fetch TVL data from DeFi Llama
-        try:
-            logger.info(f"Fetching TVL data for {protocol_config['defillama_slug']}")
-            tvl_data = self.defillama_client.get_protocol_tvl(protocol_config['defillama_slug'])
-            if 'error' not in tvl_data:
-                data_sources.append('defillama')
-                logger.info(f"✓ TVL data fetched successfully")
+        data_sources = []
+        api_failures = []
+        fetched = []
+        for source, future in zip(_DATA_SOURCES, futures):
+            if future is None:
+                logger.debug("Skipping %s for %s: failed within the last %ss",
+                             source, protocol_id, self.NEGATIVE_CACHE_TTL)
+                data, ok_source, failure = (
+                    _SOURCE_DEFAULTS[source], None, f"{source}: skipped after recent failure"
+                )
             else:
-                api_failures.append(f"defillama: {tvl_data['error']}")
-                logger.warning(f"DeFi Llama returned error: {tvl_data['error']}")
-        except Exception as e:
-            logger.error(f"Failed to fetch TVL data: {e}")
-            api_failures.append(f"defillama: {str(e)}")
-            # Provide default TVL data
-            tvl_data = {
-                'tvl': 0,
-                'tvl_change_24h': 0,
-                'chains': {}
-            }
+                try:
+                    data, ok_source, failure = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to fetch {source} data: {e}")
+                    data, ok_source, failure = _SOURCE_DEFAULTS[source], None, f"{source}: {str(e)}"
+                self._record_source_result(protocol_id, source, failure is None)
+            if ok_source:
+                data_sources.append(ok_source)
+            if failure:
+                api_failures.append(failure)
+            fetched.append(data)
+        tech_features, market_data, tvl_data = fetched
         
-        # 4. Calculate risk scores using RiskAggregator
-        logger.info("Calculating risk scores...")
+        # 4. Calculate risk scores using RiskAggregator, unless the sources returned
+        # exactly what they did last time (e.g. a forced refresh before upstream moved)
         try:
-            risk_assessment = self.risk_aggregator.aggregate_risk(
-                tech_features=tech_features,
-                tvl_data=tvl_data,
-                market_data=market_data,
-                protocol_data=protocol_config,
-                audit_data=None  # Placeholder for MVP
-            )
-            logger.info(f"✓ Risk scores calculated: Overall={risk_assessment['overall_score']}")
-        except Exception as e:
-            logger.error(f"Failed to calculate risk scores: {e}")
-            # Provide default risk assessment
-            risk_assessment = {
-                'overall_score': 0,
-                'risk_indicator': '⚠️ Data Unavailable',
-                'category_scores': {
-                    'security': 0,
-                    'financial': 0,
-                    'operational': 0,
-                    'market': 0
-                },
-                'reasons': {
-                    'security': ['Data unavailable'],
-                    'financial': ['Data unavailable'],
-                    'operational': ['Data unavailable'],
-                    'market': ['Data unavailable']
-                }
-            }
+            fingerprint = orjson.dumps(fetched, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            fingerprint = None
+        with self._cache_lock:
+            last = self._last_assessment.get(protocol_id)
+        if fingerprint is not None and last is not None and last[0] == fingerprint:
+            logger.debug("Inputs unchanged for %s, reusing risk scores", protocol_id)
+            risk_assessment = last[1]
+        else:
+            logger.debug("Calculating risk scores...")
+            try:
+                risk_assessment = self.risk_aggregator.aggregate_risk(
+                    tech_features=tech_features,
+                    tvl_data=tvl_data,
+                    market_data=market_data,
+                    protocol_data=protocol_config,
+                    audit_data=None  # Placeholder for MVP
+                )
+                logger.debug("✓ Risk scores calculated: Overall=%s", risk_assessment['overall_score'])
+                if fingerprint is not None:
+                    with self._cache_lock:
+                        self._last_assessment[protocol_id] = (fingerprint, risk_assessment)
+            except Exception as e:
+                logger.error(f"Failed to calculate risk scores: {e}")
+                # Provide default risk assessment
+                risk_assessment = copy.deepcopy(_DEFAULT_RISK_ASSESSMENT)
         
         # 5. Determine data availability status
         if len(data_sources) == 3:
@@ -428,23 +773,21 @@ class ProtocolManager:
             data_availability = 'unavailable'
         
         # Construct final result
+        category_scores = risk_assessment['category_scores']
         result = {
             'protocol_id': protocol_id,
             'name': protocol_config['name'],
             'contract_address': protocol_config['contract_address'],
             'chain': protocol_config['chain'],
-            'category': protocol_config.get('category', 'Unknown'),
-            'scores': {
-                'overall': risk_assessment['overall_score'],
-                'security': risk_assessment['category_scores']['security'],
-                'financial': risk_assessment['category_scores']['financial'],
-                'operational': risk_assessment['category_scores']['operational'],
-                'market': risk_assessment['category_scores']['market']
-            },
+            'category': protocol_config['category'],
+            **self._display[protocol_id],
+            # category_scores holds exactly the four RISK_CATEGORIES keys
+            'scores': {'overall': risk_assessment['overall_score'], **category_scores},
             'risk_indicator': risk_assessment['risk_indicator'],
             'reasons': risk_assessment['reasons'],
+            'sorted_risk_keys': _top_risk_categories(category_scores),
             'metadata': {
-                'last_updated': int(time.time()),
+                'last_updated': fetched_at,
                 'data_sources': data_sources,
                 'data_availability': data_availability,
                 'api_failures': api_failures,
@@ -455,14 +798,41 @@ class ProtocolManager:
         # Cache the result
         self._cache_protocol_data(protocol_id, result)
         
-        logger.info(f"✓ Risk data aggregation complete for {protocol_id}")
-        logger.info(f"  Data availability: {data_availability}")
-        logger.info(f"  Data sources: {', '.join(data_sources)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("✓ Risk data aggregation complete for %s", protocol_id)
+            logger.debug("  Data availability: %s", data_availability)
+            logger.debug("  Data sources: %s", ', '.join(data_sources))
         if api_failures:
             logger.warning(f"  API failures: {len(api_failures)}")
         
         return result
     
+    def get_protocol_risk_data_bytes(self, protocol_id: str, force_refresh: bool = False) -> bytes:
+        """
+        Protocol risk data serialized as JSON, for handlers that send it as-is.
+        
+        The encoding is done once per cache entry and reused until the entry is
+        replaced, so repeated requests skip re-serializing the whole dict.
+        
+        Args:
+            protocol_id: Protocol identifier
+            force_refresh: If True, bypass cache and fetch fresh data
+            
+        Returns:
+            UTF-8 JSON bytes of the get_protocol_risk_data result
+            
+        Raises:
+            ValueError: If protocol_id is not found
+        """
+        data = self.get_protocol_risk_data(protocol_id, force_refresh=force_refresh)
+        with self._cache_lock:
+            cache_entry = self._protocol_cache.get(protocol_id)
+            if cache_entry is not None and cache_entry['data'] is data:
+                if cache_entry['bytes'] is None:
+                    cache_entry['bytes'] = orjson.dumps(data)
+                return cache_entry['bytes']
+        return orjson.dumps(data)
+    
     def refresh_protocol_data(self, protocol_id: str) -> Dict[str, Any]:
         """
         Force refresh of protocol data, bypassing cache.
@@ -482,14 +852,36 @@ class ProtocolManager:
         logger.info(f"Force refreshing data for protocol: {protocol_id}")
         return self.get_protocol_risk_data(protocol_id, force_refresh=True)
     
+    def warm_caches(self) -> None:
+        """
+        Prefetch market, TVL and on-chain data for every configured protocol.
+        
+        Only the process-wide API and verification caches are filled (not this
+        manager's risk data cache), so any session's next get_all_protocols
+        call is served from cache instead of the network.
+        """
+        configs = self.list_protocols()
+        logger.info("Warming API caches for %d protocols", len(configs))
+        self.coingecko_client.get_tokens_data([config['coingecko_id'] for config in configs])
+        self.defillama_client.get_protocols_tvl([config['defillama_slug'] for config in configs])
+        
+        addresses_by_network = {}
+        for config in configs:
+            addresses_by_network.setdefault(config['network'], []).append(
+                config['contract_address'])
+        for network, addresses in addresses_by_network.items():
+            get_tech_facts_batch(addresses, network)
+    
     def get_all_protocols(self, force_refresh: bool = False) -> List[Dict[str, Any]]:
         """
         Fetch risk data for all configured protocols.
         
-        This method fetches data for all protocols sequentially, handling
+        This method fetches data for all protocols concurrently, handling
         individual protocol failures without blocking others. Each protocol
         is processed independently, so if one fails, the others will still
-        be returned.
+        be returned. Market data for all protocols being refreshed is fetched
+        up front in a single batched CoinGecko request, and TVL data with
+        concurrent DeFi Llama requests.
         
         Args:
             force_refresh: If True, bypass cache and fetch fresh data for all protocols
@@ -506,43 +898,54 @@ class ProtocolManager:
             ...     print(f"{protocol['name']}: {protocol['scores']['overall']}")
         """
         logger.info(f"Fetching risk data for all {len(self.protocols)} protocols...")
+        started_at = int(time.time())
+        
+        # Fetch market and TVL data for every protocol that needs refreshing up front:
+        # one batched CoinGecko request and concurrent DeFi Llama requests
+        stale_configs = [
+            protocol_config for protocol_id, protocol_config in self._protocols_items
+            if force_refresh or not self._is_cache_valid(protocol_id)
+        ]
+        market_data_by_coin = {}
+        tvl_data_by_slug = {}
+        if stale_configs:
+            market_data_by_coin = self.coingecko_client.get_tokens_data(
+                [protocol_config['coingecko_id'] for protocol_config in stale_configs]
+            )
+            tvl_data_by_slug = self.defillama_client.get_protocols_tvl(
+                [protocol_config['defillama_slug'] for protocol_config in stale_configs]
+            )
         
-        results = []
-        successful_count = 0
-        failed_count = 0
+        # Bound once rather than looked up on every worker call
+        fetch = self.get_protocol_risk_data
+        market_data_for = market_data_by_coin.get
+        tvl_data_for = tvl_data_by_slug.get
+        display = self._display
         
-        # Process each protocol sequentially
-        for protocol_id in self.protocols.keys():
+        def load_protocol(protocol_id: str, protocol_config: Mapping[str, Any]) -> Dict[str, Any]:
             try:
-                logger.info(f"Processing protocol {successful_count + failed_count + 1}/{len(self.protocols)}: {protocol_id}")
-                
-                # Fetch protocol risk data
-                protocol_data = self.get_protocol_risk_data(protocol_id, force_refresh=force_refresh)
-                results.append(protocol_data)
-                successful_count += 1
-                
-                logger.info(f"✓ Successfully loaded {protocol_id}")
+                protocol_data = fetch(
+                    protocol_id,
+                    force_refresh=force_refresh,
+                    market_data=market_data_for(protocol_config['coingecko_id']),
+                    tvl_data=tvl_data_for(protocol_config['defillama_slug'])
+                )
+                logger.debug("✓ Successfully loaded %s", protocol_id)
+                return protocol_data
                 
             except Exception as e:
                 # Log the error but continue with other protocols
                 logger.error(f"✗ Failed to load protocol '{protocol_id}': {e}")
-                failed_count += 1
                 
                 # Create error entry for this protocol
-                protocol_config = self.protocols[protocol_id]
-                error_entry = {
+                return {
                     'protocol_id': protocol_id,
-                    'name': protocol_config.get('name', 'Unknown'),
-                    'contract_address': protocol_config.get('contract_address', ''),
-                    'chain': protocol_config.get('chain', 'Unknown'),
-                    'category': protocol_config.get('category', 'Unknown'),
-                    'scores': {
-                        'overall': 0,
-                        'security': 0,
-                        'financial': 0,
-                        'operational': 0,
-                        'market': 0
-                    },
+                    'name': protocol_config['name'],
+                    'contract_address': protocol_config['contract_address'],
+                    'chain': protocol_config['chain'],
+                    'category': protocol_config['category'],
+                    **display[protocol_id],
+                    'scores': dict(_ERROR_SCORES),
                     'risk_indicator': '❌ Error',
                     'reasons': {
                         'security': [f'Failed to load: {str(e)}'],
@@ -550,15 +953,23 @@ class ProtocolManager:
                         'operational': [],
                         'market': []
                     },
+                    'sorted_risk_keys': RISK_CATEGORIES[:2],
                     'metadata': {
-                        'last_updated': int(time.time()),
+                        'last_updated': started_at,
                         'data_sources': [],
                         'data_availability': 'unavailable',
                         'api_failures': [f'protocol_load_error: {str(e)}'],
                         'cache_status': 'error'
                     }
                 }
-                results.append(error_entry)
+        
+        # Process protocols concurrently; results keep configuration order
+        workers = max(1, min(self.MAX_FETCH_WORKERS, len(self.protocols)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="protocols") as pool:
+            results = list(pool.map(load_protocol, *zip(*self._protocols_items)))
+        
+        failed_count = sum(1 for r in results if r['metadata']['cache_status'] == 'error')
+        successful_count = len(results) - failed_count
         
         # Log summary
         logger.info(f"Batch protocol fetch complete:")
@@ -571,6 +982,7 @@ class ProtocolManager:
 
 if __name__ == "__main__":
     """Test the ProtocolManager."""
+    logging.basicConfig(level=logging.INFO)
     print("Testing ProtocolManager...")
     
     try:
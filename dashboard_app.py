@@ -6,8 +6,10 @@ Main Streamlit application for the DeFi Protocol Risk Dashboard.
 import streamlit as st
 import logging
 from dashboard.protocol_manager import ProtocolManager
+from dashboard.clients import get_coingecko, get_defillama, get_risk_aggregator, start_cache_warmer
 from dashboard.components import (
     render_protocol_card,
+    render_protocol_table,
     render_protocol_detail,
     render_methodology_page
 )
@@ -33,35 +35,45 @@ if 'selected_protocol' not in st.session_state:
 
 if 'protocol_manager' not in st.session_state:
     try:
-        st.session_state.protocol_manager = ProtocolManager()
+        st.session_state.protocol_manager = ProtocolManager(
+            coingecko_client=get_coingecko(),
+            defillama_client=get_defillama(),
+            risk_aggregator=get_risk_aggregator()
+        )
         logger.info("ProtocolManager initialized successfully")
+        # Prefetch in the background so the first render hits warm caches
+        start_cache_warmer(st.session_state.protocol_manager)
     except Exception as e:
         st.error(f"Failed to initialize Protocol Manager: {e}")
         logger.error(f"Failed to initialize Protocol Manager: {e}")
         st.stop()
 
+def _set_view(view: str):
+    """Navigation callback; runs before the rerun, so the new view renders in the same run."""
+    st.session_state.current_view = view
+
+
 # Sidebar navigation
 with st.sidebar:
     st.title("🛡️ Risk Dashboard")
     st.markdown("---")
     
     # Navigation buttons
-    if st.button("📊 Dashboard", use_container_width=True):
-        st.session_state.current_view = 'list'
-        st.rerun()
+    st.button("📊 Dashboard", use_container_width=True, on_click=_set_view, args=('list',))
     
-    if st.button("📖 Methodology", use_container_width=True):
-        st.session_state.current_view = 'methodology'
-        st.rerun()
+    st.button("📖 Methodology", use_container_width=True, on_click=_set_view, args=('methodology',))
+    
+    # One table element instead of a card per protocol
+    st.toggle("Table view", key="table_view")
     
     st.markdown("---")
     
     # Refresh button
     if st.button("🔄 Refresh All Data", use_container_width=True):
         # Clear cache by forcing refresh
+        # The main view renders below in this same run, so no st.rerun() is needed
         st.cache_data.clear()
         st.success("Data refreshed!")
-        st.rerun()
     
     st.markdown("---")
     
@@ -91,9 +103,13 @@ def render_protocol_list():
         st.warning("No protocols configured. Please check your configuration.")
         return
     
-    # Display protocols in a grid layout (3 columns)
     st.markdown("---")
     
+    if st.session_state.get('table_view'):
+        render_protocol_table(protocols_data)
+        return
+    
+    # Display protocols in a grid layout (3 columns)
     # Create rows of 3 columns each
     num_protocols = len(protocols_data)
     num_cols = 3
@@ -3,8 +3,17 @@ Engine package for Hedera Technical Risk Scoring System.
 Contains scoring engines and combination logic.
 """
 
+import importlib
+
+# tech_baseline stays eager: the function shares its submodule's name, so a
+# lazy export would be shadowed by the module once anything imports it
 from .tech_baseline import tech_baseline, get_risk_category, explain_score
-from .combine import combine_scores, get_overall_assessment
+
+# Loaded on first access (PEP 562); the dashboard never needs them
+_LAZY_EXPORTS = {
+    "combine_scores": ".combine",
+    "get_overall_assessment": ".combine"
+}
 
 __all__ = [
     "tech_baseline",
@@ -12,4 +21,18 @@ __all__ = [
     "explain_score",
     "combine_scores",
     "get_overall_assessment"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
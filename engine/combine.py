@@ -3,9 +3,17 @@ Combined scoring module - placeholder for future market risk integration.
 Currently only passes through technical scores.
 """
 
+from bisect import bisect_right
 from typing import Dict, Any, Optional, Tuple, List
 
 
+# Lower bounds (score >= bound) of the High, Medium and Low risk bands; the
+# labels and colors below run from the riskiest band up
+_RISK_LEVEL_BOUNDS = (40, 60, 80)
+_RISK_LEVELS = ("Very High", "High", "Medium", "Low")
+_COLOR_CODES = ("red", "orange", "yellow", "green")
+
+
 def combine_scores(tech_score: int, 
                   tech_reasons: List[str],
                   market_score: Optional[int] = None,
@@ -70,48 +78,8 @@ def get_overall_assessment(combined_score: int,
         assessment["scoring_method"] = "combined-v1.0"
     
     # Risk categorization
-    if combined_score >= 80:
-        assessment["risk_level"] = "Low"
-        assessment["color_code"] = "green"
-    elif combined_score >= 60:
-        assessment["risk_level"] = "Medium"
-        assessment["color_code"] = "yellow"
-    elif combined_score >= 40:
-        assessment["risk_level"] = "High" 
-        assessment["color_code"] = "orange"
-    else:
-        assessment["risk_level"] = "Very High"
-        assessment["color_code"] = "red"
+    band = bisect_right(_RISK_LEVEL_BOUNDS, combined_score)
+    assessment["risk_level"] = _RISK_LEVELS[band]
+    assessment["color_code"] = _COLOR_CODES[band]
     
     return assessment
-
-
-if __name__ == "__main__":
-    # Test the combine module
-    print("Testing combine module (tech-only mode)...")
-    
-    # Test tech-only combination
-    tech_score = 61
-    tech_reasons = ["Admin key present", "Supply key present"]
-    
-    combined_score, combined_reasons = combine_scores(tech_score, tech_reasons)
-    print(f"Tech-only result: Score={combined_score}, Reasons={combined_reasons}")
-    
-    # Test overall assessment
-    assessment = get_overall_assessment(combined_score, combined_reasons, tech_score)
-    print(f"Assessment: {assessment}")
-    
-    # Test with mock market data (future functionality)
-    print("\\nTesting with mock market data...")
-    market_score = 70
-    market_reasons = ["Low liquidity", "High volatility"]
-    
-    combined_score2, combined_reasons2 = combine_scores(
-        tech_score, tech_reasons, market_score, market_reasons
-    )
-    print(f"Combined result: Score={combined_score2}, Reasons={combined_reasons2}")
-    
-    assessment2 = get_overall_assessment(combined_score2, combined_reasons2, tech_score, market_score)
-    print(f"Combined assessment: {assessment2}")
-    
-    print("\\nCombine module tests completed!")
\ No newline at end of file
@@ -4,10 +4,84 @@ Combines Security, Financial, Operational, and Market risk scores.
 """
 
 import logging
+from bisect import bisect_left, bisect_right
 from typing import Dict, Any, List, Tuple
 from engine.tech_baseline import tech_baseline
 
-logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# Threshold ladders as sorted bounds plus one (score delta, reason) rule per
+# tier; bisect_left counts the bounds strictly below a value, which matches
+# the original "value > bound" comparisons.
+
+# TVL in USD; reasons are formatted with the TVL divided by the given unit
+_TVL_BOUNDS = (10_000_000, 100_000_000, 1_000_000_000)
+_TVL_RULES = (
+    (-10, "Very low TVL: ${:.1f}M", 1e6),
+    (5, "Low TVL: ${:.0f}M", 1e6),
+    (15, "Moderate TVL: ${:.0f}M", 1e6),
+    (25, "High TVL: ${:.1f}B", 1e9),
+)
+
+# Absolute 24h price change in percent: below 5 is low, above 10 / 20 is
+# moderate / high, and 5-10 inclusive is neutral
+_VOLATILITY_BOUNDS = (10, 20)
+_VOLATILITY_RULES = (
+    (10, "Low volatility: {:.1f}% (24h)"),
+    (0, None),
+    (-5, "Moderate volatility: {:.1f}% (24h)"),
+    (-15, "High volatility: {:.1f}% (24h)"),
+)
+
+# Daily volume / market cap: below 1% is illiquid, above 10% highly liquid
+_LIQUIDITY_RULES = (
+    (-5, "Low liquidity"),
+    (0, None),
+    (10, "High liquidity"),
+)
+
+
+def _volatility_tier(price_change: float) -> int:
+    """Index into _VOLATILITY_RULES for an absolute 24h price change."""
+    return bisect_left(_VOLATILITY_BOUNDS, price_change) + (price_change >= 5)
+
+
+def _liquidity_tier(volume_ratio: float) -> int:
+    """Index into _LIQUIDITY_RULES for a volume / market cap ratio."""
+    return (volume_ratio >= 0.01) + (volume_ratio > 0.1)
+
+
+# Market cap rank (rank <= bound)
+_RANK_BOUNDS = (50, 100, 200)
+_RANK_RULES = (
+    (30, "Top 50 by market cap (#{})"),
+    (20, "Top 100 by market cap (#{})"),
+    (10, "Top 200 by market cap (#{})"),
+    (-10, "Lower market cap rank (#{})"),
+)
+
+# Number of chains with TVL
+_CHAIN_BOUNDS = (2, 5)
+_CHAIN_RULES = (
+    (0, None),
+    (5, "Multi-chain: {} chains"),
+    (15, "Multi-chain: {} chains"),
+)
+
+# Protocol categories with an established track record (operational bonus),
+# mapped to their reason, which never varies
+_ESTABLISHED_CATEGORY_REASONS = {
+    category: f"Established category: {category}" for category in ('Lending', 'DEX')
+}
+
+# Reasons reported per category
+MAX_REASONS = 3
+
+# Overall score bounds for the traffic light (score >= bound), and the
+# indicator for each band from high to low risk
+_INDICATOR_BOUNDS = (40, 70)
+_INDICATORS = ("🔴 High Risk", "🟡 Medium Risk", "🟢 Low Risk")
 
 
 class RiskAggregator:
@@ -21,6 +95,8 @@ class RiskAggregator:
     - Market (10%): Market position, adoption metrics
     """
     
+    __slots__ = ('_weights',)
+    
     # Weights for overall score calculation
     WEIGHTS = {
         'security': 0.40,
@@ -31,25 +107,13 @@ class RiskAggregator:
     
     def __init__(self):
         """Initialize the risk aggregator."""
-        pass
-    
-    def _normalize_score(self, score: float, min_val: float = 0, max_val: float = 100) -> int:
-        """
-        Normalize a score to 0-100 range.
-        
-        Args:
-            score: Raw score value
-            min_val: Minimum possible value
-            max_val: Maximum possible value
-            
-        Returns:
-            Normalized score between 0-100
-        """
-        if max_val == min_val:
-            return 50  # Default to middle if no range
-        
-        normalized = ((score - min_val) / (max_val - min_val)) * 100
-        return max(0, min(100, int(normalized)))
+        # WEIGHTS unpacked once, in (security, financial, operational, market) order
+        self._weights = (
+            self.WEIGHTS['security'],
+            self.WEIGHTS['financial'],
+            self.WEIGHTS['operational'],
+            self.WEIGHTS['market']
+        )
     
     def calculate_security_score(self, tech_features: Dict[str, Any], 
                                  audit_data: Dict[str, Any] = None) -> Tuple[int, List[str]]:
@@ -69,14 +133,15 @@ class RiskAggregator:
         # For MVP, security score is primarily based on tech_baseline
         # Future: Add audit status, bug bounty programs, etc.
         score = tech_score
-        reasons = tech_reasons.copy()
+        reasons = tech_reasons[:MAX_REASONS]
         
         # Placeholder for audit status (neutral for MVP)
         if audit_data and audit_data.get('audited', False):
             score = min(100, score + 5)
-            reasons.append("Contract audited")
+            if len(reasons) < MAX_REASONS:
+                reasons.append("Contract audited")
         
-        return score, reasons[:3]  # Max 3 reasons
+        return score, reasons
     
     def calculate_financial_score(self, tvl_data: Dict[str, Any], 
                                   market_data: Dict[str, Any]) -> Tuple[int, List[str]]:
@@ -95,47 +160,31 @@ class RiskAggregator:
         
         # TVL scoring (higher TVL = lower risk = higher score)
         tvl = tvl_data.get('tvl', 0)
-        if tvl > 1_000_000_000:  # > $1B
-            score += 25
-            reasons.append(f"High TVL: ${tvl/1e9:.1f}B")
-        elif tvl > 100_000_000:  # > $100M
-            score += 15
-            reasons.append(f"Moderate TVL: ${tvl/1e6:.0f}M")
-        elif tvl > 10_000_000:  # > $10M
-            score += 5
-            reasons.append(f"Low TVL: ${tvl/1e6:.0f}M")
-        else:
-            score -= 10
-            reasons.append(f"Very low TVL: ${tvl/1e6:.1f}M")
+        delta, reason, unit = _TVL_RULES[bisect_left(_TVL_BOUNDS, tvl)]
+        score += delta
+        reasons.append(reason.format(tvl / unit))
         
         # Price volatility scoring (lower volatility = lower risk = higher score)
         price_change_24h = abs(market_data.get('price_change_24h', 0))
-        if price_change_24h > 20:
-            score -= 15
-            reasons.append(f"High volatility: {price_change_24h:.1f}% (24h)")
-        elif price_change_24h > 10:
-            score -= 5
-            reasons.append(f"Moderate volatility: {price_change_24h:.1f}% (24h)")
-        elif price_change_24h < 5:
-            score += 10
-            reasons.append(f"Low volatility: {price_change_24h:.1f}% (24h)")
+        delta, reason = _VOLATILITY_RULES[_volatility_tier(price_change_24h)]
+        if reason:
+            score += delta
+            reasons.append(reason.format(price_change_24h))
         
         # Volume/Market Cap ratio (higher = more liquid = lower risk)
         volume = market_data.get('volume_24h', 0)
         market_cap = market_data.get('market_cap', 1)
         if market_cap > 0:
-            volume_ratio = volume / market_cap
-            if volume_ratio > 0.1:  # >10% daily turnover
-                score += 10
-                reasons.append("High liquidity")
-            elif volume_ratio < 0.01:  # <1% daily turnover
-                score -= 5
-                reasons.append("Low liquidity")
+            delta, reason = _LIQUIDITY_RULES[_liquidity_tier(volume / market_cap)]
+            if reason:
+                score += delta
+                reasons.append(reason)
         
         # Clamp score
         score = max(0, min(100, score))
         
-        return score, reasons[:3]  # Max 3 reasons
+        # At most one reason per rule (TVL, volatility, liquidity), so never over MAX_REASONS
+        return score, reasons
     
     def calculate_operational_score(self, protocol_data: Dict[str, Any]) -> Tuple[int, List[str]]:
         """
@@ -154,14 +203,15 @@ class RiskAggregator:
         
         # Basic category-based scoring
         category = protocol_data.get('category', 'Unknown')
-        if category in ['Lending', 'DEX']:
+        category_reason = _ESTABLISHED_CATEGORY_REASONS.get(category)
+        if category_reason:
             score += 10
-            reasons.append(f"Established category: {category}")
+            reasons.append(category_reason)
         
         # Placeholder for governance
         reasons.append("Governance structure: Not evaluated (MVP)")
         
-        return score, reasons[:3]
+        return score, reasons
     
     def calculate_market_score(self, market_data: Dict[str, Any], 
                                tvl_data: Dict[str, Any]) -> Tuple[int, List[str]]:
@@ -180,33 +230,21 @@ class RiskAggregator:
         
         # Market cap rank (lower rank = higher adoption = lower risk)
         rank = market_data.get('market_cap_rank', 999)
-        if rank <= 50:
-            score += 30
-            reasons.append(f"Top 50 by market cap (#{rank})")
-        elif rank <= 100:
-            score += 20
-            reasons.append(f"Top 100 by market cap (#{rank})")
-        elif rank <= 200:
-            score += 10
-            reasons.append(f"Top 200 by market cap (#{rank})")
-        else:
-            score -= 10
-            reasons.append(f"Lower market cap rank (#{rank})")
+        delta, reason = _RANK_RULES[bisect_left(_RANK_BOUNDS, rank)]
+        score += delta
+        reasons.append(reason.format(rank))
         
         # Multi-chain presence (more chains = more adoption)
-        chains = tvl_data.get('chains', {})
-        num_chains = len(chains)
-        if num_chains > 5:
-            score += 15
-            reasons.append(f"Multi-chain: {num_chains} chains")
-        elif num_chains > 2:
-            score += 5
-            reasons.append(f"Multi-chain: {num_chains} chains")
+        num_chains = len(tvl_data.get('chains', {}))
+        delta, reason = _CHAIN_RULES[bisect_left(_CHAIN_BOUNDS, num_chains)]
+        if reason:
+            score += delta
+            reasons.append(reason.format(num_chains))
         
         # Clamp score
         score = max(0, min(100, score))
         
-        return score, reasons[:3]
+        return score, reasons
     
     def calculate_overall_score(self, security_score: int, financial_score: int,
                                operational_score: int, market_score: int) -> Tuple[int, str]:
@@ -222,24 +260,18 @@ class RiskAggregator:
         Returns:
             Tuple of (overall_score, traffic_light_indicator)
         """
+        security_weight, financial_weight, operational_weight, market_weight = self._weights
         overall = (
-            security_score * self.WEIGHTS['security'] +
-            financial_score * self.WEIGHTS['financial'] +
-            operational_score * self.WEIGHTS['operational'] +
-            market_score * self.WEIGHTS['market']
+            security_score * security_weight +
+            financial_score * financial_weight +
+            operational_score * operational_weight +
+            market_score * market_weight
         )
         
         overall_score = int(overall)
         
         # Determine traffic light indicator
-        if overall_score >= 70:
-            indicator = "🟢 Low Risk"
-        elif overall_score >= 40:
-            indicator = "🟡 Medium Risk"
-        else:
-            indicator = "🔴 High Risk"
-        
-        return overall_score, indicator
+        return overall_score, _INDICATORS[bisect_right(_INDICATOR_BOUNDS, overall_score)]
     
     def aggregate_risk(self, tech_features: Dict[str, Any],
                       tvl_data: Dict[str, Any],
@@ -249,6 +281,10 @@ class RiskAggregator:
         """
         Aggregate all risk dimensions into comprehensive risk assessment.
         
+        Results are not memoized here: ProtocolManager caches each protocol's
+        full result for CACHE_REFRESH_INTERVAL, so aggregation only runs after
+        the inputs have been refetched, and then takes microseconds.
+        
         Args:
             tech_features: Technical features from contract analysis
             tvl_data: TVL data from DeFi Llama
@@ -259,11 +295,17 @@ class RiskAggregator:
         Returns:
             Dictionary with all risk scores and reasons
         """
+        # Bind the scorers once so each call below is a local lookup
+        security = self.calculate_security_score
+        financial = self.calculate_financial_score
+        operational = self.calculate_operational_score
+        market = self.calculate_market_score
+        
         # Calculate individual risk scores
-        security_score, security_reasons = self.calculate_security_score(tech_features, audit_data)
-        financial_score, financial_reasons = self.calculate_financial_score(tvl_data, market_data)
-        operational_score, operational_reasons = self.calculate_operational_score(protocol_data)
-        market_score, market_reasons = self.calculate_market_score(market_data, tvl_data)
+        security_score, security_reasons = security(tech_features, audit_data)
+        financial_score, financial_reasons = financial(tvl_data, market_data)
+        operational_score, operational_reasons = operational(protocol_data)
+        market_score, market_reasons = market(market_data, tvl_data)
         
         # Calculate overall score
         overall_score, indicator = self.calculate_overall_score(
@@ -288,90 +330,8 @@ class RiskAggregator:
             'weights': self.WEIGHTS
         }
         
-        logging.info(f"Risk aggregation complete: Overall={overall_score}, Security={security_score}, "
-                    f"Financial={financial_score}, Operational={operational_score}, Market={market_score}")
+        logger.debug("Risk aggregation complete: Overall=%s, Security=%s, Financial=%s, "
+                     "Operational=%s, Market=%s", overall_score, security_score,
+                     financial_score, operational_score, market_score)
         
         return result
-
-
-if __name__ == "__main__":
-    # Test the risk aggregator
-    print("Testing RiskAggregator...")
-    
-    aggregator = RiskAggregator()
-    
-    # Test case: High-quality protocol (like Aave)
-    print("\n1. Testing high-quality protocol:")
-    tech_features = {
-        'verified': True,
-        'has_admin_key': True,
-        'has_supply_key': False,
-        'has_pause_key': True,
-        'has_freeze_key': False,
-        'has_wipe_key': False,
-        'has_kyc_key': False,
-        'has_fee_key': False,
-        'upgradeable': True
-    }
-    
-    tvl_data = {
-        'tvl': 5_000_000_000,  # $5B
-        'tvl_change_24h': 2.5,
-        'chains': {'ethereum': 3_000_000_000, 'polygon': 1_000_000_000}
-    }
-    
-    market_data = {
-        'price': 95.50,
-        'market_cap': 1_400_000_000,
-        'volume_24h': 150_000_000,
-        'price_change_24h': 3.2,
-        'market_cap_rank': 45
-    }
-    
-    protocol_data = {
-        'name': 'Aave V3',
-        'category': 'Lending'
-    }
-    
-    result = aggregator.aggregate_risk(tech_features, tvl_data, market_data, protocol_data)
-    
-    print(f"   Overall Score: {result['overall_score']} - {result['risk_indicator']}")
-    print(f"   Security: {result['category_scores']['security']}")
-    print(f"   Financial: {result['category_scores']['financial']}")
-    print(f"   Operational: {result['category_scores']['operational']}")
-    print(f"   Market: {result['category_scores']['market']}")
-    
-    # Test case: Lower-quality protocol
-    print("\n2. Testing lower-quality protocol:")
-    tech_features_low = {
-        'verified': False,
-        'has_admin_key': True
-    }
-    
-    tvl_data_low = {
-        'tvl': 5_000_000,  # $5M
-        'chains': {'ethereum': 5_000_000}
-    }
-    
-    market_data_low = {
-        'price': 0.50,
-        'market_cap': 10_000_000,
-        'volume_24h': 50_000,
-        'price_change_24h': 25.5,
-        'market_cap_rank': 500
-    }
-    
-    protocol_data_low = {
-        'name': 'Unknown Protocol',
-        'category': 'Other'
-    }
-    
-    result_low = aggregator.aggregate_risk(tech_features_low, tvl_data_low, market_data_low, protocol_data_low)
-    
-    print(f"   Overall Score: {result_low['overall_score']} - {result_low['risk_indicator']}")
-    print(f"   Security: {result_low['category_scores']['security']}")
-    print(f"   Financial: {result_low['category_scores']['financial']}")
-    print(f"   Operational: {result_low['category_scores']['operational']}")
-    print(f"   Market: {result_low['category_scores']['market']}")
-    
-    print("\n✅ RiskAggregator tests passed!")
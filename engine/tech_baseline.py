@@ -11,53 +11,150 @@ Algorithm:
 5. Return final score + reasons (max 3)
 """
 
-from typing import Dict, Any, Tuple, List
+from typing import Dict, Any, Tuple, List, Union
 
+from features.tech import (
+    FLAG_VERIFIED, FLAG_UPGRADEABLE, FLAG_ADMIN, FLAG_SUPPLY, FLAG_PAUSE,
+    FLAG_FREEZE, FLAG_WIPE, FLAG_KYC, FLAG_FEE
+)
 
-def tech_baseline(features: Dict[str, Any]) -> Tuple[int, List[str]]:
+
+# Scoring constants from the algorithm above
+_UNVERIFIED_SCORE = 40
+_BASE_SCORE = 85
+_KEY_PENALTY = 8
+_MAX_PENALTY = 32
+_MIN_SCORE = 10
+_MAX_SCORE = 95
+
+# Risky key fields and their reasons, in penalty order
+_KEY_CHECKS = (
+    ("has_admin_key", "Admin key present"),
+    ("has_supply_key", "Supply key present"),
+    ("has_pause_key", "Pause key present"),
+    ("has_freeze_key", "Freeze key present"),
+    ("has_wipe_key", "Wipe key present"),
+    ("has_kyc_key", "Kyc key present"),
+    ("has_fee_key", "Fee key present")
+)
+
+# The same checks for features packed with features.tech.build_tech_flags
+_FLAG_CHECKS = tuple(zip(
+    (FLAG_ADMIN, FLAG_SUPPLY, FLAG_PAUSE, FLAG_FREEZE, FLAG_WIPE, FLAG_KYC, FLAG_FEE),
+    (reason_text for _, reason_text in _KEY_CHECKS)
+))
+_RISKY_MASK = FLAG_ADMIN | FLAG_SUPPLY | FLAG_PAUSE | FLAG_FREEZE | FLAG_WIPE | FLAG_KYC | FLAG_FEE
+_UPGRADEABLE_ADMIN = FLAG_UPGRADEABLE | FLAG_ADMIN
+
+# int.bit_count is Python 3.10+
+_popcount = getattr(int, "bit_count", lambda n: bin(n).count("1"))
+
+
+def _flags_score(flags: int) -> int:
+    """Score packed FLAG_* features without building reasons."""
+    if not flags & FLAG_VERIFIED:
+        return _UNVERIFIED_SCORE
+    penalty = min(_popcount(flags & _RISKY_MASK) * _KEY_PENALTY, _MAX_PENALTY)
+    if flags & _UPGRADEABLE_ADMIN == _UPGRADEABLE_ADMIN:
+        penalty += _KEY_PENALTY
+    return max(_MIN_SCORE, min(_MAX_SCORE, _BASE_SCORE - penalty))
+
+
+# Nine flags give only 512 inputs, so packed scores are looked up rather than
+# computed; rebuilt at import, so it always reflects the constants above
+_ALL_FLAGS = FLAG_VERIFIED | _UPGRADEABLE_ADMIN | _RISKY_MASK
+_SCORE_TABLE = tuple(_flags_score(flags) for flags in range(_ALL_FLAGS + 1))
+
+
+def _score_only(features: Union[Dict[str, Any], int]) -> int:
+    """tech_baseline's score alone, skipping reason construction."""
+    if isinstance(features, int):
+        return _SCORE_TABLE[features & _ALL_FLAGS]
+    if not features.get("verified", False):
+        return _UNVERIFIED_SCORE
+    
+    keys = 0
+    for key_field, _ in _KEY_CHECKS:
+        if features.get(key_field, False):
+            keys += 1
+    penalty = min(keys * _KEY_PENALTY, _MAX_PENALTY)
+    if features.get("upgradeable") and features.get("has_admin_key"):
+        penalty += _KEY_PENALTY
+    return max(_MIN_SCORE, min(_MAX_SCORE, _BASE_SCORE - penalty))
+
+
+def _flags_reasons(flags: int) -> Tuple[str, ...]:
+    """Reasons for packed FLAG_* features; reference for _REASONS_TABLE."""
+    if not flags & FLAG_VERIFIED:
+        return ("Contract unverified",)
+    
+    # Only the keys that were penalized are reported
+    reasons = [reason_text for flag, reason_text in _FLAG_CHECKS if flags & flag]
+    del reasons[_MAX_PENALTY // _KEY_PENALTY:]
+    
+    if flags & _UPGRADEABLE_ADMIN == _UPGRADEABLE_ADMIN:
+        reasons.append("Upgradeable + admin control")
+    
+    if not reasons:
+        reasons.append("Verified source; no risky keys")
+    
+    return tuple(reasons[:3])
+
+
+# Reasons depend only on the flags too, so they are tabulated alongside scores
+_REASONS_TABLE = tuple(_flags_reasons(flags) for flags in range(_ALL_FLAGS + 1))
+
+
+def _tech_baseline_flags(flags: int) -> Tuple[int, List[str]]:
+    """tech_baseline for features packed into FLAG_* bits."""
+    flags &= _ALL_FLAGS
+    # A fresh list, as callers may extend it
+    return _SCORE_TABLE[flags], list(_REASONS_TABLE[flags])
+
+
+def tech_baseline(features: Union[Dict[str, Any], int],
+                  return_reasons: bool = True) -> Union[Tuple[int, List[str]], int]:
     """
     Calculate technical risk baseline score based on contract verification and key permissions.
     
     Args:
-        features: Technical features dictionary from features/tech.py
+        features: Technical features dictionary from features/tech.py, or the
+                  same features packed into an int by build_tech_flags
+        return_reasons: If False, return only the score and skip building reasons
         
     Returns:
         Tuple of (score, reasons) where:
         - score: Integer between 10-95
         - reasons: List of up to 3 reason strings
+        or just the score if return_reasons is False
         
     Algorithm matches specification exactly:
     - Unverified contracts: 40 points
     - Verified contracts: Start with 85, subtract 8 per risky key (max 32 penalty)
     - Final score clamped between 10-95
     """
+    if not return_reasons:
+        return _score_only(features)
+    if isinstance(features, int):
+        return _tech_baseline_flags(features)
+    
     # Step 1: Check verification status
     if not features.get("verified", False):
-        return 40, ["Contract unverified"]
+        return _UNVERIFIED_SCORE, ["Contract unverified"]
     
     # Step 2: Start with base score for verified contracts
-    score = 85
+    score = _BASE_SCORE
     reasons = []
     penalties = 0
     
     # Step 3: Check each risky key type and apply penalties
-    key_checks = [
-        ("has_admin_key", "Admin key present"),
-        ("has_supply_key", "Supply key present"), 
-        ("has_pause_key", "Pause key present"),
-        ("has_freeze_key", "Freeze key present"),
-        ("has_wipe_key", "Wipe key present"),
-        ("has_kyc_key", "Kyc key present"),
-        ("has_fee_key", "Fee key present")
-    ]
-    
-    for key_field, reason_text in key_checks:
+    for key_field, reason_text in _KEY_CHECKS:
         if features.get(key_field, False):
-            penalties += 8
+            penalties += _KEY_PENALTY
             reasons.append(reason_text)
             
             # Stop at max penalty (32 points = 4 keys)
-            if penalties >= 32:
+            if penalties >= _MAX_PENALTY:
                 break
     
     # Apply penalties
@@ -65,11 +162,11 @@ def tech_baseline(features: Dict[str, Any]) -> Tuple[int, List[str]]:
     
     # Add penalty for upgradeable + admin combo
     if features.get("upgradeable") and features.get("has_admin_key"):
-        score -= 8
+        score -= _KEY_PENALTY
         reasons.append("Upgradeable + admin control")
     
     # Step 4: Clip score between 10 and 95
-    score = max(10, min(95, score))
+    score = max(_MIN_SCORE, min(_MAX_SCORE, score))
     
     # Step 5: Handle case where no risky keys found
     if not reasons:
@@ -133,17 +230,19 @@ def explain_score(score: int, reasons: List[str]) -> Dict[str, Any]:
     return explanation
 
 
-def batch_score_features(feature_list: List[Dict[str, Any]]) -> List[Tuple[int, List[str]]]:
+def batch_score_features(feature_list: List[Union[Dict[str, Any], int]],
+                         return_reasons: bool = True) -> List[Union[Tuple[int, List[str]], int]]:
     """
     Score multiple feature sets in batch.
     
     Args:
-        feature_list: List of technical feature dictionaries
+        feature_list: List of technical feature dictionaries or packed flags
+        return_reasons: If False, return only the scores (faster for ranking)
         
     Returns:
-        List of (score, reasons) tuples
+        List of (score, reasons) tuples, or of scores if return_reasons is False
     """
-    return [tech_baseline(features) for features in feature_list]
+    return list(map(tech_baseline if return_reasons else _score_only, feature_list))
 
 
 if __name__ == "__main__":
@@ -5,7 +5,8 @@ Converts raw token/contract data into standardized AI-ready features.
 The feature schema is FROZEN and must not change without version updates.
 """
 
-from typing import Dict, Any, Optional
+from array import array
+from typing import Dict, Any, Iterable, Optional
 
 
 # FROZEN FEATURE SCHEMA - DO NOT MODIFY
@@ -25,6 +26,49 @@ TECH_FEATURE_SCHEMA = {
     "network": str,
 }
 
+# Bit flags for the boolean features the scorer reads, so a token's scoring
+# inputs fit in one int: verified, upgradeable, then the risky keys
+FLAG_VERIFIED = 1 << 0
+FLAG_UPGRADEABLE = 1 << 1
+FLAG_ADMIN = 1 << 2
+FLAG_SUPPLY = 1 << 3
+FLAG_PAUSE = 1 << 4
+FLAG_FREEZE = 1 << 5
+FLAG_WIPE = 1 << 6
+FLAG_KYC = 1 << 7
+FLAG_FEE = 1 << 8
+
+# Feature key for each flag
+FLAG_FIELDS = (
+    (FLAG_VERIFIED, "verified"),
+    (FLAG_UPGRADEABLE, "upgradeable"),
+    (FLAG_ADMIN, "has_admin_key"),
+    (FLAG_SUPPLY, "has_supply_key"),
+    (FLAG_PAUSE, "has_pause_key"),
+    (FLAG_FREEZE, "has_freeze_key"),
+    (FLAG_WIPE, "has_wipe_key"),
+    (FLAG_KYC, "has_kyc_key"),
+    (FLAG_FEE, "has_fee_key"),
+)
+
+# Display label for each risky key feature, e.g. "has_admin_key" -> "Admin"
+_RISKY_KEY_LABELS = tuple(
+    (key, key[len("has_"):-len("_key")].capitalize())
+    for key in TECH_FEATURE_SCHEMA if key.startswith("has_")
+)
+
+
+def _as_int(value: Any) -> int:
+    """Coerce a holder count to int, treating missing or malformed values as 0."""
+    value = value or 0
+    if isinstance(value, int):
+        return value
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return 0
+
+
 def build_tech_features(tech_facts: Dict[str, Any], chain: str, network: str) -> Dict[str, Any]:
     """
     Build standardized technical features from unified adapter output.
@@ -37,41 +81,86 @@ def build_tech_features(tech_facts: Dict[str, Any], chain: str, network: str) ->
     Returns:
         Dictionary with frozen technical features.
     """
-    gov_flags = tech_facts.get("governance_flags", {})
+    gov_flags = tech_facts.get("governance_flags") or {}
     
-    features = {
-        "verified": tech_facts.get("verified", False),
-        "bytecode_only": tech_facts.get("bytecode_only", False),
-        "has_admin_key": tech_facts.get("admin_keys_present", False),
-        "has_supply_key": gov_flags.get("supply", False),
-        "has_pause_key": gov_flags.get("pause", False),
-        "has_freeze_key": gov_flags.get("freeze", False),
-        "has_wipe_key": gov_flags.get("wipe", False),
-        "has_kyc_key": gov_flags.get("kyc", False),
-        "has_fee_key": gov_flags.get("fee", False),
-        "upgradeable": gov_flags.get("upgradeable", False),
-        "holders_estimate": tech_facts.get("holders_estimate") or 0,
-        "chain": chain,
-        "network": network,
+    # Every schema key is set here, coerced to its schema type
+    return {
+        "verified": bool(tech_facts.get("verified", False)),
+        "bytecode_only": bool(tech_facts.get("bytecode_only", False)),
+        "has_admin_key": bool(tech_facts.get("admin_keys_present", False)),
+        "has_supply_key": bool(gov_flags.get("supply", False)),
+        "has_pause_key": bool(gov_flags.get("pause", False)),
+        "has_freeze_key": bool(gov_flags.get("freeze", False)),
+        "has_wipe_key": bool(gov_flags.get("wipe", False)),
+        "has_kyc_key": bool(gov_flags.get("kyc", False)),
+        "has_fee_key": bool(gov_flags.get("fee", False)),
+        "upgradeable": bool(gov_flags.get("upgradeable", False)),
+        "holders_estimate": _as_int(tech_facts.get("holders_estimate")),
+        "chain": chain if isinstance(chain, str) else str(chain),
+        "network": network if isinstance(network, str) else str(network),
     }
+
+
+def build_tech_flags(features: Dict[str, Any]) -> int:
+    """
+    Pack a feature dictionary's scored booleans into FLAG_* bits.
+    
+    Args:
+        features: Technical features dictionary, as from build_tech_features
+        
+    Returns:
+        Bitmask of the flags that are set
+    """
+    flags = 0
+    for flag, key in FLAG_FIELDS:
+        if features.get(key):
+            flags |= flag
+    return flags
+
+
+# Where each flag lives in raw adapter output: top-level facts, then governance_flags
+_FACT_FLAGS = (
+    (FLAG_VERIFIED, "verified"),
+    (FLAG_ADMIN, "admin_keys_present"),
+)
+_GOVERNANCE_FLAGS = (
+    (FLAG_UPGRADEABLE, "upgradeable"),
+    (FLAG_SUPPLY, "supply"),
+    (FLAG_PAUSE, "pause"),
+    (FLAG_FREEZE, "freeze"),
+    (FLAG_WIPE, "wipe"),
+    (FLAG_KYC, "kyc"),
+    (FLAG_FEE, "fee"),
+)
+
+
+def build_tech_flags_batch(tech_facts_list: Iterable[Dict[str, Any]]) -> array:
+    """
+    Pack many adapters' outputs straight into FLAG_* bitmasks.
+    
+    Equivalent to build_tech_flags(build_tech_features(facts, ...)) per entry,
+    without building the intermediate feature dictionaries. The result is a
+    compact unsigned 16-bit array that batch_score_features accepts directly;
+    non-flag features such as holders_estimate are not included.
     
-    # Ensure all schema keys are present with correct types
-    for key, expected_type in TECH_FEATURE_SCHEMA.items():
-        if key not in features:
-            if expected_type == bool:
-                features[key] = False
-            elif expected_type == int:
-                features[key] = 0
-            elif expected_type == str:
-                features[key] = ""
-        # Coerce type if necessary
-        elif not isinstance(features[key], expected_type):
-             try:
-                features[key] = expected_type(features[key])
-             except (ValueError, TypeError):
-                features[key] = expected_type() # Fallback to default value
-
-    return features
+    Args:
+        tech_facts_list: Raw data from chain adapters
+        
+    Returns:
+        array('H') with one bitmask per input
+    """
+    masks = array('H')
+    for tech_facts in tech_facts_list:
+        gov_flags = tech_facts.get("governance_flags") or {}
+        flags = 0
+        for flag, key in _FACT_FLAGS:
+            if tech_facts.get(key):
+                flags |= flag
+        for flag, key in _GOVERNANCE_FLAGS:
+            if gov_flags.get(key):
+                flags |= flag
+        masks.append(flags)
+    return masks
 
 
 def validate_tech_features(features: Dict[str, Any]) -> bool:
@@ -119,11 +208,7 @@ def get_feature_summary(features: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Dictionary with summary information
     """
-    risky_keys = []
-    for key, value in features.items():
-        if key.startswith("has_") and value:
-            key_name = key.replace("has_", "").replace("_key", "")
-            risky_keys.append(key_name.capitalize())
+    risky_keys = [label for key, label in _RISKY_KEY_LABELS if features.get(key)]
     
     return {
         "verification_status": "Verified" if features["verified"] else "Unverified",
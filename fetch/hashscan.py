@@ -3,6 +3,7 @@ HashScan API fetcher and verification checker.
 Checks contract verification status via Sourcify and builds explorer links.
 """
 
+import time
 import requests
 from typing import Dict, Any
 from config import (
@@ -10,25 +11,26 @@ from config import (
     API_TIMEOUT,
     API_RETRIES,
     REQUEST_DELAY,
+    SOURCIFY_API,
     NETWORK
 )
+from utils.http import backoff_delay, get_session, host_semaphore, parse_json
 
 
 def _make_request_with_retries(url: str, timeout: int = API_TIMEOUT) -> Dict[str, Any]:
     """
     Make HTTP request with retry logic, similar to mirror.py
     """
-    import time
     last_exception = None
     
     for attempt in range(API_RETRIES + 1):
         try:
             if attempt > 0:
-                time.sleep(REQUEST_DELAY * attempt)
+                time.sleep(backoff_delay(attempt, REQUEST_DELAY))
                 
-            response = requests.get(url, timeout=timeout)
+            response = get_session().get(url, timeout=timeout)
             response.raise_for_status()
-            return response.json()
+            return parse_json(response)
             
         except requests.RequestException as e:
             last_exception = e
@@ -56,41 +58,19 @@ def check_sourcify_verification(contract_address: str) -> Dict[str, bool]:
         }
     """
     try:
-        # Sourcify API endpoint for testnet
-        sourcify_base = "https://repo.sourcify.dev"
+        # Hedera testnet chain ID; one call answers both full and partial match
+        url = f"{SOURCIFY_API}/check-by-addresses"
+        params = {"addresses": contract_address.lower(), "chainIds": "296"}
         
-        # Try to get files for full verification
-        files_url = f"{sourcify_base}/contracts/full_match/296/{contract_address}/"
+        with host_semaphore(url):
+            response = get_session().get(url, params=params, timeout=API_TIMEOUT)
+        response.raise_for_status()
         
-        try:
-            response = requests.get(files_url, timeout=API_TIMEOUT)
-            if response.status_code == 200:
-                return {
-                    "verified": True,
-                    "full_match": True,
-                    "partial_match": False
-                }
-        except:
-            pass
-        
-        # Try partial match
-        partial_url = f"{sourcify_base}/contracts/partial_match/296/{contract_address}/"
-        try:
-            response = requests.get(partial_url, timeout=API_TIMEOUT)
-            if response.status_code == 200:
-                return {
-                    "verified": True,
-                    "full_match": False,
-                    "partial_match": True
-                }
-        except:
-            pass
-        
-        # Not verified
+        statuses = {entry.get("status") for entry in parse_json(response) or []}
         return {
-            "verified": False,
-            "full_match": False,
-            "partial_match": False
+            "verified": bool(statuses & {"perfect", "partial"}),
+            "full_match": "perfect" in statuses,
+            "partial_match": "partial" in statuses
         }
         
     except Exception:
@@ -13,6 +13,7 @@ from config import (
     API_RETRIES,
     REQUEST_DELAY,
 )
+from utils.http import backoff_delay, get_session, parse_json
 
 
 def _make_request_with_retries(url: str, timeout: int = API_TIMEOUT) -> Dict[str, Any]:
@@ -34,11 +35,11 @@ def _make_request_with_retries(url: str, timeout: int = API_TIMEOUT) -> Dict[str
     for attempt in range(API_RETRIES + 1):
         try:
             if attempt > 0:
-                time.sleep(REQUEST_DELAY * attempt)  # Exponential backoff
+                time.sleep(backoff_delay(attempt, REQUEST_DELAY))  # Exponential backoff with jitter
                 
-            response = requests.get(url, timeout=timeout)
+            response = get_session().get(url, timeout=timeout)
             response.raise_for_status()
-            return response.json()
+            return parse_json(response)
             
         except requests.RequestException as e:
             last_exception = e
@@ -0,0 +1,106 @@
+"""
+Shared pytest fixtures and path setup for every test module.
+Live adapter lookups are fetched once per test session and reused across test modules.
+
+Their HTTP traffic is replayed from tests/cassettes/ with pytest-recording
+(record with --record-mode=once); tests without a cassette are skipped
+unless --live-api is given.
+"""
+
+import contextlib
+import pytest
+import sys
+import os
+
+try:
+    import vcr
+except ImportError:  # pytest-recording not installed; cassette-backed tests are skipped
+    vcr = None
+
+# Add parent directory to path (once, for every test module)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import utils.cache
+from adapters import ethereum, hedera
+
+
+WETH_ADDRESS = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+USDC_ADDRESS = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+HEDERA_TOKEN_ID = "0.0.107594"
+
+CASSETTE_DIR = os.path.join(os.path.dirname(__file__), "cassettes")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_disk_cache(tmp_path_factory):
+    """Point the process-wide disk cache at a per-session temp file.
+
+    Keeps the developer's ./cache/cache.sqlite3 (and whatever earlier runs or
+    the dashboard stored there) out of test outcomes and cassette recordings.
+    """
+    path = str(tmp_path_factory.mktemp("disk_cache") / "cache.sqlite3")
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(utils.cache, "DISK_CACHE_PATH", path)
+        patch.setattr(utils.cache, "_disk_cache", None)
+        yield path
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--live-api", action="store_true", default=False,
+        help="Query live chain APIs for tests whose cassette has not been recorded",
+    )
+
+
+def _cassette(request, name):
+    """
+    Context that replays (or records) HTTP calls from tests/cassettes/<name>.yaml.
+
+    Replay uses record mode "none", so a request missing from the cassette
+    fails instead of reaching the network. Without a cassette the test is
+    skipped, unless recording was requested with --record-mode or live
+    lookups with --live-api.
+    """
+    path = os.path.join(CASSETTE_DIR, f"{name}.yaml")
+    record_mode = request.config.getoption("--record-mode", default=None) or "none"
+    if vcr is not None and (os.path.exists(path) or record_mode != "none"):
+        return vcr.use_cassette(
+            path,
+            # "rewrite" is pytest-recording's own mode; plain vcrpy calls it "all"
+            record_mode="all" if record_mode == "rewrite" else record_mode,
+            filter_query_parameters=["apikey"],
+        )
+    if request.config.getoption("--live-api"):
+        return contextlib.nullcontext()
+    if vcr is None:
+        pytest.skip("needs pytest-recording to replay tests/cassettes/ (or --live-api)")
+    pytest.skip(f"no cassette at tests/cassettes/{name}.yaml; "
+                "record it with --record-mode=once (or run with --live-api)")
+
+
+@pytest.fixture
+def recorded_http(request):
+    """Record or replay the requesting test's own HTTP calls."""
+    with _cassette(request, f"{request.module.__name__.rpartition('.')[2]}/{request.node.name}"):
+        yield
+
+
+@pytest.fixture(scope="session")
+def weth_facts(request):
+    """Ethereum mainnet facts for WETH (verified, not a proxy)."""
+    with _cassette(request, "fixtures/weth_facts"):
+        return ethereum.get_tech_facts(WETH_ADDRESS, "mainnet")
+
+
+@pytest.fixture(scope="session")
+def usdc_facts(request):
+    """Ethereum mainnet facts for USDC (verified upgradeable proxy)."""
+    with _cassette(request, "fixtures/usdc_facts"):
+        return ethereum.get_tech_facts(USDC_ADDRESS, "mainnet")
+
+
+@pytest.fixture(scope="session")
+def hedera_token_facts(request):
+    """Hedera mainnet facts for a token with an admin key."""
+    with _cassette(request, "fixtures/hedera_token_facts"):
+        return hedera.get_tech_facts(HEDERA_TOKEN_ID, "mainnet")
@@ -0,0 +1,157 @@
+"""
+Automated tests for the shared API client base.
+Run with: pytest tests/test_api_clients.py -v
+"""
+
+import pytest
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from api_clients.base import BaseAPIClient
+from api_clients.coingecko import CoinGeckoClient
+from utils.cache import DiskCache
+from api_clients.defillama import BULK_TVL_THRESHOLD, DefiLlamaClient
+
+
+class _ETagHandler(BaseHTTPRequestHandler):
+    """Serves a fixed JSON body with an ETag and counts full responses."""
+
+    full_responses = 0
+
+    def do_GET(self):
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        type(self).full_responses += 1
+        body = json.dumps({"value": 1}).encode()
+        self.send_response(200)
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_api():
+    server = HTTPServer(("127.0.0.1", 0), _ETagHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    _ETagHandler.full_responses = 0
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+class TestBaseAPIClient:
+    """Test suite for BaseAPIClient caching."""
+
+    def test_conditional_get_reuses_body(self, local_api):
+        """An expired entry with an ETag is revalidated instead of re-downloaded."""
+        with BaseAPIClient(local_api, cache_ttl=0) as client:
+            client.clear_cache()
+            assert client.get("data", ttl=0) == {"value": 1}
+            assert client.get("data", ttl=0) == {"value": 1}
+            client.clear_cache()
+
+        assert _ETagHandler.full_responses == 1
+
+    def test_clients_share_cache(self, local_api):
+        """Two clients for the same base URL share cached responses."""
+        with BaseAPIClient(local_api) as first, BaseAPIClient(local_api) as second:
+            first.clear_cache()
+            first.get("data", params={"a": 1, "b": 2})
+            second.get("data", params={"b": 2, "a": 1})
+            assert first.get_cache_stats()["total_entries"] == 1
+            first.clear_cache()
+
+        assert _ETagHandler.full_responses == 1
+
+    def test_bulk_endpoints_use_separate_cache(self, local_api):
+        """Bulk endpoints are cached apart from regular ones and hits are counted."""
+        class BulkClient(BaseAPIClient):
+            bulk_endpoints = frozenset({"bulk"})
+
+        with BulkClient(local_api) as client:
+            client.clear_cache()
+            client.get("bulk")
+            client.get("bulk")
+            client.get("data")
+            stats = client.get_cache_stats()
+            client.clear_cache()
+
+        assert stats["bulk_entries"] == 1
+        assert stats["total_entries"] == 2
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+
+    def test_credential_params_not_cached(self, local_api, tmp_path):
+        """API key params are sent but never become part of a cache key."""
+        class KeyedClient(BaseAPIClient):
+            credential_params = frozenset({"api_key"})
+
+        disk = DiskCache(str(tmp_path / "cache.sqlite3"))
+        with KeyedClient(local_api) as client:
+            client._disk_cache = disk
+            client.clear_cache()
+            client.get("data", params={"q": 1, "api_key": "secret"})
+            client.get("data", params={"q": 1, "api_key": "rotated"})
+            keys = [row[0] for row in disk._conn.execute("SELECT key FROM cache")]
+            client.clear_cache()
+
+        assert keys == ["data?q=1"]
+        assert _ETagHandler.full_responses == 1
+
+
+class TestCoinGeckoClient:
+    """Test suite for CoinGecko batched market data."""
+
+    def test_unranked_coin_is_not_top_ranked(self):
+        """A null market_cap_rank maps to 999, the aggregator's unranked default."""
+        client = CoinGeckoClient()
+        client.get = lambda endpoint, params: [
+            {"id": "longtail", "name": "Long Tail", "symbol": "lt", "market_cap_rank": None}
+        ]
+
+        assert client.get_tokens_data(["longtail"])["longtail"]["market_cap_rank"] == 999
+
+
+class TestDefiLlamaClient:
+    """Test suite for DeFi Llama TVL batching."""
+
+    def test_many_slugs_use_protocols_listing(self):
+        """Large slug sets are summarized from one /protocols request."""
+        listing = [
+            {"name": f"P{i}", "slug": f"p{i}", "tvl": 100.0 * i, "change_1d": 1.5,
+             "chainTvls": {"Ethereum": 100.0 * i}}
+            for i in range(BULK_TVL_THRESHOLD)
+        ]
+        requested = []
+        client = DefiLlamaClient()
+        client.get = lambda endpoint: requested.append(endpoint) or listing
+
+        results = client.get_protocols_tvl([entry["slug"] for entry in listing])
+
+        assert requested == ["protocols"]
+        assert list(results) == [entry["slug"] for entry in listing]
+        assert results["p3"]["tvl"] == 300.0
+        assert results["p3"]["tvl_change_24h"] == 1.5
+        assert results["p3"]["chains"] == {"Ethereum": 300.0}
+
+    def test_cached_listing_serves_small_batches(self):
+        """A cached /protocols listing is used even below the bulk threshold."""
+        listing = [{"name": "Aave V3", "slug": "aave-v3", "tvl": 5e9, "chainTvls": {}}]
+        client = DefiLlamaClient()
+        client.get_cached = lambda endpoint: listing
+        client.get = lambda endpoint: listing if endpoint == "protocols" else pytest.fail(endpoint)
+
+        results = client.get_protocols_tvl(["aave-v3"])
+
+        assert results["aave-v3"]["tvl"] == 5e9
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
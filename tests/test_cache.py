@@ -0,0 +1,83 @@
+"""
+Automated tests for the SQLite disk cache.
+Run with: pytest tests/test_cache.py -v
+"""
+
+import pytest
+
+import utils.cache
+from utils.cache import DiskCache, PersistentTTLCache
+
+
+class TestDiskCache:
+    """Test suite for DiskCache persistence."""
+
+    def test_round_trip(self, tmp_path):
+        """Stored values survive reopening the database."""
+        path = str(tmp_path / "cache.sqlite3")
+        DiskCache(path).set("etherscan", ("0xabc", "mainnet"), {"SourceCode": "x"}, ttl=60)
+
+        reopened = DiskCache(path)
+        assert reopened.get("etherscan", ("0xabc", "mainnet")) == {"SourceCode": "x"}
+        assert reopened.get("sourcify", ("0xabc", "mainnet")) is None
+
+    def test_expired_entries_are_ignored(self, tmp_path):
+        """Entries past their ttl are treated as missing and purged."""
+        cache = DiskCache(str(tmp_path / "cache.sqlite3"))
+        cache.set("ns", "key", {"a": 1}, ttl=-1)
+
+        assert cache.get("ns", "key", "missing") == "missing"
+        assert cache.count("ns") == 0
+        assert cache.purge_expired() == 1
+
+    def test_clear_namespace(self, tmp_path):
+        """Clearing one namespace leaves the others intact."""
+        cache = DiskCache(str(tmp_path / "cache.sqlite3"))
+        cache.set("a", "k", 1, ttl=60)
+        cache.set("b", "k", 2, ttl=60)
+
+        cache.clear("a")
+        assert cache.get("a", "k") is None
+        assert cache.get("b", "k") == 2
+
+    def test_touch_extends_expiry(self, tmp_path):
+        """Touching an entry extends its expiry and keeps the stored value."""
+        cache = DiskCache(str(tmp_path / "cache.sqlite3"))
+        cache.set("ns", "key", {"a": 1}, ttl=1)
+        _, before = cache.get_with_expiry("ns", "key")
+
+        assert cache.touch("ns", "key", ttl=60)
+        value, after = cache.get_with_expiry("ns", "key")
+        assert value == {"a": 1}
+        assert after > before
+        assert not cache.touch("ns", "missing", ttl=60)
+
+
+    def test_persistent_discard(self, tmp_path, monkeypatch):
+        """Discarding a PersistentTTLCache key removes it from memory and disk."""
+        disk = DiskCache(str(tmp_path / "cache.sqlite3"))
+        monkeypatch.setattr(utils.cache, "_disk_cache", disk)
+        cache = PersistentTTLCache("ns", maxsize=4, ttl=60)
+        cache["k"] = {"a": 1}
+
+        cache.discard("k")
+        cache.discard("missing")
+        assert "k" not in cache
+        assert disk.get("ns", "k") is None
+
+    def test_persistent_disk_entries_after_restart(self, tmp_path, monkeypatch):
+        """A fresh PersistentTTLCache sees disk-only entries via in, get and []."""
+        disk = DiskCache(str(tmp_path / "cache.sqlite3"))
+        monkeypatch.setattr(utils.cache, "_disk_cache", disk)
+        PersistentTTLCache("ns", maxsize=4, ttl=60)["k"] = {"a": 1}
+
+        restarted = PersistentTTLCache("ns", maxsize=4, ttl=60)
+        assert "k" in restarted
+        assert restarted.get("k") == {"a": 1}
+        assert restarted["k"] == {"a": 1}
+        assert "missing" not in restarted
+        assert restarted.get("missing", "default") == "default"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
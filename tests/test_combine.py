@@ -0,0 +1,41 @@
+"""
+Automated tests for the combined scoring module.
+Run with: pytest tests/test_combine.py -v
+"""
+
+import pytest
+
+from engine.combine import combine_scores, get_overall_assessment
+
+
+class TestCombine:
+    """Test suite for combine_scores and get_overall_assessment."""
+
+    def test_tech_only(self):
+        """Without a market score the technical score passes through."""
+        tech_reasons = ["Admin key present", "Supply key present"]
+        combined_score, combined_reasons = combine_scores(61, tech_reasons)
+
+        assert (combined_score, combined_reasons) == (61, tech_reasons)
+
+        assessment = get_overall_assessment(combined_score, combined_reasons, 61)
+        assert assessment['scoring_method'] == "tech-only-v0.2"
+        assert assessment['component_scores'] == {'technical': 61}
+        assert (assessment['risk_level'], assessment['color_code']) == ("Medium", "yellow")
+
+    def test_with_market_score(self):
+        """A market score is averaged in and its reasons appended, up to three."""
+        combined_score, combined_reasons = combine_scores(
+            61, ["Admin key present", "Supply key present"], 70, ["Low liquidity", "High volatility"]
+        )
+
+        assert combined_score == 65
+        assert combined_reasons == ["Admin key present", "Supply key present", "Low liquidity"]
+
+        assessment = get_overall_assessment(combined_score, combined_reasons, 61, 70)
+        assert assessment['scoring_method'] == "combined-v1.0"
+        assert assessment['component_scores'] == {'technical': 61, 'market': 70}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -4,22 +4,17 @@ Run with: pytest tests/test_ethereum.py -v
 """
 
 import pytest
-import sys
-import os
 
-# Add parent directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-from adapters.ethereum import get_tech_facts
+import adapters.ethereum
+from adapters.ethereum import ContractNotFound, clear_tech_facts_cache, get_tech_facts, validate_ethereum_address
 
 
 class TestEthereumAdapter:
     """Test suite for Ethereum adapter functionality."""
     
-    def test_weth_verification(self):
+    def test_weth_verification(self, weth_facts):
         """Test WETH contract verification and properties."""
-        weth_addr = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
-        facts = get_tech_facts(weth_addr, "mainnet")
+        facts = weth_facts
         
         # Basic structure checks
         assert "verified" in facts
@@ -31,10 +26,9 @@ class TestEthereumAdapter:
         assert facts["governance_flags"]["upgradeable"] is False, "WETH should not be upgradeable"
         assert facts["explorer_url"].startswith("https://etherscan.io/address/")
         
-    def test_usdc_proxy_detection(self):
+    def test_usdc_proxy_detection(self, usdc_facts):
         """Test USDC proxy contract detection."""
-        usdc_addr = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
-        facts = get_tech_facts(usdc_addr, "mainnet")
+        facts = usdc_facts
         
         # Basic structure checks
         assert "verified" in facts
@@ -54,6 +48,60 @@ class TestEthereumAdapter:
         with pytest.raises(ValueError, match="Invalid input"):
             get_tech_facts("0x123", "mainnet")
 
+    def test_validate_ethereum_address(self):
+        """Test address validation rejects non-hex characters of the right length."""
+        assert validate_ethereum_address("0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2")
+        assert not validate_ethereum_address("0x" + "g" * 40)
+        assert not validate_ethereum_address("0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2\n")
+
+    def test_no_data_phrase_in_source_is_not_missing(self, monkeypatch):
+        """Only an error response with Etherscan's no-data text means no contract."""
+        source = {"SourceCode": "// returns 'No data found' when empty", "ABI": "[]",
+                  "ContractName": "Oracle", "Proxy": "0", "Implementation": ""}
+        monkeypatch.setattr(adapters.ethereum, "_make_request_with_retries",
+                            lambda url, params: {"status": "1", "message": "OK", "result": [source]})
+        fetch = adapters.ethereum._fetch_etherscan_source.__wrapped__
+
+        assert fetch("0x" + "ef" * 20, "mainnet")["SourceCode"] is True
+
+        monkeypatch.setattr(adapters.ethereum, "_make_request_with_retries",
+                            lambda url, params: {"status": "0", "message": "NOTOK", "result": "No data found"})
+        with pytest.raises(ContractNotFound):
+            fetch("0x" + "ef" * 20, "mainnet")
+
+    def test_tech_facts_memoized(self, monkeypatch):
+        """Repeat lookups are served from memory, case-insensitively, as independent copies."""
+        calls = []
+        def fake_fetch(address, network):
+            calls.append(address)
+            return {"verified": True, "governance_flags": {"admin": False}}
+        monkeypatch.setattr(adapters.ethereum, "_fetch_tech_facts", fake_fetch)
+        clear_tech_facts_cache()
+
+        address = "0x" + "ab" * 20
+        first = get_tech_facts(address, "mainnet")
+        first["governance_flags"]["admin"] = True
+        second = get_tech_facts(address.upper().replace("0X", "0x"), "mainnet")
+        clear_tech_facts_cache()
+
+        assert calls == [address]
+        assert second["governance_flags"]["admin"] is False
+
+    def test_tech_facts_errors_not_memoized(self, monkeypatch):
+        """Error results are refetched on the next lookup."""
+        calls = []
+        def fake_fetch(address, network):
+            calls.append(address)
+            return {"verified": False, "error": "Data unavailable (Etherscan/Sourcify)"}
+        monkeypatch.setattr(adapters.ethereum, "_fetch_tech_facts", fake_fetch)
+        clear_tech_facts_cache()
+
+        address = "0x" + "cd" * 20
+        get_tech_facts(address, "mainnet")
+        get_tech_facts(address, "mainnet")
+
+        assert len(calls) == 2
+
 
 if __name__ == "__main__":
     # Run tests directly
@@ -4,22 +4,21 @@ Run with: pytest tests/test_hedera.py -v
 """
 
 import pytest
-import sys
-import os
+import requests
 
-# Add parent directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-from adapters.hedera import get_tech_facts
+import adapters.hedera
+import utils.cache
+from adapters.hedera import get_tech_facts, validate_hedera_id
+from utils.cache import DiskCache
 
 
 class TestHederaAdapter:
     """Test suite for Hedera adapter functionality."""
     
-    def test_valid_token_mainnet(self):
+    def test_valid_token_mainnet(self, hedera_token_facts):
         """Test valid Hedera mainnet token."""
         token_id = "0.0.107594"
-        facts = get_tech_facts(token_id, "mainnet")
+        facts = hedera_token_facts
         
         # Basic structure checks
         assert "verified" in facts
@@ -32,15 +31,15 @@ class TestHederaAdapter:
         assert facts["explorer_url"].startswith("https://hashscan.io/mainnet/")
         assert facts["token_info"]["token_id"] == token_id
         
-    def test_governance_flags_structure(self):
+    def test_governance_flags_structure(self, hedera_token_facts):
         """Test that all governance flags are present."""
-        token_id = "0.0.107594"
-        facts = get_tech_facts(token_id, "mainnet")
+        facts = hedera_token_facts
         
         required_flags = ["admin", "supply", "pause", "freeze", "wipe", "kyc", "fee"]
         for flag in required_flags:
             assert flag in facts["governance_flags"], f"Missing governance flag: {flag}"
             
+    @pytest.mark.usefixtures("recorded_http")
     def test_nonexistent_token(self):
         """Test handling of non-existent token."""
         # Use a very high token ID that likely doesn't exist
@@ -50,6 +49,27 @@ class TestHederaAdapter:
         # Should return error state gracefully
         assert "error" in facts or facts["token_info"]["type"] == "UNKNOWN"
 
+    def test_validate_hedera_id(self):
+        """Test Hedera ID validation."""
+        assert validate_hedera_id("0.0.107594")
+        assert not validate_hedera_id("0.0")
+        assert not validate_hedera_id("0.0.abc")
+        assert not validate_hedera_id("0.0.107594\n")
+
+    def test_sourcify_failure_not_cached(self, tmp_path, monkeypatch):
+        """A Sourcify outage reads as unverified without being cached."""
+        monkeypatch.setattr(utils.cache, "_disk_cache", DiskCache(str(tmp_path / "cache.sqlite3")))
+        monkeypatch.setattr(adapters.hedera, "_make_request_with_retries",
+                            lambda url: {"bytecode": "0x00", "evm_address": "0x" + "ab" * 20})
+        def failing_sourcify(address, network):
+            raise requests.exceptions.Timeout("sourcify timed out")
+        monkeypatch.setattr(adapters.hedera, "_query_sourcify", failing_sourcify)
+
+        info = adapters.hedera._get_contract_info("0.0.424242", "mainnet")
+
+        assert info["verified"] is False
+        assert ("0.0.424242", "mainnet") not in adapters.hedera._contract_cache
+
 
 if __name__ == "__main__":
     # Run tests directly
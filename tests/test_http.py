@@ -0,0 +1,83 @@
+"""
+Automated tests for shared HTTP helpers.
+Run with: pytest tests/test_http.py -v
+"""
+
+import pytest
+import random
+import time
+from email.utils import formatdate
+
+import requests
+
+from utils.http import backoff_delay, retry_after_seconds, record_rate_limit, _host_not_before
+
+
+class TestBackoffDelay:
+    """Test suite for full-jitter backoff."""
+
+    def test_within_exponential_bound(self):
+        """Delays stay within [0, base * 2**attempt]."""
+        rng = random.Random(42)
+        for attempt in range(1, 6):
+            for _ in range(100):
+                delay = backoff_delay(attempt, 0.5, rng=rng)
+                assert 0 <= delay <= 0.5 * (2 ** attempt)
+
+    def test_cap(self):
+        """Large attempts are capped."""
+        rng = random.Random(42)
+        assert all(backoff_delay(20, 1.0, cap=5.0, rng=rng) <= 5.0 for _ in range(100))
+
+    def test_jitter_spreads_retries(self):
+        """Concurrent workers do not all wake at the same instant."""
+        rng = random.Random(7)
+        delays = {round(backoff_delay(3, 1.0, rng=rng), 3) for _ in range(50)}
+        assert len(delays) > 40
+
+    def test_seeded_is_reproducible(self):
+        """The same seed yields the same schedule."""
+        first = [backoff_delay(a, 1.0, rng=random.Random(1)) for a in range(1, 4)]
+        second = [backoff_delay(a, 1.0, rng=random.Random(1)) for a in range(1, 4)]
+        assert first == second
+
+
+
+def _response(status_code: int, headers: dict) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers)
+    return response
+
+
+class TestRateLimitHeaders:
+    """Test suite for Retry-After and X-RateLimit handling."""
+
+    def test_retry_after_seconds(self):
+        """Delta-seconds form is parsed directly."""
+        assert retry_after_seconds(_response(429, {"Retry-After": "3"})) == 3.0
+
+    def test_retry_after_http_date(self):
+        """HTTP-date form is converted to a delay from now."""
+        header = formatdate(time.time() + 10, usegmt=True)
+        assert 5 < retry_after_seconds(_response(429, {"Retry-After": header})) <= 10
+
+    def test_retry_after_missing_or_invalid(self):
+        """Absent or garbage headers yield None."""
+        assert retry_after_seconds(_response(429, {})) is None
+        assert retry_after_seconds(_response(429, {"Retry-After": "soon"})) is None
+
+    def test_retry_after_is_capped(self):
+        """Huge hints are capped."""
+        assert retry_after_seconds(_response(429, {"Retry-After": "86400"})) == 60.0
+
+    def test_exhausted_quota_holds_host(self):
+        """X-RateLimit-Remaining of zero delays the next request to that host."""
+        url = "https://ratelimit.example/api"
+        record_rate_limit(url, _response(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "5"}))
+        assert _host_not_before["ratelimit.example"] > time.time() + 4
+        _host_not_before.pop("ratelimit.example")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
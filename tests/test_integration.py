@@ -4,13 +4,7 @@ Run with: pytest tests/test_integration.py -v
 """
 
 import pytest
-import sys
-import os
 
-# Add parent directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-from adapters import ethereum, hedera
 from features.tech import build_tech_features
 from engine.tech_baseline import tech_baseline
 
@@ -18,11 +12,10 @@ from engine.tech_baseline import tech_baseline
 class TestIntegrationPipeline:
     """Test the complete analysis pipeline."""
     
-    def test_ethereum_full_pipeline(self):
+    def test_ethereum_full_pipeline(self, weth_facts):
         """Test complete Ethereum analysis pipeline."""
-        # Fetch facts
-        address = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"  # WETH
-        facts = ethereum.get_tech_facts(address, "mainnet")
+        # Fetch facts (WETH)
+        facts = weth_facts
         
         # Build features
         features = build_tech_features(facts, "ethereum", "mainnet")
@@ -37,11 +30,10 @@ class TestIntegrationPipeline:
         assert len(reasons) > 0, "Should have at least one reason"
         assert len(reasons) <= 3, "Should have at most 3 reasons"
         
-    def test_hedera_full_pipeline(self):
+    def test_hedera_full_pipeline(self, hedera_token_facts):
         """Test complete Hedera analysis pipeline."""
         # Fetch facts
-        token_id = "0.0.107594"
-        facts = hedera.get_tech_facts(token_id, "mainnet")
+        facts = hedera_token_facts
         
         # Build features
         features = build_tech_features(facts, "hedera", "mainnet")
@@ -55,18 +47,16 @@ class TestIntegrationPipeline:
         assert isinstance(reasons, list)
         assert len(reasons) > 0, "Should have at least one reason"
         
-    def test_feature_schema_compliance(self):
+    def test_feature_schema_compliance(self, weth_facts, hedera_token_facts):
         """Test that features comply with frozen schema."""
         from features.tech import TECH_FEATURE_SCHEMA, validate_tech_features
         
         # Test Ethereum
-        eth_facts = ethereum.get_tech_facts("0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2", "mainnet")
-        eth_features = build_tech_features(eth_facts, "ethereum", "mainnet")
+        eth_features = build_tech_features(weth_facts, "ethereum", "mainnet")
         assert validate_tech_features(eth_features), "Ethereum features should be valid"
         
         # Test Hedera
-        hed_facts = hedera.get_tech_facts("0.0.107594", "mainnet")
-        hed_features = build_tech_features(hed_facts, "hedera", "mainnet")
+        hed_features = build_tech_features(hedera_token_facts, "hedera", "mainnet")
         assert validate_tech_features(hed_features), "Hedera features should be valid"
 
 
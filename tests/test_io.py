@@ -0,0 +1,110 @@
+"""
+Automated tests for receipt IO utilities.
+Run with: pytest tests/test_io.py -v
+"""
+
+import pytest
+import os
+import time
+from datetime import date, datetime
+
+from utils.io import (
+    save_receipt, load_receipt, list_recent_receipts, cleanup_old_receipts,
+    append_receipt, read_recent_receipts, get_receipt_summary,
+    archive_receipts, read_archived_receipts
+)
+
+
+class TestReceipts:
+    """Test suite for saving, listing and cleaning up receipts."""
+
+    def test_round_trip_and_listing(self, tmp_path, monkeypatch):
+        """Saved receipts load back and list newest first."""
+        monkeypatch.chdir(tmp_path)
+        os.makedirs("runs")
+        for name in ("0_0_1-100.json", "0_0_2-300.json", "0_0_3-200.json", "notes.txt"):
+            (tmp_path / "runs" / name).write_bytes(b"{}")
+
+        path = save_receipt("0.0.12345", {"scores": {"tech": 69}})
+        assert load_receipt(path)["scores"] == {"tech": 69}
+        assert not any(name.endswith(".tmp") for name in os.listdir("runs"))
+
+        recent = list_recent_receipts(limit=3)
+        assert recent[0][2] == "0.0.12345"
+        assert [entity_id for _, _, entity_id in recent[1:]] == ["0.0.2", "0.0.3"]
+
+    def test_summary_datetime(self):
+        """The display datetime is derived from ts, or kept from older receipts."""
+        receipt = {"inputs": {"id": "0.0.1"}, "ts": 1739912345}
+        assert get_receipt_summary(receipt)["datetime"] == datetime.fromtimestamp(1739912345).isoformat()
+
+        receipt["inputs"]["datetime"] = "2025-02-18T21:19:05"
+        assert get_receipt_summary(receipt)["datetime"] == "2025-02-18T21:19:05"
+        assert get_receipt_summary({})["datetime"] == "Unknown"
+
+    def test_unparseable_names_use_mtime(self, tmp_path, monkeypatch):
+        """Receipts without a timestamp in the name are listed by modification time."""
+        monkeypatch.chdir(tmp_path)
+        os.makedirs("runs")
+        path = tmp_path / "runs" / "manual_export.json"
+        path.write_bytes(b"{}")
+        os.utime(path, (500, 500))
+
+        assert list_recent_receipts() == [("manual_export.json", 500, "manual.export")]
+
+    def test_cleanup_old_receipts(self, tmp_path, monkeypatch):
+        """Only receipts older than the cutoff are removed."""
+        monkeypatch.chdir(tmp_path)
+        os.makedirs("runs")
+        old = tmp_path / "runs" / "old-1.json"
+        old.write_bytes(b"{}")
+        os.utime(old, (0, 0))
+        (tmp_path / "runs" / "new-2.json").write_bytes(b"{}")
+
+        assert cleanup_old_receipts(days_to_keep=1) == 1
+        assert os.listdir("runs") == ["new-2.json"]
+
+
+    def test_receipt_log_tail(self, tmp_path, monkeypatch):
+        """Appended receipts read back newest first, skipping a torn last line."""
+        monkeypatch.chdir(tmp_path)
+        assert read_recent_receipts() == []
+
+        for i in range(5):
+            append_receipt(f"0.0.{i}", {"scores": {"tech": i}})
+        with open(os.path.join("runs", "receipts.ndjson"), "ab") as f:
+            f.write(b'{"inputs": {"id": "0.0.9"')
+
+        recent = read_recent_receipts(limit=3)
+        assert [r["inputs"]["id"] for r in recent] == ["0.0.4", "0.0.3", "0.0.2"]
+        assert len(read_recent_receipts(limit=10)) == 5
+        assert list_recent_receipts() == []
+
+    def test_archive_receipts(self, tmp_path, monkeypatch):
+        """Receipts from earlier days move into per-day shards; today's stay put."""
+        monkeypatch.chdir(tmp_path)
+        os.makedirs("runs")
+        yesterday = int(time.time()) - 86400
+        day = date.fromtimestamp(yesterday).isoformat()
+        for i in range(2):
+            (tmp_path / "runs" / f"0_0_{i}-{yesterday + i}.json").write_bytes(
+                b'{"inputs": {"id": "0.0.%d"}, "ts": %d}' % (i, yesterday + i))
+        today_path = save_receipt("0.0.9", {})
+        # Not named <entity>-<ts>.json: listed by mtime, but never archived
+        manual = tmp_path / "runs" / "manual_export.json"
+        manual.write_bytes(b'{"inputs": {"id": "manual"}}')
+        os.utime(manual, (yesterday - 86400, yesterday - 86400))
+
+        assert archive_receipts() == 2
+        assert sorted(os.listdir("runs")) == sorted(
+            ["archive", "manual_export.json", os.path.basename(today_path)])
+        assert [r["inputs"]["id"] for r in read_archived_receipts(day)] == ["0.0.0", "0.0.1"]
+
+        recent = list_recent_receipts(limit=3, include_archive=True)
+        assert [entity_id for _, _, entity_id in recent] == ["0.0.9", "0.0.1", "0.0.0"]
+        assert recent[1][0] == f"archive/{day}.ndjson.gz"
+        assert archive_receipts() == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,108 @@
+"""
+Automated tests for the multi-dimensional risk aggregator.
+Run with: pytest tests/test_risk_aggregator.py -v
+"""
+
+import pytest
+
+from engine.risk_aggregator import RiskAggregator
+
+
+class TestRiskAggregator:
+    """Test suite for RiskAggregator scoring tiers."""
+
+    @pytest.mark.parametrize("tvl,expected_score", [
+        (10_000_000, 40),       # Not above $10M
+        (10_000_001, 55),
+        (100_000_000, 55),      # Not above $100M
+        (1_000_000_000, 65),    # Not above $1B
+        (5_000_000_000, 75),
+    ])
+    def test_tvl_tier_boundaries(self, tvl, expected_score):
+        """TVL bounds are exclusive, as in the original if/elif ladder."""
+        # 7% move and 5% turnover leave the other financial rules neutral
+        market_data = {'price_change_24h': 7, 'volume_24h': 5, 'market_cap': 100}
+        score, reasons = RiskAggregator().calculate_financial_score({'tvl': tvl}, market_data)
+
+        assert score == expected_score
+        assert "TVL" in reasons[0]
+
+    @pytest.mark.parametrize("rank,num_chains,expected_score,expected_reasons", [
+        (50, 0, 80, ["Top 50 by market cap (#50)"]),
+        (51, 3, 75, ["Top 100 by market cap (#51)", "Multi-chain: 3 chains"]),
+        (200, 5, 65, ["Top 200 by market cap (#200)", "Multi-chain: 5 chains"]),
+        (201, 6, 55, ["Lower market cap rank (#201)", "Multi-chain: 6 chains"]),
+    ])
+    def test_market_tiers(self, rank, num_chains, expected_score, expected_reasons):
+        """Rank bounds are inclusive and chain bounds exclusive."""
+        tvl_data = {'chains': {f"chain{i}": 1 for i in range(num_chains)}}
+        score, reasons = RiskAggregator().calculate_market_score({'market_cap_rank': rank}, tvl_data)
+
+        assert score == expected_score
+        assert reasons == expected_reasons
+
+    def test_overall_score_is_weighted_sum(self):
+        """Overall score applies WEIGHTS and picks the traffic light."""
+        overall, indicator = RiskAggregator().calculate_overall_score(100, 50, 50, 0)
+
+        assert overall == 65
+        assert indicator == "🟡 Medium Risk"
+
+    @pytest.mark.parametrize("score,expected", [
+        (39, "🔴 High Risk"),
+        (40, "🟡 Medium Risk"),
+        (69, "🟡 Medium Risk"),
+        (70, "🟢 Low Risk"),
+    ])
+    def test_indicator_boundaries(self, score, expected):
+        """Traffic light bands start at 40 and 70 inclusive."""
+        assert RiskAggregator().calculate_overall_score(score, score, score, score)[1] == expected
+
+
+    def test_high_quality_protocol(self):
+        """A large, liquid, top-50 lending protocol scores low risk."""
+        tech_features = {
+            'verified': True,
+            'has_admin_key': True,
+            'has_supply_key': False,
+            'has_pause_key': True,
+            'upgradeable': True
+        }
+        tvl_data = {'tvl': 5_000_000_000, 'chains': {'ethereum': 3_000_000_000, 'polygon': 1_000_000_000}}
+        market_data = {
+            'market_cap': 1_400_000_000,
+            'volume_24h': 150_000_000,
+            'price_change_24h': 3.2,
+            'market_cap_rank': 45
+        }
+        protocol_data = {'name': 'Aave V3', 'category': 'Lending'}
+
+        result = RiskAggregator().aggregate_risk(tech_features, tvl_data, market_data, protocol_data)
+
+        assert result['overall_score'] == 74
+        assert result['risk_indicator'] == "🟢 Low Risk"
+        assert result['category_scores'] == {'security': 61, 'financial': 95, 'operational': 70, 'market': 80}
+        assert result['reasons']['financial'] == ["High TVL: $5.0B", "Low volatility: 3.2% (24h)", "High liquidity"]
+
+    def test_low_quality_protocol(self):
+        """A small, volatile, unverified protocol scores high risk."""
+        tech_features = {'verified': False, 'has_admin_key': True}
+        tvl_data = {'tvl': 5_000_000, 'chains': {'ethereum': 5_000_000}}
+        market_data = {
+            'market_cap': 10_000_000,
+            'volume_24h': 50_000,
+            'price_change_24h': 25.5,
+            'market_cap_rank': 500
+        }
+        protocol_data = {'name': 'Unknown Protocol', 'category': 'Other'}
+
+        result = RiskAggregator().aggregate_risk(tech_features, tvl_data, market_data, protocol_data)
+
+        assert result['overall_score'] == 38
+        assert result['risk_indicator'] == "🔴 High Risk"
+        assert result['category_scores'] == {'security': 40, 'financial': 20, 'operational': 60, 'market': 40}
+        assert result['reasons']['security'] == ["Contract unverified"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,62 @@
+"""
+Automated tests for the technical baseline scorer.
+Run with: pytest tests/test_tech_baseline.py -v
+"""
+
+import pytest
+import itertools
+
+from features.tech import (
+    FLAG_FIELDS, FLAG_VERIFIED, FLAG_ADMIN, FLAG_UPGRADEABLE,
+    build_tech_features, build_tech_flags, build_tech_flags_batch
+)
+from engine.tech_baseline import tech_baseline, batch_score_features
+
+
+class TestTechBaselineFlags:
+    """Test suite for scoring features packed into FLAG_* bits."""
+
+    def test_flags_match_dict_scoring(self):
+        """Every flag combination scores exactly as its feature dictionary."""
+        for values in itertools.product((False, True), repeat=len(FLAG_FIELDS)):
+            features = {key: value for (_, key), value in zip(FLAG_FIELDS, values)}
+            assert tech_baseline(build_tech_flags(features)) == tech_baseline(features)
+
+    def test_upgradeable_admin(self):
+        """Upgradeable with an admin key loses 8 points for each."""
+        score, reasons = tech_baseline(FLAG_VERIFIED | FLAG_ADMIN | FLAG_UPGRADEABLE)
+
+        assert score == 69
+        assert reasons == ["Admin key present", "Upgradeable + admin control"]
+
+
+    def test_score_only_matches(self):
+        """return_reasons=False gives the same scores for dicts and packed flags."""
+        feature_list = []
+        for values in itertools.product((False, True), repeat=len(FLAG_FIELDS)):
+            features = {key: value for (_, key), value in zip(FLAG_FIELDS, values)}
+            feature_list += [features, build_tech_flags(features)]
+
+        scores = batch_score_features(feature_list, return_reasons=False)
+        assert scores == [score for score, _ in batch_score_features(feature_list)]
+        assert tech_baseline(feature_list[-2], return_reasons=False) == scores[-2]
+
+
+    def test_flags_batch_from_facts(self):
+        """Packing adapter output directly matches packing its built features."""
+        facts_list = [
+            {"verified": True, "admin_keys_present": True,
+             "governance_flags": {"supply": True, "pause": False, "upgradeable": True}},
+            {"verified": False, "governance_flags": {"kyc": True}},
+            {"verified": True, "governance_flags": None},
+        ]
+
+        masks = build_tech_flags_batch(facts_list)
+        assert list(masks) == [
+            build_tech_flags(build_tech_features(facts, "hedera", "testnet")) for facts in facts_list
+        ]
+        assert batch_score_features(masks, return_reasons=False) == [61, 40, 85]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -3,11 +3,30 @@ Utils package for Hedera Technical Risk Scoring System.
 Contains utilities for I/O operations and other common tasks.
 """
 
-from .io import save_receipt, load_receipt, list_recent_receipts, get_receipt_summary
+from .io import (
+    save_receipt, append_receipt, load_receipt, list_recent_receipts, read_recent_receipts,
+    archive_receipts, read_archived_receipts, get_receipt_summary
+)
+from .http import create_session, get_session, parse_json, host_semaphore, backoff_delay, record_rate_limit, wait_for_rate_limit
+from .cache import DiskCache, PersistentTTLCache, get_disk_cache
 
 __all__ = [
     "save_receipt",
+    "append_receipt",
     "load_receipt",
     "list_recent_receipts", 
-    "get_receipt_summary"
+    "read_recent_receipts",
+    "archive_receipts",
+    "read_archived_receipts",
+    "get_receipt_summary",
+    "create_session",
+    "get_session",
+    "parse_json",
+    "host_semaphore",
+    "backoff_delay",
+    "record_rate_limit",
+    "wait_for_rate_limit",
+    "DiskCache",
+    "PersistentTTLCache",
+    "get_disk_cache"
 ]
\ No newline at end of file
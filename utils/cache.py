@@ -0,0 +1,207 @@
+"""
+Cache utilities for Multi-Chain Technical Risk Scoring System.
+SQLite-backed persistence so cached lookups survive process restarts.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+import logging
+from typing import Any, Optional, Tuple
+
+import orjson
+from cachetools import TTLCache
+
+from config import DISK_CACHE_PATH
+
+
+_MISSING = object()
+
+
+class DiskCache:
+    """
+    Small SQLite key/value store with per-entry expiry.
+
+    Values are serialized with orjson, so anything stored must be JSON-compatible.
+    Entries are partitioned by namespace so several caches can share one file.
+    """
+
+    def __init__(self, path: str = DISK_CACHE_PATH):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite file path
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, data BLOB NOT NULL, "
+                "expires REAL NOT NULL, PRIMARY KEY (namespace, key))"
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def _encode_key(key: Any) -> str:
+        return key if isinstance(key, str) else orjson.dumps(key, default=list).decode()
+
+    def get(self, namespace: str, key: Any, default: Any = None) -> Any:
+        """Return the stored value for key, or default if missing or expired."""
+        value, _ = self.get_with_expiry(namespace, key, default)
+        return value
+
+    def get_with_expiry(self, namespace: str, key: Any, default: Any = None) -> Tuple[Any, float]:
+        """Return (value, expiry timestamp) for key, or (default, 0.0) if missing or expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data, expires FROM cache WHERE namespace = ? AND key = ?",
+                (namespace, self._encode_key(key)),
+            ).fetchone()
+        if row is None or row[1] <= time.time():
+            return default, 0.0
+        return orjson.loads(row[0]), row[1]
+
+    def set(self, namespace: str, key: Any, value: Any, ttl: float):
+        """Store value for key, expiring after ttl seconds."""
+        try:
+            data = orjson.dumps(value)
+        except TypeError as e:
+            logging.warning("Skipping disk cache write for %s: %s", key, e)
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (namespace, key, data, expires) VALUES (?, ?, ?, ?)",
+                (namespace, self._encode_key(key), data, time.time() + ttl),
+            )
+            self._conn.commit()
+
+    def touch(self, namespace: str, key: Any, ttl: float) -> bool:
+        """Extend an entry's expiry without rewriting its data; returns False if absent."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE cache SET expires = ? WHERE namespace = ? AND key = ?",
+                (time.time() + ttl, namespace, self._encode_key(key)),
+            )
+            self._conn.commit()
+        return cursor.rowcount > 0
+
+    def delete(self, namespace: str, key: Any):
+        """Remove a single entry."""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM cache WHERE namespace = ? AND key = ?",
+                (namespace, self._encode_key(key)),
+            )
+            self._conn.commit()
+
+    def clear(self, namespace: Optional[str] = None):
+        """Remove all entries, or only those in one namespace."""
+        with self._lock:
+            if namespace is None:
+                self._conn.execute("DELETE FROM cache")
+            else:
+                self._conn.execute("DELETE FROM cache WHERE namespace = ?", (namespace,))
+            self._conn.commit()
+
+    def purge_expired(self) -> int:
+        """Delete expired entries and return how many were removed."""
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM cache WHERE expires <= ?", (time.time(),))
+            self._conn.commit()
+        return cursor.rowcount
+
+    def count(self, namespace: Optional[str] = None) -> int:
+        """Number of unexpired entries, optionally within one namespace."""
+        query = "SELECT COUNT(*) FROM cache WHERE expires > ?"
+        args = [time.time()]
+        if namespace is not None:
+            query += " AND namespace = ?"
+            args.append(namespace)
+        with self._lock:
+            return self._conn.execute(query, args).fetchone()[0]
+
+
+_disk_cache: Optional[DiskCache] = None
+_disk_cache_lock = threading.Lock()
+
+
+def get_disk_cache() -> Optional[DiskCache]:
+    """
+    Get the process-wide disk cache.
+
+    Returns:
+        Shared DiskCache, or None if DISK_CACHE_PATH is empty or unusable
+    """
+    global _disk_cache
+    if _disk_cache is None and DISK_CACHE_PATH:
+        with _disk_cache_lock:
+            if _disk_cache is None:
+                try:
+                    _disk_cache = DiskCache(DISK_CACHE_PATH)
+                except (OSError, sqlite3.Error) as e:
+                    logging.warning("Disk cache unavailable at %s: %s", DISK_CACHE_PATH, e)
+    return _disk_cache
+
+
+class PersistentTTLCache(TTLCache):
+    """
+    TTLCache that writes through to the disk cache and falls back to it on a miss.
+
+    Drop-in for cachetools.cached(); the in-memory TTLCache acts as L1 in front
+    of SQLite, so warm processes never touch disk and cold starts skip the network.
+    """
+
+    def __init__(self, namespace: str, maxsize: int, ttl: float):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self.namespace = namespace
+
+    def _load(self, key):
+        """Promote key from disk into memory; returns _MISSING if it is not on disk."""
+        disk = get_disk_cache()
+        value = disk.get(self.namespace, key, _MISSING) if disk else _MISSING
+        if value is not _MISSING:
+            TTLCache.__setitem__(self, key, value)
+        return value
+
+    def __missing__(self, key):
+        value = self._load(key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        # Entries only on disk (e.g. after a restart) count as present
+        return super().__contains__(key) or self._load(key) is not _MISSING
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        disk = get_disk_cache()
+        if disk:
+            disk.set(self.namespace, key, value, self.ttl)
+
+    def discard(self, key):
+        """Remove key from memory and disk, if present."""
+        self.pop(key, None)
+        disk = get_disk_cache()
+        if disk:
+            disk.delete(self.namespace, key)
+    
+    def clear(self):
+        super().clear()
+        disk = get_disk_cache()
+        if disk:
+            disk.clear(self.namespace)
@@ -0,0 +1,220 @@
+"""
+HTTP utilities for Multi-Chain Technical Risk Scoring System.
+Shared helpers for outbound requests made by the chain adapters and API clients.
+"""
+
+import random
+import threading
+import time
+import logging
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from config import MAX_CONCURRENT_PER_HOST
+
+
+_host_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+_host_semaphores_lock = threading.Lock()
+
+# Earliest time (epoch seconds) each host said it will accept another request
+_host_not_before: Dict[str, float] = {}
+
+# Never let a server-provided hint stall a worker for longer than this
+MAX_RATE_LIMIT_WAIT = 60.0
+
+# Number of distinct hosts to keep connection pools for
+_POOL_HOSTS = 32
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def create_session(pool_connections: int = _POOL_HOSTS) -> requests.Session:
+    """
+    Build a requests.Session with a keep-alive connection pool.
+    
+    Each host pool holds MAX_CONCURRENT_PER_HOST connections, matching the
+    per-host semaphore. Retries are left to the callers' own retry loops.
+    
+    Args:
+        pool_connections: Number of distinct hosts to keep pools for
+        
+    Returns:
+        New requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=MAX_CONCURRENT_PER_HOST,
+        max_retries=0,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Get the process-wide HTTP session.
+    
+    Reusing one session keeps TCP/TLS connections alive across calls, so
+    repeated requests to Etherscan, Sourcify and the Mirror Node skip the
+    handshake.
+    
+    Returns:
+        Shared requests.Session
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = create_session()
+    return _session
+
+
+def host_semaphore(url: str) -> threading.BoundedSemaphore:
+    """
+    Get the concurrency limiter for the host of a URL.
+    
+    Every outbound request should hold this semaphore while on the wire so
+    concurrent scans stay under provider rate limits instead of tripping
+    403/429 responses and retry storms.
+    
+    Args:
+        url: Request URL
+        
+    Returns:
+        Bounded semaphore shared by all requests to the same host
+    """
+    host = urlparse(url).netloc
+    semaphore = _host_semaphores.get(host)
+    if semaphore is None:
+        with _host_semaphores_lock:
+            semaphore = _host_semaphores.setdefault(
+                host, threading.BoundedSemaphore(MAX_CONCURRENT_PER_HOST)
+            )
+    return semaphore
+
+
+def parse_json(response: requests.Response):
+    """
+    Decode a response body with orjson.
+    
+    Faster than response.json() on large payloads such as Etherscan ABIs.
+    Decode failures are raised as requests' JSONDecodeError so existing
+    ``except requests.RequestException`` handlers still apply.
+    
+    Args:
+        response: HTTP response
+        
+    Returns:
+        Decoded JSON value
+    """
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
+
+
+def backoff_delay(attempt: int, base: float, cap: float = 30.0,
+                  rng: Optional[random.Random] = None) -> float:
+    """
+    Compute a "full jitter" exponential backoff delay.
+    
+    Sleeping a random amount in [0, base * 2**attempt] instead of a fixed
+    schedule keeps workers that were rate limited together from retrying
+    in lockstep.
+    
+    Args:
+        attempt: Retry attempt number (1 for the first retry)
+        base: Base delay in seconds
+        cap: Upper bound on the delay in seconds (default: 30)
+        rng: Random generator to draw from (default: module-level random)
+        
+    Returns:
+        Delay in seconds
+    """
+    rng = rng or random
+    return rng.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def retry_after_seconds(response: requests.Response) -> Optional[float]:
+    """
+    Parse a Retry-After header given as delta-seconds or an HTTP date.
+    
+    Args:
+        response: HTTP response
+        
+    Returns:
+        Seconds to wait (capped at MAX_RATE_LIMIT_WAIT), or None if absent/unparseable
+    """
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), MAX_RATE_LIMIT_WAIT)
+
+
+def _rate_limit_reset_seconds(response: requests.Response) -> Optional[float]:
+    """Seconds until the quota resets, if the server says it is exhausted."""
+    remaining = response.headers.get("X-RateLimit-Remaining")
+    reset = response.headers.get("X-RateLimit-Reset")
+    if remaining is None or reset is None:
+        return None
+    try:
+        if int(float(remaining)) > 0:
+            return None
+        reset = float(reset)
+    except ValueError:
+        return None
+    # Providers send either an epoch timestamp or a delta in seconds
+    seconds = reset - time.time() if reset > 1e9 else reset
+    return min(max(seconds, 0.0), MAX_RATE_LIMIT_WAIT)
+
+
+def record_rate_limit(url: str, response: requests.Response):
+    """
+    Remember rate-limit hints from a response so later requests to the host wait.
+    
+    Honors Retry-After on 429/403/503 and proactively backs off when
+    X-RateLimit-Remaining reaches zero, before the server starts refusing.
+    
+    Args:
+        url: Request URL
+        response: HTTP response
+    """
+    wait = None
+    if response.status_code in (403, 429, 503):
+        wait = retry_after_seconds(response)
+    if wait is None:
+        wait = _rate_limit_reset_seconds(response)
+    if not wait:
+        return
+    host = urlparse(url).netloc
+    not_before = time.time() + wait
+    with _host_semaphores_lock:
+        if not_before > _host_not_before.get(host, 0.0):
+            _host_not_before[host] = not_before
+    logging.info("Rate limited by %s; holding requests for %.1fs", host, wait)
+
+
+def wait_for_rate_limit(url: str):
+    """
+    Sleep until the host of a URL is expected to accept requests again.
+    
+    Args:
+        url: Request URL
+    """
+    delay = _host_not_before.get(urlparse(url).netloc, 0.0) - time.time()
+    if delay > 0:
+        time.sleep(delay)
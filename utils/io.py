@@ -3,14 +3,60 @@ IO utilities for Hedera Technical Risk Scoring System.
 Handles saving and loading JSON receipts of analysis runs.
 """
 
+import gzip
+import heapq
+import mmap
 import os
-import json
+import threading
 import time
-from typing import Dict, Any, Optional
-from datetime import datetime
+from operator import itemgetter
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import date, datetime
+
+import orjson
+
 from config import PROTOTYPE_VERSION
 
 
+RUNS_DIR = "runs"
+
+# Append-only log of receipts, one JSON document per line
+RECEIPT_LOG = os.path.join(RUNS_DIR, "receipts.ndjson")
+
+# Per-day gzip NDJSON shards of archived receipt files
+ARCHIVE_DIR = os.path.join(RUNS_DIR, "archive")
+
+# Serializes appends from threads of this process
+_log_lock = threading.Lock()
+
+# Characters in entity IDs that are unsafe or ambiguous in receipt filenames
+_CLEAN_TABLE = str.maketrans({".": "_", "/": "_", ":": "_"})
+
+
+def _build_receipt(entity_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Assemble the receipt structure documented in save_receipt."""
+    timestamp = int(time.time())
+    return {
+        "inputs": {
+            "id": entity_id,
+            "timestamp": timestamp
+        },
+        "facts": payload.get("facts", {}),
+        "features": payload.get("features", {}),
+        "scores": payload.get("scores", {}),
+        "links": payload.get("links", {}),
+        "ts": timestamp,
+        "versions": {
+            "proto": PROTOTYPE_VERSION
+        },
+        "metadata": {
+            "analysis_duration_ms": payload.get("duration_ms", 0),
+            "success": payload.get("success", True),
+            "errors": payload.get("errors", [])
+        }
+    }
+
+
 def save_receipt(entity_id: str, payload: Dict[str, Any]) -> str:
     """
     Save a complete analysis receipt as JSON file.
@@ -34,45 +80,101 @@ def save_receipt(entity_id: str, payload: Dict[str, Any]) -> str:
     }
     """
     # Ensure runs directory exists
-    os.makedirs("runs", exist_ok=True)
+    os.makedirs(RUNS_DIR, exist_ok=True)
     
-    # Generate timestamp
-    timestamp = int(time.time())
+    receipt = _build_receipt(entity_id, payload)
+    timestamp = receipt["ts"]
     
-    # Clean entity ID for filename (replace dots and slashes)
-    clean_id = entity_id.replace(".", "_").replace("/", "_").replace(":", "_")
+    # Clean entity ID for filename (replace dots, slashes and colons in one pass)
+    clean_id = entity_id.translate(_CLEAN_TABLE)
     filename = f"{clean_id}-{timestamp}.json"
-    filepath = os.path.join("runs", filename)
-    
-    # Build complete receipt structure
-    receipt = {
-        "inputs": {
-            "id": entity_id,
-            "timestamp": timestamp,
-            "datetime": datetime.fromtimestamp(timestamp).isoformat()
-        },
-        "facts": payload.get("facts", {}),
-        "features": payload.get("features", {}),
-        "scores": payload.get("scores", {}),
-        "links": payload.get("links", {}),
-        "ts": timestamp,
-        "versions": {
-            "proto": PROTOTYPE_VERSION
-        },
-        "metadata": {
-            "analysis_duration_ms": payload.get("duration_ms", 0),
-            "success": payload.get("success", True),
-            "errors": payload.get("errors", [])
-        }
-    }
+    filepath = os.path.join(RUNS_DIR, filename)
     
-    # Save to file
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(receipt, f, indent=2, ensure_ascii=False)
+    # Write a sibling temp file and rename it into place, so a crash mid-write
+    # never leaves a truncated receipt (orjson emits UTF-8, keeping non-ASCII as-is)
+    data = orjson.dumps(receipt, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    tmp_path = f"{filepath}.{os.getpid()}-{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
     
     return filepath
 
 
+def append_receipt(entity_id: str, payload: Dict[str, Any], durable: bool = False) -> Dict[str, Any]:
+    """
+    Append an analysis receipt to the NDJSON receipt log.
+    
+    Cheaper than save_receipt for high-volume runs: one append to a single
+    file instead of a new file per analysis. Use save_receipt when a
+    standalone receipt file is needed (e.g. for download).
+    
+    Args:
+        entity_id: Token ID or contract address (e.g., "0.0.12345")
+        payload: Complete analysis data including scores, features, etc.
+        durable: If True, fsync the log before returning
+        
+    Returns:
+        The receipt that was written (same structure as save_receipt)
+    """
+    os.makedirs(RUNS_DIR, exist_ok=True)
+    receipt = _build_receipt(entity_id, payload)
+    line = orjson.dumps(receipt, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+    
+    with _log_lock, open(RECEIPT_LOG, 'ab') as f:
+        f.write(line)
+        if durable:
+            f.flush()
+            os.fsync(f.fileno())
+    
+    return receipt
+
+
+def read_recent_receipts(limit: int = 10) -> List[Dict[str, Any]]:
+    """
+    Read the newest receipts from the NDJSON receipt log.
+    
+    Scans backwards from the end of the log, so only the returned lines are
+    decoded however long the log grows. Truncated or corrupt lines are skipped.
+    
+    Args:
+        limit: Maximum number of receipts to return
+        
+    Returns:
+        List of receipt dictionaries, newest first
+    """
+    try:
+        f = open(RECEIPT_LOG, 'rb')
+    except FileNotFoundError:
+        return []
+    
+    receipts = []
+    with f:
+        size = os.fstat(f.fileno()).st_size
+        if not size or limit <= 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as log:
+            end = size
+            while end > 0 and len(receipts) < limit:
+                start = log.rfind(b"\n", 0, end - 1) + 1
+                line = log[start:end].strip()
+                if line:
+                    try:
+                        receipts.append(orjson.loads(line))
+                    except orjson.JSONDecodeError:
+                        pass
+                end = start
+    
+    return receipts
+
+
 def load_receipt(filepath: str) -> Optional[Dict[str, Any]]:
     """
     Load an analysis receipt from JSON file.
@@ -84,42 +186,164 @@ def load_receipt(filepath: str) -> Optional[Dict[str, Any]]:
         Dictionary with receipt data, or None if file doesn't exist/invalid
     """
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
+    except (FileNotFoundError, orjson.JSONDecodeError):
         return None
 
 
-def list_recent_receipts(limit: int = 10) -> list:
+def _parse_receipt_entry(entry: os.DirEntry, use_mtime: bool = True) -> Optional[Tuple[str, int, str]]:
+    """
+    (filename, timestamp, entity_id) for a receipt file, or None if it is not one.
+    
+    Names other than <entity>-<unix ts>.json are dated by mtime when use_mtime
+    is set, and otherwise rejected.
+    """
+    filename = entry.name
+    if not filename.endswith(".json"):
+        return None
+    # Extract timestamp from filename, falling back to the file's mtime
+    stem = filename[:-len(".json")]
+    entity_part, separator, timestamp_part = stem.rpartition("-")
+    try:
+        if separator:
+            return filename, int(timestamp_part), entity_part.replace("_", ".")
+    except ValueError:
+        pass
+    if not use_mtime:
+        return None
+    try:
+        return filename, int(entry.stat().st_mtime), stem.replace("_", ".")
+    except OSError:
+        return None
+
+
+def list_recent_receipts(limit: int = 10, include_archive: bool = False) -> list:
     """
     List recent analysis receipts.
     
     Args:
         limit: Maximum number of receipts to return
+        include_archive: If True and runs/ holds fewer than limit receipts,
+            top up from the newest archive shard (see archive_receipts)
         
     Returns:
-        List of (filename, timestamp, entity_id) tuples, sorted by timestamp desc
+        List of (filename, timestamp, entity_id) tuples, sorted by timestamp desc.
+        Archived receipts are named by their shard, e.g. "archive/2025-02-18.ndjson.gz"
     """
-    if not os.path.exists("runs"):
+    if not os.path.exists(RUNS_DIR):
         return []
     
     receipts = []
-    for filename in os.listdir("runs"):
-        if filename.endswith(".json"):
-            filepath = os.path.join("runs", filename)
+    with os.scandir(RUNS_DIR) as entries:
+        for entry in entries:
+            parsed = _parse_receipt_entry(entry)
+            if parsed is not None:
+                receipts.append(parsed)
+    
+    if include_archive and len(receipts) < limit:
+        shards = _archive_shards()
+        if shards:
+            shard = os.path.join("archive", shards[-1])
+            receipts.extend(
+                (shard, receipt.get("ts", 0), receipt.get("inputs", {}).get("id", "Unknown"))
+                for receipt in read_archived_receipts(shards[-1][:-len(".ndjson.gz")])
+            )
+    
+    # Newest first; a bounded heap avoids sorting the whole directory
+    return heapq.nlargest(limit, receipts, key=itemgetter(1))
+
+
+def _archive_shards() -> List[str]:
+    """Archive shard filenames, oldest day first."""
+    try:
+        return sorted(name for name in os.listdir(ARCHIVE_DIR) if name.endswith(".ndjson.gz"))
+    except FileNotFoundError:
+        return []
+
+
+def archive_receipts() -> int:
+    """
+    Move receipt files from before today into per-day compressed shards.
+    
+    Each day's receipts are appended, oldest first, to
+    runs/archive/YYYY-MM-DD.ndjson.gz as one JSON document per line, and the
+    originals are deleted. This keeps runs/ small for listing and cleanup, and
+    a day's history becomes one sequential read. Running it again appends a
+    new gzip member to an existing shard, which readers handle transparently.
+    Only files named <entity>-<unix ts>.json are archived; other JSON files in
+    runs/, and receipt files that fail to parse, are left in place.
+    
+    Returns:
+        Number of receipt files archived
+    """
+    if not os.path.exists(RUNS_DIR):
+        return 0
+    
+    today = date.today()
+    by_day = {}
+    with os.scandir(RUNS_DIR) as entries:
+        for entry in entries:
+            parsed = _parse_receipt_entry(entry, use_mtime=False)
+            if parsed is None:
+                continue
+            day = date.fromtimestamp(parsed[1])
+            if day < today:
+                by_day.setdefault(day.isoformat(), []).append((parsed[1], entry.path))
+    
+    archived = 0
+    for day, files in sorted(by_day.items()):
+        files.sort()
+        lines = []
+        paths = []
+        for _, path in files:
+            receipt = load_receipt(path)
+            if receipt is not None:
+                lines.append(orjson.dumps(receipt, option=orjson.OPT_NON_STR_KEYS) + b"\n")
+                paths.append(path)
+        if not lines:
+            continue
+        
+        os.makedirs(ARCHIVE_DIR, exist_ok=True)
+        with gzip.open(os.path.join(ARCHIVE_DIR, f"{day}.ndjson.gz"), 'ab') as f:
+            f.write(b"".join(lines))
+        for path in paths:
             try:
-                # Extract timestamp from filename
-                parts = filename.replace(".json", "").split("-")
-                if len(parts) >= 2:
-                    entity_id = "-".join(parts[:-1]).replace("_", ".")
-                    timestamp = int(parts[-1])
-                    receipts.append((filename, timestamp, entity_id))
-            except ValueError:
+                os.remove(path)
+                archived += 1
+            except OSError:
                 continue
     
-    # Sort by timestamp descending and limit
-    receipts.sort(key=lambda x: x[1], reverse=True)
-    return receipts[:limit]
+    return archived
+
+
+def read_archived_receipts(day: str) -> List[Dict[str, Any]]:
+    """
+    Read one day's archived receipts.
+    
+    Args:
+        day: Shard date, YYYY-MM-DD
+        
+    Returns:
+        List of receipt dictionaries, oldest first (empty if there is no shard).
+        Corrupt lines are skipped.
+    """
+    try:
+        f = gzip.open(os.path.join(ARCHIVE_DIR, f"{day}.ndjson.gz"), 'rb')
+    except FileNotFoundError:
+        return []
+    
+    receipts = []
+    with f:
+        try:
+            for line in f:
+                try:
+                    receipts.append(orjson.loads(line))
+                except orjson.JSONDecodeError:
+                    continue
+        except (EOFError, gzip.BadGzipFile):
+            pass  # shard cut short by an interrupted archive pass
+    return receipts
 
 
 def get_receipt_summary(receipt: Dict[str, Any]) -> Dict[str, Any]:
@@ -132,17 +356,25 @@ def get_receipt_summary(receipt: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Summary dictionary with key information
     """
+    # Each section is looked up once; missing sections read as empty
+    inputs = receipt.get("inputs", {})
+    scores = receipt.get("scores", {})
+    timestamp = receipt.get("ts", 0)
+    # Receipts no longer store the ISO datetime; older ones still carry it
+    datetime_str = inputs.get("datetime")
+    if datetime_str is None:
+        datetime_str = datetime.fromtimestamp(timestamp).isoformat() if timestamp else "Unknown"
     summary = {
-        "entity_id": receipt.get("inputs", {}).get("id", "Unknown"),
-        "timestamp": receipt.get("ts", 0),
-        "datetime": receipt.get("inputs", {}).get("datetime", "Unknown"),
+        "entity_id": inputs.get("id", "Unknown"),
+        "timestamp": timestamp,
+        "datetime": datetime_str,
         "success": receipt.get("metadata", {}).get("success", True),
-        "tech_score": receipt.get("scores", {}).get("tech", "N/A"),
+        "tech_score": scores.get("tech", "N/A"),
         "version": receipt.get("versions", {}).get("proto", "Unknown")
     }
     
     # Get primary risk reasons
-    tech_reasons = receipt.get("scores", {}).get("tech_reasons", [])
+    tech_reasons = scores.get("tech_reasons", [])
     if tech_reasons:
         summary["primary_risk"] = tech_reasons[0]
     else:
@@ -161,23 +393,22 @@ def cleanup_old_receipts(days_to_keep: int = 30) -> int:
     Returns:
         Number of files deleted
     """
-    if not os.path.exists("runs"):
+    if not os.path.exists(RUNS_DIR):
         return 0
     
     cutoff_time = time.time() - (days_to_keep * 24 * 60 * 60)
     deleted_count = 0
     
-    for filename in os.listdir("runs"):
-        if filename.endswith(".json"):
-            filepath = os.path.join("runs", filename)
-            try:
-                # Get file modification time
-                file_time = os.path.getmtime(filepath)
-                if file_time < cutoff_time:
-                    os.remove(filepath)
-                    deleted_count += 1
-            except OSError:
-                continue
+    with os.scandir(RUNS_DIR) as entries:
+        for entry in entries:
+            if entry.name.endswith(".json"):
+                try:
+                    # Get file modification time
+                    if entry.stat().st_mtime < cutoff_time:
+                        os.remove(entry.path)
+                        deleted_count += 1
+                except OSError:
+                    continue
     
     return deleted_count
 